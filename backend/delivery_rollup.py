@@ -0,0 +1,176 @@
+"""
+Delivery ETA Rollups for Interior Design Management
+Materialized per-room and per-project delivery summaries in delivery_rollups,
+kept current with small $inc/$set deltas on every item write and tracking update
+
+Each rollup document holds item_count, status_counts and open_etas (item id ->
+expected delivery for items not yet received). Latest ETA and late items are
+derived from that one document at read time, so lateness stays correct as the
+clock moves without rescanning items.
+"""
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+from database import get_database
+
+DONE_STATUSES = {'Received', 'Delivered', 'Installed'}
+
+_indexes_ready = False
+
+
+async def ensure_rollup_indexes() -> None:
+    """Create delivery_rollups indexes once per process"""
+    global _indexes_ready
+    if _indexes_ready:
+        return
+
+    db = get_database()
+    await db.delivery_rollups.create_index([('scope', 1), ('scope_id', 1)], unique=True)
+    await db.delivery_rollups.create_index('project_id')
+    _indexes_ready = True
+
+
+def _status_value(status: Any) -> str:
+    return getattr(status, 'value', status) or 'Unknown'
+
+
+def _is_open(item: Dict[str, Any]) -> bool:
+    if _status_value(item.get('status')) in DONE_STATUSES:
+        return False
+    return not str(item.get('tracking_status') or '').lower().startswith('delivered')
+
+
+def _scopes(item: Dict[str, Any]) -> List[Tuple[str, str]]:
+    scopes = [('project', item['project_id'])]
+    if item.get('room_id'):
+        scopes.append(('room', item['room_id']))
+    return scopes
+
+
+def _item_id(item: Dict[str, Any]) -> str:
+    return str(item.get('_id', item.get('id')))
+
+
+async def apply_item_change(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> None:
+    """
+    Move one item's contribution from its old state to its new state
+    Pass before=None for a new item and after=None for a deleted one
+    """
+    await ensure_rollup_indexes()
+    db = get_database()
+    updates: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def scope_update(scope, project_id):
+        return updates.setdefault(scope, {'project_id': project_id, 'inc': {}, 'set': {}, 'unset': {}})
+
+    if before:
+        for scope in _scopes(before):
+            update = scope_update(scope, before['project_id'])
+            status_key = f"status_counts.{_status_value(before.get('status'))}"
+            update['inc'][status_key] = update['inc'].get(status_key, 0) - 1
+            update['inc']['item_count'] = update['inc'].get('item_count', 0) - 1
+            update['unset'][f"open_etas.{_item_id(before)}"] = ''
+
+    if after:
+        for scope in _scopes(after):
+            update = scope_update(scope, after['project_id'])
+            status_key = f"status_counts.{_status_value(after.get('status'))}"
+            update['inc'][status_key] = update['inc'].get(status_key, 0) + 1
+            update['inc']['item_count'] = update['inc'].get('item_count', 0) + 1
+            eta_key = f"open_etas.{_item_id(after)}"
+            if _is_open(after) and after.get('expected_delivery'):
+                update['unset'].pop(eta_key, None)
+                update['set'][eta_key] = after['expected_delivery']
+
+    for (scope, scope_id), update in updates.items():
+        inc = {key: value for key, value in update['inc'].items() if value}
+        doc = {'$set': {**update['set'], 'project_id': update['project_id'], 'updated_at': datetime.utcnow()}}
+        if inc:
+            doc['$inc'] = inc
+        if update['unset']:
+            doc['$unset'] = update['unset']
+        await db.delivery_rollups.update_one({'scope': scope, 'scope_id': scope_id}, doc, upsert=True)
+
+
+async def apply_items_added(items: List[Dict[str, Any]]) -> None:
+    """Add a batch of new items with one update per affected scope (e.g. a populated room)"""
+    await ensure_rollup_indexes()
+    db = get_database()
+    updates: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    for item in items:
+        for scope in _scopes(item):
+            update = updates.setdefault(scope, {'project_id': item['project_id'], 'inc': {}, 'set': {}})
+            status_key = f"status_counts.{_status_value(item.get('status'))}"
+            update['inc'][status_key] = update['inc'].get(status_key, 0) + 1
+            update['inc']['item_count'] = update['inc'].get('item_count', 0) + 1
+            if _is_open(item) and item.get('expected_delivery'):
+                update['set'][f"open_etas.{_item_id(item)}"] = item['expected_delivery']
+
+    for (scope, scope_id), update in updates.items():
+        await db.delivery_rollups.update_one(
+            {'scope': scope, 'scope_id': scope_id},
+            {
+                '$inc': update['inc'],
+                '$set': {**update['set'], 'project_id': update['project_id'], 'updated_at': datetime.utcnow()}
+            },
+            upsert=True
+        )
+
+
+async def refresh_item_etas(items: List[Dict[str, Any]]) -> None:
+    """Re-sync open ETAs after a tracking update (status counts are untouched)"""
+    db = get_database()
+    for item in items:
+        eta_key = f"open_etas.{_item_id(item)}"
+        if _is_open(item) and item.get('expected_delivery'):
+            change = {'$set': {eta_key: item['expected_delivery'], 'updated_at': datetime.utcnow()}}
+        else:
+            change = {'$unset': {eta_key: ''}, '$set': {'updated_at': datetime.utcnow()}}
+        for scope, scope_id in _scopes(item):
+            await db.delivery_rollups.update_one({'scope': scope, 'scope_id': scope_id}, change)
+
+
+def _summarize(rollup: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    etas = [eta for eta in (rollup.get('open_etas') or {}).values() if eta]
+    return {
+        'item_count': rollup.get('item_count', 0),
+        'status_counts': {status: count for status, count in (rollup.get('status_counts') or {}).items() if count},
+        'open_items_with_eta': len(etas),
+        'latest_eta': max(etas) if etas else None,
+        'late_items': sum(1 for eta in etas if eta < now),
+        'updated_at': rollup.get('updated_at')
+    }
+
+
+async def get_project_rollup(project_id: str) -> Dict[str, Any]:
+    """Project and per-room delivery summary from materialized rollups (one query)"""
+    db = get_database()
+    rollups = await db.delivery_rollups.find({'project_id': project_id}).to_list(length=None)
+    now = datetime.utcnow()
+
+    result = {'project_id': project_id, 'project': None, 'rooms': {}}
+    for rollup in rollups:
+        if rollup['scope'] == 'project':
+            result['project'] = _summarize(rollup, now)
+        else:
+            result['rooms'][rollup['scope_id']] = _summarize(rollup, now)
+    return result
+
+
+async def rebuild_project_rollup(project_id: str) -> Dict[str, Any]:
+    """Recompute a project's rollups from its items (backfill / repair only), one write per scope"""
+    db = get_database()
+    await db.delivery_rollups.delete_many({'project_id': project_id})
+    items = await db.items.find(
+        {'project_id': project_id},
+        {'project_id': 1, 'room_id': 1, 'status': 1, 'tracking_status': 1, 'expected_delivery': 1}
+    ).to_list(length=None)
+    if items:
+        await apply_items_added(items)
+    return await get_project_rollup(project_id)
+
+
+async def delete_project_rollups(project_id: str) -> None:
+    db = get_database()
+    await db.delivery_rollups.delete_many({'project_id': project_id})
@@ -1,1526 +1,32 @@
 # COMPREHENSIVE ROOM STRUCTURE - Using USER'S EXACT SPECIFICATIONS
 # Based on the detailed list provided by user with proper subcategories
+#
+# The structures live in room_structures.json and are only read the first time
+# one of them is accessed, so importing this module stays cheap in every worker.
+# Edit room_structures.json to change what a new room is populated with.
 
-COMPREHENSIVE_ROOM_STRUCTURE = {
-    "living room": {
-        "categories": [
-            {
-                "name": "Lighting",
-                "color": "#7B68AA",
-                "subcategories": [
-                    {
-                        "name": "INSTALLED",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Chandelier", "finish_color": "Chrome/Brass/Bronze"},
-                            {"name": "Recessed Lighting", "finish_color": "White/Nickel"},
-                            {"name": "Sconces", "finish_color": "Brass/Chrome/Black"},
-                            {"name": "Track Lighting", "finish_color": "White/Black/Nickel"},
-                            {"name": "Ceiling Fan w/ Light", "finish_color": "Various Finishes"},
-                            {"name": "Art Lights", "finish_color": "Brass/Chrome"},
-                            {"name": "Pendant Lights", "finish_color": "Various Finishes"},
-                            {"name": "Under Cabinet Lighting", "finish_color": "White/Warm White"},
-                            {"name": "Cove Lighting", "finish_color": "White/Warm White"},
-                            {"name": "Picture Lights", "finish_color": "Brass/Chrome/Bronze"}
-                        ]
-                    },
-                    {
-                        "name": "PORTABLE",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Table Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Floor Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Accent Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Desk Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Buffet Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Reading Lamp", "finish_color": "Various Finishes"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Furniture",
-                "color": "#8B6914",
-                "subcategories": [
-                    {
-                        "name": "PIECE",
-                        "color": "#A0782F",
-                        "items": [
-                            {"name": "Sofa", "finish_color": "Various Fabrics"},
-                            {"name": "Sectional", "finish_color": "Various Fabrics"},
-                            {"name": "Loveseat", "finish_color": "Various Fabrics"},
-                            {"name": "Armchair", "finish_color": "Various Fabrics"},
-                            {"name": "Accent Chair", "finish_color": "Various Fabrics"},
-                            {"name": "Ottoman", "finish_color": "Various Fabrics"},
-                            {"name": "Coffee Table", "finish_color": "Wood/Glass/Metal"},
-                            {"name": "Side Table", "finish_color": "Various Finishes"},
-                            {"name": "Console Table", "finish_color": "Wood/Metal/Glass"},
-                            {"name": "Media Console", "finish_color": "Wood/Metal"},
-                            {"name": "Bookcase", "finish_color": "Wood/Metal"},
-                            {"name": "Credenza", "finish_color": "Wood Finishes"},
-                            {"name": "Display Cabinet", "finish_color": "Wood/Glass"},
-                            {"name": "Bar Cart", "finish_color": "Metal/Wood/Glass"},
-                            {"name": "Sofa Table", "finish_color": "Wood/Metal"},
-                            {"name": "Storage Bench", "finish_color": "Upholstered/Wood"},
-                            {"name": "Chaise Lounge", "finish_color": "Various Fabrics"},
-                            {"name": "Daybed", "finish_color": "Various Fabrics"},
-                            {"name": "Recliner", "finish_color": "Leather/Fabric"},
-                            {"name": "Storage Ottoman", "finish_color": "Various Fabrics"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Window Treatments",
-                "color": "#4A90E2",
-                "subcategories": [
-                    {
-                        "name": "WINDOW COVERINGS",
-                        "color": "#6BA3E6",
-                        "items": [
-                            {"name": "Curtains/Drapery", "finish_color": "Various Fabrics"},
-                            {"name": "Sheer Curtains", "finish_color": "White/Cream/Gray"},
-                            {"name": "Custom Shades", "finish_color": "Various Colors"},
-                            {"name": "Blinds", "finish_color": "Wood/Aluminum/Vinyl"},
-                            {"name": "Shutters", "finish_color": "Wood/Composite"},
-                            {"name": "Roman Shades", "finish_color": "Various Fabrics"},
-                            {"name": "Roller Shades", "finish_color": "Various Colors"},
-                            {"name": "Valances", "finish_color": "Various Fabrics"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Textiles & Soft Goods",
-                "color": "#E67E22",
-                "subcategories": [
-                    {
-                        "name": "TEXTILES",
-                        "color": "#EB984E",
-                        "items": [
-                            {"name": "Area Rug", "finish_color": "Various Patterns/Colors"},
-                            {"name": "Throw Pillows", "finish_color": "Various Fabrics"},
-                            {"name": "Throw Blanket", "finish_color": "Various Textures"},
-                            {"name": "Upholstery Fabric", "finish_color": "Various Colors/Patterns"},
-                            {"name": "Pillow Inserts", "finish_color": "Down/Synthetic"},
-                            {"name": "Table Linens", "finish_color": "Various Colors"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Art & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "ART & DECOR",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Wall Art", "finish_color": "Various Frames"},
-                            {"name": "Mirror", "finish_color": "Various Frames"},
-                            {"name": "Sculptures", "finish_color": "Various Materials"},
-                            {"name": "Decorative Objects", "finish_color": "Various Materials"},
-                            {"name": "Photo Frames", "finish_color": "Various Finishes"},
-                            {"name": "Gallery Wall Collection", "finish_color": "Various Frames"}
-                        ]
-                    },
-                    {
-                        "name": "DECORATIVE ACCESSORIES",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Decorative Vases", "finish_color": "Ceramic/Glass/Metal"},
-                            {"name": "Candle Holders", "finish_color": "Various Finishes"},
-                            {"name": "Decorative Boxes", "finish_color": "Various Materials"},
-                            {"name": "Trays", "finish_color": "Wood/Metal/Glass"},
-                            {"name": "Coasters", "finish_color": "Various Materials"},
-                            {"name": "Bookends", "finish_color": "Various Materials"}
-                        ]
-                    },
-                    {
-                        "name": "PLANTS & GREENERY",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Greenery/Plants", "finish_color": "Various Planters"},
-                            {"name": "Planters/Pots", "finish_color": "Ceramic/Metal/Stone"},
-                            {"name": "Artificial Plants", "finish_color": "Various Planters"},
-                            {"name": "Plant Stands", "finish_color": "Wood/Metal"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Fireplace & Built-ins",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "FIREPLACE ACCESSORIES",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Fireplace Tools", "finish_color": "Iron/Brass/Chrome"},
-                            {"name": "Fireplace Screen", "finish_color": "Iron/Brass"},
-                            {"name": "Andirons", "finish_color": "Iron/Brass"},
-                            {"name": "Log Holder", "finish_color": "Iron/Brass"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    
-    "dining room": {
-        "categories": [
-            {
-                "name": "Lighting",
-                "color": "#7B68AA",
-                "subcategories": [
-                    {
-                        "name": "INSTALLED",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Chandelier", "finish_color": "Crystal/Metal/Various"},
-                            {"name": "Pendant Lights", "finish_color": "Various Finishes"},
-                            {"name": "Sconces", "finish_color": "Various Finishes"},
-                            {"name": "Recessed Lighting", "finish_color": "White/Nickel"},
-                            {"name": "Art Lights", "finish_color": "Brass/Chrome"},
-                            {"name": "Ceiling Medallion", "finish_color": "Various Finishes"}
-                        ]
-                    },
-                    {
-                        "name": "PORTABLE",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Buffet Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Table Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Console Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Accent Lighting", "finish_color": "Various Finishes"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Furniture",
-                "color": "#8B6914",
-                "subcategories": [
-                    {
-                        "name": "PIECE",
-                        "color": "#A0782F",
-                        "items": [
-                            {"name": "Dining Table", "finish_color": "Wood/Glass/Stone"},
-                            {"name": "Dining Chairs", "finish_color": "Wood/Upholstered"},
-                            {"name": "Host Chairs", "finish_color": "Wood/Upholstered"},
-                            {"name": "Dining Bench", "finish_color": "Wood/Upholstered"},
-                            {"name": "Buffet", "finish_color": "Wood Finishes"},
-                            {"name": "Credenza", "finish_color": "Wood Finishes"},
-                            {"name": "China Cabinet", "finish_color": "Wood/Glass"},
-                            {"name": "Bar Cart", "finish_color": "Metal/Wood/Glass"},
-                            {"name": "Console Table", "finish_color": "Wood/Metal/Glass"},
-                            {"name": "Sideboard", "finish_color": "Wood Finishes"},
-                            {"name": "Wine Cabinet", "finish_color": "Wood Finishes"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Window Treatments",
-                "color": "#4A90E2",
-                "subcategories": [
-                    {
-                        "name": "WINDOW COVERINGS",
-                        "color": "#6BA3E6",
-                        "items": [
-                            {"name": "Curtains/Drapery", "finish_color": "Various Fabrics"},
-                            {"name": "Sheer Curtains", "finish_color": "White/Cream/Gray"},
-                            {"name": "Custom Shades", "finish_color": "Various Colors"},
-                            {"name": "Blinds", "finish_color": "Wood/Aluminum"},
-                            {"name": "Shutters", "finish_color": "Wood/Composite"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Textiles & Soft Goods",
-                "color": "#E67E22",
-                "subcategories": [
-                    {
-                        "name": "TEXTILES",
-                        "color": "#EB984E",
-                        "items": [
-                            {"name": "Area Rug", "finish_color": "Various Patterns/Colors"},
-                            {"name": "Table Runner", "finish_color": "Various Fabrics"},
-                            {"name": "Placemats", "finish_color": "Various Materials"},
-                            {"name": "Napkins", "finish_color": "Various Fabrics"},
-                            {"name": "Chair Cushions", "finish_color": "Various Fabrics"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Art & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "ART & DECOR",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Wall Art", "finish_color": "Various Frames"},
-                            {"name": "Mirror", "finish_color": "Various Frames"},
-                            {"name": "Centerpiece", "finish_color": "Various Materials"},
-                            {"name": "Place Settings", "finish_color": "Various Patterns"}
-                        ]
-                    },
-                    {
-                        "name": "DECORATIVE ACCESSORIES",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Decorative Bowls", "finish_color": "Ceramic/Glass/Metal"},
-                            {"name": "Candle Holders", "finish_color": "Various Finishes"},
-                            {"name": "Serveware", "finish_color": "Various Materials"},
-                            {"name": "Decorative Objects", "finish_color": "Various Materials"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    
-    "kitchen": {
-        "categories": [
-            {
-                "name": "Lighting",
-                "color": "#7B68AA",
-                "subcategories": [
-                    {
-                        "name": "INSTALLED",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Pendant Lights (Island/Bar)", "finish_color": "Bronze/Brass/Chrome/Black"},
-                            {"name": "Recessed Lighting", "finish_color": "White/Nickel"},
-                            {"name": "Under Cabinet Lighting", "finish_color": "White/Warm White"},
-                            {"name": "Chandelier (Nook)", "finish_color": "Crystal/Metal"},
-                            {"name": "Sconces", "finish_color": "Various Finishes"},
-                            {"name": "Toe-Kick Lighting", "finish_color": "White/Warm White"},
-                            {"name": "Over-Cabinet Lighting", "finish_color": "White/Warm White"},
-                            {"name": "Pot Rack Light", "finish_color": "Iron/Brass/Chrome"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Appliances",
-                "color": "#2E8B57",
-                "subcategories": [
-                    {
-                        "name": "UNIT",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Refrigerator (Built-in/Freestanding)", "finish_color": "Stainless/Black/White/Panel Ready"},
-                            {"name": "Dishwasher", "finish_color": "Stainless/Black/White/Panel Ready"},
-                            {"name": "Range/Oven", "finish_color": "Stainless/Black/White"},
-                            {"name": "Microwave (Built-in/Countertop)", "finish_color": "Stainless/Black/White"},
-                            {"name": "Cooktop", "finish_color": "Stainless/Black"},
-                            {"name": "Wall Oven (Single/Double)", "finish_color": "Stainless/Black/White"},
-                            {"name": "Wine Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Beverage Cooler", "finish_color": "Stainless/Black"},
-                            {"name": "Ice Maker", "finish_color": "Stainless"},
-                            {"name": "Coffee Machine (Built-in)", "finish_color": "Stainless/Black"},
-                            {"name": "Trash Compactor", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Garbage Disposal", "finish_color": "Stainless"},
-                            {"name": "Vent Hood/Range Hood", "finish_color": "Stainless/Custom"},
-                            {"name": "Warming Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Dishwasher Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Fridge Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Freezer Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Convection Oven/Microwave", "finish_color": "Stainless/Black"},
-                            {"name": "Double Oven", "finish_color": "Stainless/Black"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Plumbing",
-                "color": "#4682B4",
-                "subcategories": [
-                    {
-                        "name": "SINKS",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Farmhouse Sink", "finish_color": "White/Stainless/Colored"},
-                            {"name": "Stainless Sink", "finish_color": "Brushed/Polished Stainless"},
-                            {"name": "Prep Sink", "finish_color": "Stainless/White"},
-                            {"name": "Composite Sink", "finish_color": "Various Colors"},
-                            {"name": "Double Sink", "finish_color": "Stainless/White/Colored"},
-                            {"name": "Undermount Sink", "finish_color": "Stainless/White"},
-                            {"name": "Drop-in Sink", "finish_color": "Stainless/White"},
-                            {"name": "Corner Sink", "finish_color": "Stainless/White"},
-                            {"name": "Bar Sink", "finish_color": "Stainless/Copper"},
-                            {"name": "Workstation Sink", "finish_color": "Stainless"}
-                        ]
-                    },
-                    {
-                        "name": "FIXTURES",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Main Faucet", "finish_color": "Chrome/Brushed Nickel/Black/Brass"},
-                            {"name": "Touch Faucet", "finish_color": "Chrome/Brushed Nickel/Black"},
-                            {"name": "Instant Hot Water", "finish_color": "Chrome/Brushed Nickel"},
-                            {"name": "Pot Filler", "finish_color": "Chrome/Brushed Nickel/Black/Brass"},
-                            {"name": "Glass Washer", "finish_color": "Chrome/Brushed Nickel"},
-                            {"name": "Goose Neck Faucet", "finish_color": "Chrome/Brushed Nickel/Black/Brass"},
-                            {"name": "Prep Sink Faucet", "finish_color": "Chrome/Brushed Nickel/Black"},
-                            {"name": "Soap Dispenser", "finish_color": "Matching Faucet"},
-                            {"name": "Water Filtration System", "finish_color": "Stainless/Chrome"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Cabinets, Built-ins, and Trim",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Base Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Wall Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Tall Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Pantry Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Corner Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Island Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Peninsula Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Sink Base Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Appliance Garage", "finish_color": "Wood/Painted"},
-                            {"name": "Wine Storage Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Glass Front Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Open Shelving Cabinets", "finish_color": "Wood/Painted"}
-                        ]
-                    },
-                    {
-                        "name": "BUILT-INS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Built-in Spice Rack", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Trash Pull-out", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Cutting Board", "finish_color": "Wood/Bamboo"},
-                            {"name": "Built-in Wine Rack", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Lazy Susan", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Plate Rack", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Tray Dividers", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Drawer Organizers", "finish_color": "Wood/Plastic"}
-                        ]
-                    },
-                    {
-                        "name": "TRIM",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Crown Molding", "finish_color": "Wood/Painted"},
-                            {"name": "Light Rail Molding", "finish_color": "Wood/Painted"},
-                            {"name": "Baseboard", "finish_color": "Wood/Painted"},
-                            {"name": "Window Trim", "finish_color": "Wood/Painted"},
-                            {"name": "Door Trim", "finish_color": "Wood/Painted"},
-                            {"name": "Toe Kick", "finish_color": "Wood/Painted"},
-                            {"name": "Fillers", "finish_color": "Wood/Painted"},
-                            {"name": "Scribe Molding", "finish_color": "Wood/Painted"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Tile and Tops",
-                "color": "#D35400",
-                "subcategories": [
-                    {
-                        "name": "COUNTER TOPS",
-                        "color": "#E67E22",
-                        "items": [
-                            {"name": "Quartz Countertops", "finish_color": "Various Colors/Patterns"},
-                            {"name": "Granite Countertops", "finish_color": "Natural Stone Colors"},
-                            {"name": "Marble Countertops", "finish_color": "White/Gray/Veined"},
-                            {"name": "Butcher Block", "finish_color": "Wood Species"},
-                            {"name": "Concrete Countertops", "finish_color": "Custom Colors"},
-                            {"name": "Solid Surface", "finish_color": "Various Colors"},
-                            {"name": "Stainless Steel Countertops", "finish_color": "Brushed/Polished"}
-                        ]
-                    },
-                    {
-                        "name": "TILE",
-                        "color": "#E67E22",
-                        "items": [
-                            {"name": "Subway Tile", "finish_color": "White/Colored"},
-                            {"name": "Natural Stone Tile", "finish_color": "Various Stones"},
-                            {"name": "Glass Tile", "finish_color": "Various Colors"},
-                            {"name": "Metal Backsplash", "finish_color": "Stainless/Copper"},
-                            {"name": "Mosaic Tile", "finish_color": "Various Patterns"},
-                            {"name": "Ceramic Tile", "finish_color": "Various Colors"},
-                            {"name": "Porcelain Tile", "finish_color": "Various Colors/Patterns"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Furniture & Storage",
-                "color": "#8B6914",
-                "subcategories": [
-                    {
-                        "name": "PIECE",
-                        "color": "#A0782F",
-                        "items": [
-                            {"name": "Bar Stools", "finish_color": "Wood/Metal/Upholstered"},
-                            {"name": "Counter Stools", "finish_color": "Wood/Metal/Upholstered"},
-                            {"name": "Kitchen Island", "finish_color": "Wood/Painted/Stone"},
-                            {"name": "Breakfast Nook Table", "finish_color": "Wood/Glass/Stone"},
-                            {"name": "Breakfast Nook Chairs/Bench", "finish_color": "Wood/Upholstered"},
-                            {"name": "Shelving", "finish_color": "Wood/Metal"},
-                            {"name": "Floating Shelves", "finish_color": "Wood/Metal"},
-                            {"name": "Wine Rack (Built-in/Freestanding)", "finish_color": "Wood/Metal"},
-                            {"name": "Cutting Board Storage", "finish_color": "Wood"},
-                            {"name": "Pull-out Pantry", "finish_color": "Wood/Metal"},
-                            {"name": "Spice Drawer", "finish_color": "Wood/Metal"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Decor & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "MISC",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Area Rug/Runner", "finish_color": "Various Patterns/Colors"},
-                            {"name": "Wall Art", "finish_color": "Various Frames"},
-                            {"name": "Decorative Bowls/Plates", "finish_color": "Ceramic/Glass/Wood"},
-                            {"name": "Vases", "finish_color": "Ceramic/Glass/Metal"},
-                            {"name": "Cookware Displays", "finish_color": "Copper/Stainless/Cast Iron"},
-                            {"name": "Herb Garden", "finish_color": "Various Planters"},
-                            {"name": "Curtains/Blinds/Shades", "finish_color": "Various Fabrics"},
-                            {"name": "Dish Towels", "finish_color": "Various Colors/Patterns"},
-                            {"name": "Utensil Crocks", "finish_color": "Ceramic/Stainless"},
-                            {"name": "Fruit Bowls", "finish_color": "Various Materials"},
-                            {"name": "Coffee Bar Accessories", "finish_color": "Various Finishes"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    
-    "primary bedroom": {
-        "categories": [
-            {
-                "name": "Lighting",
-                "color": "#7B68AA",
-                "subcategories": [
-                    {
-                        "name": "INSTALLED",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Chandelier/Ceiling Fixture", "finish_color": "Crystal/Metal/Various"},
-                            {"name": "Recessed Lighting (Dimmable)", "finish_color": "White/Nickel"},
-                            {"name": "Sconces (Bedside)", "finish_color": "Brass/Chrome/Black"},
-                            {"name": "Ceiling Fan w/ Light", "finish_color": "Various Finishes"},
-                            {"name": "Cove Lighting", "finish_color": "White/Warm White"},
-                            {"name": "Accent Lighting (Architectural)", "finish_color": "White/Warm White"},
-                            {"name": "Reading Lights (Wall Mounted)", "finish_color": "Brass/Chrome/Black"}
-                        ]
-                    },
-                    {
-                        "name": "PORTABLE",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Nightstand Lamps", "finish_color": "Various Finishes"},
-                            {"name": "Floor Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Dresser Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Desk Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Buffet Lamp", "finish_color": "Various Finishes"},
-                            {"name": "Reading Lamp", "finish_color": "Various Finishes"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Appliances",
-                "color": "#2E8B57",
-                "subcategories": [
-                    {
-                        "name": "UNIT",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Mini Fridge", "finish_color": "Stainless/Black/White"},
-                            {"name": "Dishwasher Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Fridge Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Freezer Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Beverage Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Ice Maker", "finish_color": "Stainless"},
-                            {"name": "Wine Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Installed Coffee Maker", "finish_color": "Stainless/Black"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Furniture",
-                "color": "#8B6914",
-                "subcategories": [
-                    {
-                        "name": "PIECE",
-                        "color": "#A0782F",
-                        "items": [
-                            {"name": "Bed Frame (King/Queen/Cal King)", "finish_color": "Wood/Upholstered/Metal"},
-                            {"name": "Mattress", "finish_color": "White/Various"},
-                            {"name": "Box Spring/Foundation", "finish_color": "Various"},
-                            {"name": "Nightstands (Pair)", "finish_color": "Wood/Painted"},
-                            {"name": "Dresser (Long/Tall)", "finish_color": "Wood Finishes"},
-                            {"name": "Armoire", "finish_color": "Wood Finishes"},
-                            {"name": "Vanity", "finish_color": "Wood/Painted"},
-                            {"name": "Vanity Stool", "finish_color": "Various Fabrics"},
-                            {"name": "Bench (Foot of Bed)", "finish_color": "Upholstered/Wood"},
-                            {"name": "Seating Area Sofa/Chairs (Pair)", "finish_color": "Various Fabrics"},
-                            {"name": "Coffee Table (Seating Area)", "finish_color": "Wood/Glass/Metal"},
-                            {"name": "Bookcase", "finish_color": "Wood/Metal"},
-                            {"name": "Media Console/TV Stand", "finish_color": "Wood/Metal"},
-                            {"name": "Desk", "finish_color": "Wood/Metal"},
-                            {"name": "Desk Chair", "finish_color": "Various Fabrics"},
-                            {"name": "Chaise Lounge", "finish_color": "Various Fabrics"},
-                            {"name": "Daybed", "finish_color": "Various Fabrics"},
-                            {"name": "Recliner", "finish_color": "Leather/Fabric"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Window Treatments",
-                "color": "#4A90E2",
-                "subcategories": [
-                    {
-                        "name": "WINDOW COVERINGS",
-                        "color": "#6BA3E6",
-                        "items": [
-                            {"name": "Curtains/Drapery", "finish_color": "Various Fabrics"},
-                            {"name": "Blackout Curtains", "finish_color": "Various Colors"},
-                            {"name": "Sheer Curtains", "finish_color": "White/Cream/Gray"},
-                            {"name": "Custom Shades (Roman/Roller)", "finish_color": "Various Fabrics"},
-                            {"name": "Blinds", "finish_color": "Wood/Aluminum"},
-                            {"name": "Shutters", "finish_color": "Wood/Composite"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Textiles & Soft Goods",
-                "color": "#E67E22",
-                "subcategories": [
-                    {
-                        "name": "TEXTILES",
-                        "color": "#EB984E",
-                        "items": [
-                            {"name": "Area Rug", "finish_color": "Various Patterns/Colors"},
-                            {"name": "Throw Pillows (Decorative)", "finish_color": "Various Fabrics"},
-                            {"name": "Throw Blanket", "finish_color": "Various Textures"},
-                            {"name": "Bedding Set (Duvet, Sheets, Shams)", "finish_color": "Various Colors/Patterns"},
-                            {"name": "Bed Skirt", "finish_color": "Various Fabrics"},
-                            {"name": "Pillowcases", "finish_color": "Various Fabrics"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Art & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "ART & DECOR",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Wall Art (Large Piece/Gallery)", "finish_color": "Various Frames"},
-                            {"name": "Mirror (Full Length/Decorative)", "finish_color": "Various Frames"},
-                            {"name": "Photo Frames", "finish_color": "Various Finishes"},
-                            {"name": "Gallery Wall Collection", "finish_color": "Various Frames"}
-                        ]
-                    },
-                    {
-                        "name": "DECORATIVE ACCESSORIES",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Decorative Vases", "finish_color": "Ceramic/Glass/Metal"},
-                            {"name": "Candles/Diffusers", "finish_color": "Various Colors"},
-                            {"name": "Bedside Clock/Alarm", "finish_color": "Various Finishes"},
-                            {"name": "Trays (Nightstand/Dresser)", "finish_color": "Wood/Metal/Glass"},
-                            {"name": "Jewelry Box", "finish_color": "Wood/Leather"},
-                            {"name": "Decorative Objects", "finish_color": "Various Materials"}
-                        ]
-                    },
-                    {
-                        "name": "PLANTS & GREENERY",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Plants/Faux Greenery", "finish_color": "Various Planters"},
-                            {"name": "Planters/Pots", "finish_color": "Ceramic/Metal/Stone"},
-                            {"name": "Plant Stands", "finish_color": "Wood/Metal"},
-                            {"name": "Hanging Planters", "finish_color": "Various Materials"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    
-    "primary bathroom": {
-        "categories": [
-            {
-                "name": "Plumbing & Fixtures",
-                "color": "#20B2AA",
-                "subcategories": [
-                    {
-                        "name": "VANITY FIXTURES",
-                        "color": "#48D1CC",
-                        "items": [
-                            {"name": "Vanity Sink", "finish_color": ""},
-                            {"name": "Vanity Faucet", "finish_color": ""},
-                            {"name": "Vanity Mirror", "finish_color": ""},
-                            {"name": "Vanity Cabinet", "finish_color": ""},
-                            {"name": "Vanity Countertop", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "BATHING FIXTURES",
-                        "color": "#48D1CC",
-                        "items": [
-                            {"name": "Bathtub", "finish_color": ""},
-                            {"name": "Shower Base", "finish_color": ""},
-                            {"name": "Shower Valve", "finish_color": ""},
-                            {"name": "Shower Head", "finish_color": ""},
-                            {"name": "Shower Doors", "finish_color": ""},
-                            {"name": "Tub Faucet", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "TOILET FIXTURES",
-                        "color": "#48D1CC",
-                        "items": [
-                            {"name": "Toilet", "finish_color": ""},
-                            {"name": "Toilet Seat", "finish_color": ""},
-                            {"name": "Bidet", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Cabinets & Storage",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "VANITY CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Vanity Base Cabinet", "finish_color": ""},
-                            {"name": "Vanity Drawers", "finish_color": ""},
-                            {"name": "Medicine Cabinet", "finish_color": ""},
-                            {"name": "Linen Cabinet", "finish_color": ""},
-                            {"name": "Tower Cabinet", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Lighting",
-                "color": "#FFD700",
-                "subcategories": [
-                    {
-                        "name": "VANITY LIGHTING",
-                        "color": "#FFED4E",
-                        "items": [
-                            {"name": "Vanity Lights", "finish_color": ""},
-                            {"name": "Mirror Lights", "finish_color": ""},
-                            {"name": "Sconces", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "AMBIENT LIGHTING", 
-                        "color": "#FFED4E",
-                        "items": [
-                            {"name": "Recessed Lights", "finish_color": ""},
-                            {"name": "Exhaust Fan Light", "finish_color": ""},
-                            {"name": "Shower Light", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Appliances",
-                "color": "#2E8B57",
-                "subcategories": [
-                    {
-                        "name": "UNIT",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Towel Warmer", "finish_color": "Chrome/Brushed Nickel/Black"},
-                            {"name": "Heated Floors", "finish_color": "Various"},
-                            {"name": "Dishwasher Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Fridge Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Freezer Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Beverage Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Ice Maker", "finish_color": "Stainless"},
-                            {"name": "Wine Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Installed Coffee Maker", "finish_color": "Stainless/Black"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Plumbing & Fixtures",
-                "color": "#4682B4",
-                "subcategories": [
-                    {
-                        "name": "SINKS",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Vanity Sinks (Undermount)", "finish_color": "White/Colored"},
-                            {"name": "Vessel Sinks", "finish_color": "Various Materials/Colors"},
-                            {"name": "Console Sinks", "finish_color": "White/Colored"},
-                            {"name": "Wall-mount Sinks", "finish_color": "White/Colored"},
-                            {"name": "Double Vanity Sinks", "finish_color": "White/Colored"},
-                            {"name": "Integrated Sinks", "finish_color": "White/Colored"}
-                        ]
-                    },
-                    {
-                        "name": "FIXTURES",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Vanity Faucets", "finish_color": "Chrome/Brushed Nickel/Black/Brass"},
-                            {"name": "Shower Head (Rainfall/Standard)", "finish_color": "Chrome/Brushed Nickel/Black"},
-                            {"name": "Handheld Shower", "finish_color": "Various Finishes"},
-                            {"name": "Body Jets", "finish_color": "Various Finishes"},
-                            {"name": "Shower Valve Trim", "finish_color": "Various Finishes"},
-                            {"name": "Freestanding Tub", "finish_color": "White/Various"},
-                            {"name": "Drop-in Tub", "finish_color": "White/Various"},
-                            {"name": "Tub Faucet (Deck Mount/Wall Mount)", "finish_color": "Various Finishes"},
-                            {"name": "Toilet", "finish_color": "White/Colored"},
-                            {"name": "Bidet/Bidet Seat", "finish_color": "White/Colored"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Cabinets, Built-ins, and Trim",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Vanity Cabinet (Single/Double)", "finish_color": "Wood/Painted"},
-                            {"name": "Linen Tower", "finish_color": "Wood/Painted"},
-                            {"name": "Storage Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Medicine Cabinet", "finish_color": "Various Finishes"},
-                            {"name": "Floating Vanity", "finish_color": "Wood/Painted"},
-                            {"name": "Tall Storage Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Under-sink Cabinet", "finish_color": "Wood/Painted"}
-                        ]
-                    },
-                    {
-                        "name": "BUILT-INS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Built-in Hamper", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Shelving", "finish_color": "Wood/Stone/Tile"},
-                            {"name": "Built-in Bench (Shower)", "finish_color": "Stone/Tile"},
-                            {"name": "Built-in Niche (Shower)", "finish_color": "Stone/Tile"},
-                            {"name": "Built-in Makeup Area", "finish_color": "Wood/Stone"}
-                        ]
-                    },
-                    {
-                        "name": "TRIM",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Baseboard", "finish_color": "Wood/Painted"},
-                            {"name": "Crown Molding", "finish_color": "Wood/Painted"},
-                            {"name": "Window Trim", "finish_color": "Wood/Painted"},
-                            {"name": "Door Trim", "finish_color": "Wood/Painted"},
-                            {"name": "Wainscoting", "finish_color": "Wood/Painted"},
-                            {"name": "Chair Rail", "finish_color": "Wood/Painted"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Tile and Tops",
-                "color": "#D35400",
-                "subcategories": [
-                    {
-                        "name": "COUNTER TOPS",
-                        "color": "#E67E22",
-                        "items": [
-                            {"name": "Quartz Countertop", "finish_color": "Various Colors"},
-                            {"name": "Marble Countertop", "finish_color": "White/Gray/Veined"},
-                            {"name": "Granite Countertop", "finish_color": "Natural Stone Colors"},
-                            {"name": "Solid Surface", "finish_color": "Various Colors"},
-                            {"name": "Concrete Countertop", "finish_color": "Custom Colors"}
-                        ]
-                    },
-                    {
-                        "name": "TILE",
-                        "color": "#E67E22",
-                        "items": [
-                            {"name": "Porcelain Floor Tile", "finish_color": "Various Colors/Patterns"},
-                            {"name": "Natural Stone Floor", "finish_color": "Marble/Travertine/Slate"},
-                            {"name": "Mosaic Floor Tile", "finish_color": "Various Patterns"},
-                            {"name": "Subway Tile", "finish_color": "White/Colored"},
-                            {"name": "Large Format Tiles", "finish_color": "Various Colors"},
-                            {"name": "Natural Stone Wall", "finish_color": "Marble/Travertine"},
-                            {"name": "Decorative Accent Tile", "finish_color": "Various Patterns"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Furniture & Storage",
-                "color": "#8B6914",
-                "subcategories": [
-                    {
-                        "name": "PIECE",
-                        "color": "#A0782F",
-                        "items": [
-                            {"name": "Accent Stool/Bench", "finish_color": "Various Fabrics"},
-                            {"name": "Shower Bench (Portable)", "finish_color": "Teak/Stone"},
-                            {"name": "Makeup Vanity/Desk", "finish_color": "Wood/Metal"},
-                            {"name": "Storage Ottoman", "finish_color": "Various Fabrics"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Textiles & Soft Goods",
-                "color": "#E67E22",
-                "subcategories": [
-                    {
-                        "name": "TEXTILES",
-                        "color": "#EB984E",
-                        "items": [
-                            {"name": "Area Rug/Bath Mats", "finish_color": "Various Colors"},
-                            {"name": "Towels (Bath/Hand/Washcloth)", "finish_color": "Various Colors"},
-                            {"name": "Shower Curtains", "finish_color": "Various Colors/Patterns"},
-                            {"name": "Bath Linens Set", "finish_color": "Various Colors"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Art & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "ART & DECOR",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Vanity Mirrors (Framed/Frameless)", "finish_color": "Various Frames"},
-                            {"name": "Full Length Mirror", "finish_color": "Various Frames"},
-                            {"name": "Wall Art", "finish_color": "Various Frames"},
-                            {"name": "Decorative Objects", "finish_color": "Various Materials"}
-                        ]
-                    },
-                    {
-                        "name": "BATHROOM ACCESSORIES",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Soap Dispensers", "finish_color": "Various Finishes"},
-                            {"name": "Toothbrush Holder", "finish_color": "Various Finishes"},
-                            {"name": "Tray Organizers", "finish_color": "Various Materials"},
-                            {"name": "Toilet Paper Holder", "finish_color": "Various Finishes"},
-                            {"name": "Towel Bar/Ring/Hooks", "finish_color": "Various Finishes"},
-                            {"name": "Robe Hooks", "finish_color": "Various Finishes"},
-                            {"name": "Waste Basket", "finish_color": "Various Finishes"}
-                        ]
-                    },
-                    {
-                        "name": "PLANTS & GREENERY",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Plants/Greenery", "finish_color": "Various Planters"},
-                            {"name": "Planters/Pots", "finish_color": "Ceramic/Metal/Stone"},
-                            {"name": "Hanging Plants", "finish_color": "Various Planters"},
-                            {"name": "Artificial Plants", "finish_color": "Various Planters"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    
-    "powder room": {
-        "categories": [
-            {
-                "name": "Lighting",
-                "color": "#D2691E",
-                "subcategories": [
-                    {
-                        "name": "INSTALLED",
-                        "color": "#E6894A",
-                        "items": [
-                            {"name": "Vanity Light", "finish_color": "Chrome/Brushed Nickel/Black"},
-                            {"name": "Sconces", "finish_color": "Various Finishes"},
-                            {"name": "Recessed Lighting", "finish_color": "White/Nickel"},
-                            {"name": "Pendant Light", "finish_color": "Various Finishes"},
-                            {"name": "Exhaust Fan w/ Light", "finish_color": "White/Nickel"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Plumbing & Fixtures",
-                "color": "#4682B4",
-                "subcategories": [
-                    {
-                        "name": "SINKS",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Pedestal Sink", "finish_color": "White/Colored"},
-                            {"name": "Console Sink", "finish_color": "White/Colored"},
-                            {"name": "Wall-mount Sink", "finish_color": "White/Colored"},
-                            {"name": "Vessel Sink", "finish_color": "Various Materials"}
-                        ]
-                    },
-                    {
-                        "name": "FIXTURES",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Faucet", "finish_color": "Chrome/Brushed Nickel/Black/Brass"},
-                            {"name": "Toilet", "finish_color": "White/Colored"},
-                            {"name": "Soap Dispenser", "finish_color": "Matching Faucet"},
-                            {"name": "Toilet Paper Holder", "finish_color": "Various Finishes"},
-                            {"name": "Towel Ring/Hooks", "finish_color": "Various Finishes"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Cabinets, Built-ins, and Trim",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Small Vanity Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Medicine Cabinet", "finish_color": "Various Finishes"},
-                            {"name": "Small Storage Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Floating Vanity", "finish_color": "Wood/Painted"}
-                        ]
-                    },
-                    {
-                        "name": "TRIM",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Baseboard", "finish_color": "Wood/Painted"},
-                            {"name": "Chair Rail", "finish_color": "Wood/Painted"},
-                            {"name": "Crown Molding", "finish_color": "Wood/Painted"},
-                            {"name": "Window Trim", "finish_color": "Wood/Painted"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Tile and Tops",
-                "color": "#D35400",
-                "subcategories": [
-                    {
-                        "name": "COUNTER TOPS",
-                        "color": "#E67E22",
-                        "items": [
-                            {"name": "Quartz Countertop", "finish_color": "Various Colors"},
-                            {"name": "Marble Countertop", "finish_color": "White/Gray/Veined"},
-                            {"name": "Granite Countertop", "finish_color": "Natural Stone Colors"},
-                            {"name": "Solid Surface", "finish_color": "Various Colors"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Art & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "ART & DECOR",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Mirror (Decorative)", "finish_color": "Various Frames"},
-                            {"name": "Wall Art", "finish_color": "Various Frames"},
-                            {"name": "Decorative Objects", "finish_color": "Various Materials"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    
-    "laundry room": {
-        "categories": [
-            {
-                "name": "Lighting",
-                "color": "#9370DB",
-                "subcategories": [
-                    {
-                        "name": "INSTALLED",
-                        "color": "#A687E6",
-                        "items": [
-                            {"name": "Flush Mount Light", "finish_color": "White/Nickel"},
-                            {"name": "Recessed Lighting", "finish_color": "White/Nickel"},
-                            {"name": "Task Lighting (over counter)", "finish_color": "White/Nickel"},
-                            {"name": "Utility Light", "finish_color": "White/Nickel"},
-                            {"name": "Under Cabinet Lighting", "finish_color": "White/Warm White"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Appliances",
-                "color": "#2E8B57",
-                "subcategories": [
-                    {
-                        "name": "UNIT",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Washer (Front Load/Top Load)", "finish_color": "White/Stainless"},
-                            {"name": "Dryer (Electric/Gas)", "finish_color": "White/Stainless"},
-                            {"name": "Utility Sink", "finish_color": "Stainless/White"},
-                            {"name": "Steamer", "finish_color": "Stainless/White"},
-                            {"name": "Iron", "finish_color": "Various Colors"},
-                            {"name": "Dishwasher Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Fridge Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Freezer Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Beverage Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Ice Maker", "finish_color": "Stainless"},
-                            {"name": "Wine Fridge", "finish_color": "Stainless/Black"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Cabinets, Built-ins, and Trim",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Base Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Wall Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Tall Storage Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Utility Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Pantry Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Broom Closet", "finish_color": "Wood/Painted"}
-                        ]
-                    },
-                    {
-                        "name": "BUILT-INS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Built-in Hamper", "finish_color": "Wood/Painted"},
-                            {"name": "Built-in Ironing Board", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Drying Rack", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Shelving", "finish_color": "Wood/Metal"}
-                        ]
-                    },
-                    {
-                        "name": "TRIM",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Baseboard", "finish_color": "Wood/Painted"},
-                            {"name": "Crown Molding", "finish_color": "Wood/Painted"},
-                            {"name": "Window Trim", "finish_color": "Wood/Painted"},
-                            {"name": "Door Trim", "finish_color": "Wood/Painted"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Furniture & Storage",
-                "color": "#8B6914",
-                "subcategories": [
-                    {
-                        "name": "PIECE",
-                        "color": "#A0782F",
-                        "items": [
-                            {"name": "Countertop (Folding Area)", "finish_color": "Quartz/Laminate"},
-                            {"name": "Laundry Folding Table", "finish_color": "Wood/Laminate"},
-                            {"name": "Hanging Rod", "finish_color": "Chrome/White"},
-                            {"name": "Shelving Units", "finish_color": "Wood/Metal/White"},
-                            {"name": "Laundry Sorter/Hampers", "finish_color": "Plastic/Canvas/Wicker"},
-                            {"name": "Ironing Board (Foldable)", "finish_color": "Metal/Wood"},
-                            {"name": "Drying Rack (Freestanding)", "finish_color": "Wood/Metal/Plastic"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Decor & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "MISC",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Wall Art/Signage", "finish_color": "Various Frames"},
-                            {"name": "Floor Mat", "finish_color": "Various Colors"},
-                            {"name": "Storage Bins (Laundry Supplies)", "finish_color": "Plastic/Wicker"},
-                            {"name": "Pegboard Organizer", "finish_color": "White/Natural"},
-                            {"name": "Lint Bin", "finish_color": "Plastic/Metal"},
-                            {"name": "Cleaning Supplies Caddy", "finish_color": "Plastic/Metal"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    
-    "bar": {
-        "categories": [
-            {
-                "name": "Lighting",
-                "color": "#7B68AA",
-                "subcategories": [
-                    {
-                        "name": "INSTALLED",
-                        "color": "#9B89B3",
-                        "items": [
-                            {"name": "Pendant Lights (over bar)", "finish_color": "Bronze/Brass/Chrome/Black"},
-                            {"name": "Recessed Lighting (Dimmable)", "finish_color": "White/Nickel"},
-                            {"name": "Under Cabinet Lighting", "finish_color": "White/Warm White"},
-                            {"name": "Bottle Display Lighting", "finish_color": "White/Warm White"},
-                            {"name": "LED Strip Lights", "finish_color": "White/Color Changing"},
-                            {"name": "Cove Lighting", "finish_color": "White/Warm White"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Appliances",
-                "color": "#2E8B57",
-                "subcategories": [
-                    {
-                        "name": "UNIT",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Beverage Cooler/Wine Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Ice Maker (Built-in)", "finish_color": "Stainless"},
-                            {"name": "Wine Fridge", "finish_color": "Stainless/Black"},
-                            {"name": "Dishwasher Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Fridge Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Freezer Drawer", "finish_color": "Stainless/Panel Ready"},
-                            {"name": "Installed Coffee Maker", "finish_color": "Stainless/Black"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Plumbing",
-                "color": "#4682B4",
-                "subcategories": [
-                    {
-                        "name": "SINKS",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Bar Sink", "finish_color": "Stainless/Copper/White"},
-                            {"name": "Prep Sink", "finish_color": "Stainless/White"},
-                            {"name": "Undermount Bar Sink", "finish_color": "Stainless/White"},
-                            {"name": "Round Bar Sink", "finish_color": "Stainless/Copper"}
-                        ]
-                    },
-                    {
-                        "name": "FIXTURES",
-                        "color": "#5B9BD5",
-                        "items": [
-                            {"name": "Bar Faucet", "finish_color": "Chrome/Brushed Nickel/Black/Brass"},
-                            {"name": "Touch Faucet", "finish_color": "Chrome/Brushed Nickel/Black"},
-                            {"name": "Instant Hot Water", "finish_color": "Chrome/Brushed Nickel"},
-                            {"name": "Glass Washer", "finish_color": "Chrome/Brushed Nickel"},
-                            {"name": "Soap Dispenser", "finish_color": "Matching Faucet"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Cabinets, Built-ins, and Trim",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Bar Base Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Upper Bar Cabinets", "finish_color": "Wood/Painted"},
-                            {"name": "Wine Storage Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Liquor Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Glass Storage Cabinet", "finish_color": "Wood/Painted"},
-                            {"name": "Back Bar Cabinet", "finish_color": "Wood/Painted"}
-                        ]
-                    },
-                    {
-                        "name": "BUILT-INS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Built-in Wine Rack", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Glass Rack", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Bottle Storage", "finish_color": "Wood/Metal"},
-                            {"name": "Built-in Bar Back", "finish_color": "Wood/Stone/Mirror"}
-                        ]
-                    },
-                    {
-                        "name": "TRIM",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Bar Rail Molding", "finish_color": "Wood/Metal"},
-                            {"name": "Crown Molding", "finish_color": "Wood/Painted"},
-                            {"name": "Baseboard", "finish_color": "Wood/Painted"},
-                            {"name": "Foot Rail", "finish_color": "Brass/Chrome/Stainless"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Furniture & Storage",
-                "color": "#8B6914",
-                "subcategories": [
-                    {
-                        "name": "PIECE",
-                        "color": "#A0782F",
-                        "items": [
-                            {"name": "Bar Counter/Island", "finish_color": "Wood/Stone/Quartz"},
-                            {"name": "Bar Stools", "finish_color": "Wood/Metal/Upholstered"},
-                            {"name": "Back Bar Counter", "finish_color": "Wood/Stone/Quartz"},
-                            {"name": "Cocktail Station", "finish_color": "Wood/Metal/Stone"},
-                            {"name": "Mobile Bar Cart", "finish_color": "Metal/Wood/Glass"},
-                            {"name": "Bar Table", "finish_color": "Wood/Metal/Stone"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Art & Accessories",
-                "color": "#B85450",
-                "subcategories": [
-                    {
-                        "name": "BAR ACCESSORIES",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Bar Tools Set", "finish_color": "Stainless/Black/Gold"},
-                            {"name": "Cocktail Shakers", "finish_color": "Stainless/Copper/Gold"},
-                            {"name": "Specialty Glassware", "finish_color": "Clear/Colored"},
-                            {"name": "Coasters", "finish_color": "Various Materials"},
-                            {"name": "Bar Mats", "finish_color": "Rubber/Leather"},
-                            {"name": "Bottle Openers (Decorative)", "finish_color": "Various Finishes"}
-                        ]
-                    },
-                    {
-                        "name": "ART & DECOR",
-                        "color": "#C86763",
-                        "items": [
-                            {"name": "Neon Sign/Bar Sign", "finish_color": "Various Colors"},
-                            {"name": "Wall Art (Bar themed)", "finish_color": "Various Frames"},
-                            {"name": "Mirror (Back Bar)", "finish_color": "Various Frames"},
-                            {"name": "Decorative Objects", "finish_color": "Various Materials"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Paint, Wallpaper, and Finishes",
-                "color": "#5A7A5A",
-                "subcategories": [
-                    {
-                        "name": "FINISHES",
-                        "color": "#6B8B6B",
-                        "items": [
-                            {"name": "Paint color", "finish_color": ""},
-                            {"name": "Wallpaper", "finish_color": ""},
-                            {"name": "Finish", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    }
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any
+
+ROOM_STRUCTURES_PATH = Path(__file__).parent / 'room_structures.json'
+
+_STRUCTURE_NAMES = {
+    'COMPREHENSIVE_ROOM_STRUCTURE': 'comprehensive',
+    # Default structure for rooms not specifically defined
+    'DEFAULT_ROOM_STRUCTURE': 'default',
 }
 
-# Default structure for rooms not specifically defined above
-DEFAULT_ROOM_STRUCTURE = {
-    "categories": [
-        {
-            "name": "Lighting",
-            "color": "#7B68AA",
-            "subcategories": [
-                {
-                    "name": "INSTALLED",
-                    "color": "#9B89B3",
-                    "items": [
-                        {"name": "Ceiling Light", "finish_color": "Various Finishes"},
-                        {"name": "Recessed Lighting", "finish_color": "White/Nickel"},
-                        {"name": "Pendant Light", "finish_color": "Various Finishes"},
-                        {"name": "Sconces", "finish_color": "Various Finishes"}
-                    ]
-                },
-                {
-                    "name": "PORTABLE",
-                    "color": "#9B89B3",
-                    "items": [
-                        {"name": "Table Lamp", "finish_color": "Various Finishes"},
-                        {"name": "Floor Lamp", "finish_color": "Various Finishes"},
-                        {"name": "Desk Lamp", "finish_color": "Various Finishes"}
-                    ]
-                }
-            ]
-        },
-        {
-            "name": "Furniture",
-            "color": "#8B6914",
-            "subcategories": [
-                {
-                    "name": "PIECE",
-                    "color": "#A0782F",
-                    "items": [
-                        {"name": "Table", "finish_color": "Wood/Glass/Metal"},
-                        {"name": "Chairs", "finish_color": "Various Fabrics"},
-                        {"name": "Storage Cabinet", "finish_color": "Wood/Metal"},
-                        {"name": "Work Surface", "finish_color": "Various Finishes"}
-                    ]
-                }
-            ]
-        },
-        {
-            "name": "Art & Accessories",
-            "color": "#B85450",
-            "subcategories": [
-                {
-                    "name": "ART & DECOR",
-                    "color": "#C86763",
-                    "items": [
-                        {"name": "Wall Art", "finish_color": "Various Frames"},
-                        {"name": "Mirror", "finish_color": "Various Frames"},
-                        {"name": "Decorative Objects", "finish_color": "Various Materials"}
-                    ]
-                }
-            ]
-        },
-        {
-            "name": "Paint, Wallpaper, and Finishes",
-            "color": "#5A7A5A",
-            "subcategories": [
-                {
-                    "name": "FINISHES",
-                    "color": "#6B8B6B",
-                    "items": [
-                        {"name": "Paint color", "finish_color": ""},
-                        {"name": "Wallpaper", "finish_color": ""},
-                        {"name": "Finish", "finish_color": ""}
-                    ]
-                }
-            ]
-        }
-    ]
-}
\ No newline at end of file
+
+@lru_cache(maxsize=None)
+def load_room_structures() -> Dict[str, Any]:
+    """All room structures, keyed 'comprehensive', 'intelligent' and 'default' (read once)"""
+    with open(ROOM_STRUCTURES_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def __getattr__(name: str):
+    if name in _STRUCTURE_NAMES:
+        return load_room_structures()[_STRUCTURE_NAMES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
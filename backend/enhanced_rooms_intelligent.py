@@ -1,523 +1,12 @@
 # INTELLIGENT INTERIOR DESIGN ROOM STRUCTURE WITH PROPER SUBCATEGORIZATION
 # Created using AI to intelligently divide categories into logical subcategories
+#
+# Stored under 'intelligent' in room_structures.json and loaded on first access
 
-INTELLIGENT_ROOM_STRUCTURE = {
-    "kitchen": {
-        "categories": [
-            {
-                "name": "Plumbing",
-                "color": "#4A90E2",
-                "subcategories": [
-                    {
-                        "name": "FIXTURES",
-                        "color": "#6BA3E6",
-                        "items": [
-                            {"name": "Kitchen Faucet", "finish_color": ""},
-                            {"name": "Soap Dispenser", "finish_color": ""},
-                            {"name": "Water Filter System", "finish_color": ""},
-                            {"name": "Pot Filler", "finish_color": ""},
-                            {"name": "Garbage Disposal", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "SINKS",
-                        "color": "#6BA3E6", 
-                        "items": [
-                            {"name": "Primary Sink", "finish_color": ""},
-                            {"name": "Prep Sink", "finish_color": ""},
-                            {"name": "Bar Sink", "finish_color": ""},
-                            {"name": "Sink Accessories", "finish_color": ""},
-                            {"name": "Drain Assembly", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Cabinets & Millwork",
-                "color": "#8B4513",
-                "subcategories": [
-                    {
-                        "name": "BASE CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Base Cabinet Boxes", "finish_color": ""},
-                            {"name": "Base Cabinet Doors", "finish_color": ""},
-                            {"name": "Base Cabinet Drawers", "finish_color": ""},
-                            {"name": "Cabinet Hardware", "finish_color": ""},
-                            {"name": "Soft Close Hinges", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "UPPER CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Upper Cabinet Boxes", "finish_color": ""},
-                            {"name": "Upper Cabinet Doors", "finish_color": ""},
-                            {"name": "Glass Doors", "finish_color": ""},
-                            {"name": "Open Shelving", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "SPECIALTY CABINETS",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Pantry Cabinets", "finish_color": ""},
-                            {"name": "Island Cabinets", "finish_color": ""},
-                            {"name": "Corner Cabinets", "finish_color": ""},
-                            {"name": "Wine Storage", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "TRIM & MOLDING",
-                        "color": "#A0522D",
-                        "items": [
-                            {"name": "Crown Molding", "finish_color": ""},
-                            {"name": "Base Trim", "finish_color": ""},
-                            {"name": "Filler Strips", "finish_color": ""},
-                            {"name": "Toe Kicks", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Appliances",
-                "color": "#2E8B57",
-                "subcategories": [
-                    {
-                        "name": "COOKING",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Range/Cooktop", "finish_color": ""},
-                            {"name": "Wall Oven", "finish_color": ""},
-                            {"name": "Microwave", "finish_color": ""},
-                            {"name": "Range Hood", "finish_color": ""},
-                            {"name": "Warming Drawer", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "REFRIGERATION",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Refrigerator", "finish_color": ""},
-                            {"name": "Freezer", "finish_color": ""},
-                            {"name": "Wine Refrigerator", "finish_color": ""},
-                            {"name": "Ice Maker", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "CLEANUP",
-                        "color": "#3CB371",
-                        "items": [
-                            {"name": "Dishwasher", "finish_color": ""},
-                            {"name": "Trash Compactor", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Lighting",
-                "color": "#FFD700",
-                "subcategories": [
-                    {
-                        "name": "TASK LIGHTING",
-                        "color": "#FFED4E",
-                        "items": [
-                            {"name": "Under Cabinet Lights", "finish_color": ""},
-                            {"name": "Pendant Lights", "finish_color": ""},
-                            {"name": "Island Lighting", "finish_color": ""},
-                            {"name": "Recessed Task Lights", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "AMBIENT LIGHTING",
-                        "color": "#FFED4E",
-                        "items": [
-                            {"name": "Chandelier", "finish_color": ""},
-                            {"name": "Ceiling Fixture", "finish_color": ""},
-                            {"name": "Cove Lighting", "finish_color": ""},
-                            {"name": "Toe Kick Lighting", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "ACCENT LIGHTING",
-                        "color": "#FFED4E",
-                        "items": [
-                            {"name": "Cabinet Interior Lights", "finish_color": ""},
-                            {"name": "Display Lighting", "finish_color": ""},
-                            {"name": "Backsplash Lighting", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Surfaces & Finishes",
-                "color": "#8A2BE2",
-                "subcategories": [
-                    {
-                        "name": "COUNTERTOPS",
-                        "color": "#9932CC",
-                        "items": [
-                            {"name": "Primary Countertops", "finish_color": ""},
-                            {"name": "Island Countertops", "finish_color": ""},
-                            {"name": "Backsplash", "finish_color": ""},
-                            {"name": "Edge Treatments", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "FLOORING",
-                        "color": "#9932CC",
-                        "items": [
-                            {"name": "Main Flooring", "finish_color": ""},
-                            {"name": "Transition Strips", "finish_color": ""},
-                            {"name": "Baseboards", "finish_color": ""},
-                            {"name": "Quarter Round", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "WALL FINISHES",
-                        "color": "#9932CC",
-                        "items": [
-                            {"name": "Paint Color", "finish_color": ""},
-                            {"name": "Wall Texture", "finish_color": ""},
-                            {"name": "Accent Wall", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    "living room": {
-        "categories": [
-            {
-                "name": "Furniture",
-                "color": "#CD853F",
-                "subcategories": [
-                    {
-                        "name": "SEATING",
-                        "color": "#D2B48C",
-                        "items": [
-                            {"name": "Sofa", "finish_color": ""},
-                            {"name": "Sectional", "finish_color": ""},
-                            {"name": "Accent Chairs", "finish_color": ""},
-                            {"name": "Ottoman", "finish_color": ""},
-                            {"name": "Loveseat", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "TABLES",
-                        "color": "#D2B48C",
-                        "items": [
-                            {"name": "Coffee Table", "finish_color": ""},
-                            {"name": "End Tables", "finish_color": ""},
-                            {"name": "Console Table", "finish_color": ""},
-                            {"name": "Nesting Tables", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "STORAGE",
-                        "color": "#D2B48C",
-                        "items": [
-                            {"name": "Entertainment Center", "finish_color": ""},
-                            {"name": "Bookshelf", "finish_color": ""},
-                            {"name": "Storage Bench", "finish_color": ""},
-                            {"name": "Media Console", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Lighting",
-                "color": "#4169E1",
-                "subcategories": [
-                    {
-                        "name": "OVERHEAD",
-                        "color": "#6495ED",
-                        "items": [
-                            {"name": "Chandelier", "finish_color": ""},
-                            {"name": "Ceiling Fan", "finish_color": ""},
-                            {"name": "Recessed Lights", "finish_color": ""},
-                            {"name": "Track Lighting", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "TABLE & FLOOR",
-                        "color": "#6495ED",
-                        "items": [
-                            {"name": "Table Lamps", "finish_color": ""},
-                            {"name": "Floor Lamps", "finish_color": ""},
-                            {"name": "Reading Lamps", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "ACCENT",
-                        "color": "#6495ED",
-                        "items": [
-                            {"name": "Sconces", "finish_color": ""},
-                            {"name": "Picture Lights", "finish_color": ""},
-                            {"name": "Accent Lighting", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Window Treatments",
-                "color": "#8FBC8F",
-                "subcategories": [
-                    {
-                        "name": "DRAPERY",
-                        "color": "#98FB98",
-                        "items": [
-                            {"name": "Curtains", "finish_color": ""},
-                            {"name": "Drapes", "finish_color": ""},
-                            {"name": "Valances", "finish_color": ""},
-                            {"name": "Tiebacks", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "BLINDS & SHADES",
-                        "color": "#98FB98",
-                        "items": [
-                            {"name": "Venetian Blinds", "finish_color": ""},
-                            {"name": "Roller Shades", "finish_color": ""},
-                            {"name": "Roman Shades", "finish_color": ""},
-                            {"name": "Cellular Shades", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "HARDWARE",
-                        "color": "#98FB98",
-                        "items": [
-                            {"name": "Curtain Rods", "finish_color": ""},
-                            {"name": "Brackets", "finish_color": ""},
-                            {"name": "Finials", "finish_color": ""},
-                            {"name": "Rings/Hooks", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    "master bedroom": {
-        "categories": [
-            {
-                "name": "Furniture",
-                "color": "#DDA0DD",
-                "subcategories": [
-                    {
-                        "name": "BEDROOM SET",
-                        "color": "#E6B8E6",
-                        "items": [
-                            {"name": "Bed Frame", "finish_color": ""},
-                            {"name": "Headboard", "finish_color": ""},
-                            {"name": "Footboard", "finish_color": ""},
-                            {"name": "Nightstands", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "STORAGE",
-                        "color": "#E6B8E6",
-                        "items": [
-                            {"name": "Dresser", "finish_color": ""},
-                            {"name": "Chest of Drawers", "finish_color": ""},
-                            {"name": "Armoire", "finish_color": ""},
-                            {"name": "Bench", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "SEATING",
-                        "color": "#E6B8E6",
-                        "items": [
-                            {"name": "Reading Chair", "finish_color": ""},
-                            {"name": "Chaise Lounge", "finish_color": ""},
-                            {"name": "Vanity Chair", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Closet Systems",
-                "color": "#B8860B",
-                "subcategories": [
-                    {
-                        "name": "ORGANIZERS",
-                        "color": "#DAA520",
-                        "items": [
-                            {"name": "Closet Rods", "finish_color": ""},
-                            {"name": "Shelving Systems", "finish_color": ""},
-                            {"name": "Shoe Racks", "finish_color": ""},
-                            {"name": "Drawer Units", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "ACCESSORIES",
-                        "color": "#DAA520",
-                        "items": [
-                            {"name": "Hampers", "finish_color": ""},
-                            {"name": "Jewelry Storage", "finish_color": ""},
-                            {"name": "Tie Racks", "finish_color": ""},
-                            {"name": "Belt Holders", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    "bathroom": {
-        "categories": [
-            {
-                "name": "Plumbing Fixtures",
-                "color": "#20B2AA",
-                "subcategories": [
-                    {
-                        "name": "BATHING",
-                        "color": "#48D1CC",
-                        "items": [
-                            {"name": "Bathtub", "finish_color": ""},
-                            {"name": "Shower Base", "finish_color": ""},
-                            {"name": "Shower Doors", "finish_color": ""},
-                            {"name": "Shower Hardware", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "VANITY",
-                        "color": "#48D1CC",
-                        "items": [
-                            {"name": "Sink", "finish_color": ""},
-                            {"name": "Faucet", "finish_color": ""},
-                            {"name": "Vanity Cabinet", "finish_color": ""},
-                            {"name": "Countertop", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "TOILET",
-                        "color": "#48D1CC",
-                        "items": [
-                            {"name": "Toilet", "finish_color": ""},
-                            {"name": "Toilet Seat", "finish_color": ""},
-                            {"name": "Bidet", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Tile & Stone",
-                "color": "#A0522D",
-                "subcategories": [
-                    {
-                        "name": "FLOOR TILE",
-                        "color": "#CD853F",
-                        "items": [
-                            {"name": "Main Floor Tile", "finish_color": ""},
-                            {"name": "Border Tile", "finish_color": ""},
-                            {"name": "Accent Tile", "finish_color": ""},
-                            {"name": "Grout", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "WALL TILE",
-                        "color": "#CD853F",
-                        "items": [
-                            {"name": "Shower Tile", "finish_color": ""},
-                            {"name": "Backsplash Tile", "finish_color": ""},
-                            {"name": "Accent Wall Tile", "finish_color": ""},
-                            {"name": "Trim Tile", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    "dining room": {
-        "categories": [
-            {
-                "name": "Furniture",
-                "color": "#8B0000",
-                "subcategories": [
-                    {
-                        "name": "DINING SET",
-                        "color": "#B22222",
-                        "items": [
-                            {"name": "Dining Table", "finish_color": ""},
-                            {"name": "Dining Chairs", "finish_color": ""},
-                            {"name": "Head Chairs", "finish_color": ""},
-                            {"name": "Bench", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "STORAGE",
-                        "color": "#B22222",
-                        "items": [
-                            {"name": "China Cabinet", "finish_color": ""},
-                            {"name": "Buffet", "finish_color": ""},
-                            {"name": "Sideboard", "finish_color": ""},
-                            {"name": "Wine Cabinet", "finish_color": ""}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Lighting",
-                "color": "#FFD700",
-                "subcategories": [
-                    {
-                        "name": "OVERHEAD",
-                        "color": "#FFED4E",
-                        "items": [
-                            {"name": "Chandelier", "finish_color": ""},
-                            {"name": "Pendant Lights", "finish_color": ""},
-                            {"name": "Recessed Lights", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "ACCENT",
-                        "color": "#FFED4E",
-                        "items": [
-                            {"name": "Buffet Lamps", "finish_color": ""},
-                            {"name": "Sconces", "finish_color": ""},
-                            {"name": "Cabinet Lighting", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    },
-    "office": {
-        "categories": [
-            {
-                "name": "Furniture",
-                "color": "#2F4F4F",
-                "subcategories": [
-                    {
-                        "name": "DESK SETUP",
-                        "color": "#696969",
-                        "items": [
-                            {"name": "Desk", "finish_color": ""},
-                            {"name": "Office Chair", "finish_color": ""},
-                            {"name": "Desk Accessories", "finish_color": ""},
-                            {"name": "Monitor Stand", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "STORAGE",
-                        "color": "#696969",
-                        "items": [
-                            {"name": "Filing Cabinet", "finish_color": ""},
-                            {"name": "Bookshelf", "finish_color": ""},
-                            {"name": "Storage Cabinet", "finish_color": ""},
-                            {"name": "Credenza", "finish_color": ""}
-                        ]
-                    },
-                    {
-                        "name": "SEATING",
-                        "color": "#696969",
-                        "items": [
-                            {"name": "Guest Chair", "finish_color": ""},
-                            {"name": "Reading Chair", "finish_color": ""},
-                            {"name": "Conference Chairs", "finish_color": ""}
-                        ]
-                    }
-                ]
-            }
-        ]
-    }
-}
\ No newline at end of file
+from enhanced_rooms import load_room_structures
+
+
+def __getattr__(name: str):
+    if name == 'INTELLIGENT_ROOM_STRUCTURE':
+        return load_room_structures()['intelligent']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
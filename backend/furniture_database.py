@@ -5,15 +5,27 @@ Revolutionary database that scrapes all furniture vendor sites into one searchab
 import asyncio
 import aiohttp
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 from playwright.async_api import async_playwright
 import re
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 import os
 from dotenv import load_dotenv
+from furniture_sitemaps import UrlFrontier, iter_sitemap_urls, product_url_matcher, canonicalize_product_url
+from vendor_profiles import load_vendor_profiles, get_vendor_profile
+from furniture_similarity import refresh_similarity_index
+from furniture_dimensions import (
+    DIMENSION_FIELDS, DIMENSION_PARSER_VERSION, parse_dimensions, size_conditions,
+    ensure_dimension_indexes, backfill_dimensions
+)
+from furniture_duplicates import (
+    SIGNATURE_PROJECTION, signature_fields, link_duplicates, collapse_duplicates, sign_unsigned_products
+)
+from furniture_prices import detect_change, record_price_observations
 
 load_dotenv()
 
@@ -23,112 +35,71 @@ client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ.get('DB_NAME', 'interior_design_db')]
 
 # COMPREHENSIVE VENDOR CONFIGURATION
-VENDOR_SITES = {
-    'Four Hands': {
-        'base_url': 'https://fourhands.com',
-        'search_paths': [
-            '/collections/seating',
-            '/collections/tables',
-            '/collections/lighting',
-            '/collections/storage',
-            '/collections/bedroom',
-            '/collections/dining',
-            '/collections/office'
-        ],
-        'product_selectors': {
-            'name': 'h1.product-title, .product-info h1',
-            'price': '.price, .product-price, .current-price',
-            'image': '.product-gallery img, .product-images img',
-            'description': '.product-description, .product-details',
-            'sku': '.product-sku, .sku',
-            'dimensions': '.dimensions, .product-dimensions',
-            'materials': '.materials, .product-materials'
-        }
-    },
-    'Uttermost': {
-        'base_url': 'https://uttermost.com',
-        'search_paths': [
-            '/lighting',
-            '/furniture',
-            '/mirrors',
-            '/wall-art',
-            '/accessories',
-            '/rugs'
-        ],
-        'product_selectors': {
-            'name': 'h1.product-title, .product-name h1',
-            'price': '.price-box .price, .product-price',
-            'image': '.product-media img, .featured-image img',
-            'description': '.product-description',
-            'sku': '.product-sku',
-            'dimensions': '.dimensions',
-            'materials': '.materials'
-        }
-    },
-    'Bernhardt': {
-        'base_url': 'https://bernhardt.com',
-        'search_paths': [
-            '/furniture/living-room',
-            '/furniture/dining-room', 
-            '/furniture/bedroom',
-            '/furniture/office',
-            '/furniture/outdoor'
-        ],
-        'product_selectors': {
-            'name': '.product-info h1, h1.product-title',
-            'price': '.pricing .price, .product-pricing',
-            'image': '.product-slider img, .product-images img',
-            'description': '.product-description',
-            'sku': '.product-code, .sku',
-            'dimensions': '.specifications .dimensions',
-            'materials': '.specifications .materials'
-        }
-    },
-    'Visual Comfort': {
-        'base_url': 'https://visualcomfort.com',
-        'search_paths': [
-            '/lighting/chandeliers',
-            '/lighting/pendants',
-            '/lighting/table-lamps',
-            '/lighting/floor-lamps',
-            '/lighting/sconces',
-            '/lighting/ceiling'
-        ],
-        'product_selectors': {
-            'name': '.product-header h1, h1.product-title',
-            'price': '.pricing .current-price, .product-price',
-            'image': '.product-gallery .main img, .zoom-image img',
-            'description': '.product-details, .description',
-            'sku': '.product-number, .sku',
-            'dimensions': '.specifications .size',
-            'materials': '.specifications .finish'
-        }
-    },
-    'Loloi Rugs': {
-        'base_url': 'https://loloirugs.com',
-        'search_paths': [
-            '/collections/traditional',
-            '/collections/contemporary',
-            '/collections/vintage',
-            '/collections/outdoor',
-            '/collections/pillows'
-        ],
-        'product_selectors': {
-            'name': '.product-info h1, h1.product-title',
-            'price': '.price, .product-price',
-            'image': '.product-photos img, .featured img',
-            'description': '.product-description',
-            'sku': '.product-sku',
-            'dimensions': '.size-options, .dimensions',
-            'materials': '.construction, .materials'
+# Vendor settings and extraction rules live in vendor_profiles.json (see vendor_profiles.py)
+VENDOR_SITES = {vendor: profile.site_config() for vendor, profile in load_vendor_profiles().items()}
+
+# Common product link selectors across furniture sites
+PRODUCT_LINK_SELECTORS = [
+    'a[href*="/products/"]',
+    'a[href*="/product/"]',
+    'a[href*="/items/"]',
+    '.product-item a',
+    '.product-card a',
+    '.product-grid a'
+]
+
+NEXT_PAGE_SELECTORS = [
+    'link[rel="next"]',
+    'a[rel="next"]',
+    '.pagination .next a',
+    '.pagination a.next',
+    'a.pagination__next'
+]
+
+# Products scraped per vendor per run from the sitemap frontier (newest first)
+SITEMAP_SCRAPE_LIMIT = 500
+# Stored products are re-scraped after this long even when the sitemap shows no
+# change: many vendors omit <lastmod> or don't bump it on price/stock edits
+PRODUCT_MAX_AGE = timedelta(days=7)
+
+# Products scraped per category page when a vendor has no usable sitemap
+LISTING_SCRAPE_LIMIT = 20
+
+# Listing traversal limits per category
+MAX_PRODUCT_LINKS = 5000
+MAX_LISTING_PAGES = 50
+MAX_SCROLLS = 30
+SCROLL_WAIT_MS = 1500
+
+# Runs in the page: every product link (already resolved to absolute by the browser),
+# the next listing page if any, and optionally scrolls to trigger infinite loading
+COLLECT_LINKS_SCRIPT = """
+({linkSelectors, nextSelectors, scroll}) => {
+    const links = Array.from(
+        document.querySelectorAll(linkSelectors.join(',')),
+        element => element.href
+    ).filter(Boolean);
+    let next = null;
+    for (const selector of nextSelectors) {
+        const element = document.querySelector(selector);
+        if (element && element.href) {
+            next = element.href;
+            break;
         }
     }
+    if (scroll) {
+        window.scrollTo(0, document.body.scrollHeight);
+    }
+    return {links, next, height: document.body.scrollHeight};
 }
+"""
 
 class FurnitureDatabase:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.scraped_products = []
+        # Per-product field extraction time in milliseconds for the current run (page load excluded)
+        self.extraction_ms = []
         
     async def scrape_all_vendors(self) -> Dict[str, Any]:
         """
@@ -136,6 +107,8 @@ class FurnitureDatabase:
         This is the revolutionary function that creates "THE DREAM"
         """
         self.logger.info("🚀 Starting UNIFIED FURNITURE DATABASE scraping...")
+        # The instance is a module-level singleton; only this run's timings go into avg_extraction_ms
+        self.extraction_ms = []
         
         results = {
             'total_products': 0,
@@ -170,13 +143,98 @@ class FurnitureDatabase:
             save_results = await self._save_to_database(self.scraped_products)
             results['new_products'] = save_results['new_count']
             results['updated_products'] = save_results['updated_count']
+            
+            # Refresh similar-products vectors; only new or edited products are re-tokenized
+            try:
+                await refresh_similarity_index(db)
+            except Exception as e:
+                results['errors'].append(f"Similarity index refresh failed: {str(e)}")
+        
+        if self.extraction_ms:
+            results['avg_extraction_ms'] = round(sum(self.extraction_ms) / len(self.extraction_ms), 2)
         
         self.logger.info(f"🎉 FURNITURE DATABASE COMPLETE: {results['total_products']} products from {results['vendors_scraped']} vendors")
         
         return results
     
     async def _scrape_vendor(self, browser, vendor_name: str, config: Dict) -> Dict[str, Any]:
-        """Scrape all products from a specific vendor"""
+        """
+        Scrape products from a specific vendor
+        Product pages come from the vendor's sitemaps when it publishes any;
+        rendering category listing pages is only the fallback
+        """
+        frontier = await self._discover_from_sitemaps(vendor_name, config)
+        if frontier is None:
+            return await self._scrape_vendor_listings(browser, vendor_name, config)
+        
+        page = await browser.new_page()
+        products_found = 0
+        
+        try:
+            for product_url, lastmod, _ in frontier.pop_batch(SITEMAP_SCRAPE_LIMIT):
+                try:
+                    product_data = await self._scrape_single_product(page, product_url, vendor_name)
+                    
+                    if product_data:
+                        product_data['sitemap_lastmod'] = lastmod
+                        self.scraped_products.append(product_data)
+                        products_found += 1
+                        
+                except Exception as e:
+                    self.logger.warning(f"Failed to scrape product {product_url}: {str(e)}")
+                    continue
+        
+        finally:
+            await page.close()
+        
+        return {'products_found': products_found, 'products_pending': len(frontier)}
+    
+    async def _discover_from_sitemaps(self, vendor_name: str, config: Dict) -> Optional[UrlFrontier]:
+        """
+        Queue the vendor's product pages from its sitemaps, skipping pages whose
+        lastmod shows no change since a scrape newer than PRODUCT_MAX_AGE
+        Changed pages come first (newest lastmod first), then the rest oldest-scraped first
+        Returns None when the sitemaps list no product pages at all
+        """
+        frontier = UrlFrontier()
+        is_product = product_url_matcher(config)
+        candidates = {}
+        
+        try:
+            async with aiohttp.ClientSession(headers={'User-Agent': 'Mozilla/5.0'}) as session:
+                async for loc, lastmod in iter_sitemap_urls(session, config['base_url'], config.get('sitemap_urls')):
+                    canonical = canonicalize_product_url(loc, config['base_url'])
+                    if canonical and is_product.search(canonical):
+                        candidates[canonical] = lastmod
+        except Exception as e:
+            self.logger.warning(f"Sitemap discovery failed for {vendor_name}: {str(e)}")
+        
+        if not candidates:
+            return None
+        
+        scraped_at = {}
+        urls = list(candidates)
+        for start in range(0, len(urls), 1000):
+            cursor = db.furniture_products.find(
+                {'url': {'$in': urls[start:start + 1000]}}, {'url': 1, 'scraped_at': 1}
+            )
+            async for doc in cursor:
+                scraped_at[doc['url']] = doc.get('scraped_at')
+        
+        stale_before = datetime.utcnow() - PRODUCT_MAX_AGE
+        for url, lastmod in sorted(candidates.items(), key=lambda entry: scraped_at.get(entry[0]) or datetime.min):
+            previous = scraped_at.get(url)
+            unchanged = previous and lastmod is not None and lastmod <= previous
+            if unchanged and previous >= stale_before:
+                continue
+            # Unchanged-but-stale pages queue behind real changes
+            frontier.push(url, None if unchanged else lastmod)
+        
+        self.logger.info(f"🗺️ {vendor_name}: {len(candidates)} products in sitemaps, {len(frontier)} new, changed, undated or stale")
+        return frontier
+    
+    async def _scrape_vendor_listings(self, browser, vendor_name: str, config: Dict) -> Dict[str, Any]:
+        """Scrape products found by rendering the vendor's category pages"""
         page = await browser.new_page()
         products_found = 0
         
@@ -187,15 +245,13 @@ class FurnitureDatabase:
                 try:
                     await page.goto(url, wait_until='networkidle', timeout=30000)
                     
-                    # Get all product links on this category page
-                    product_links = await self._extract_product_links(page, config['base_url'])
+                    # Stop paginating/scrolling once there are enough links to scrape
+                    product_links = await self._extract_product_links(page, config['base_url'], LISTING_SCRAPE_LIMIT)
                     
                     # Scrape each individual product
-                    for product_url in product_links[:20]:  # Limit to 20 per category for now
+                    for product_url in product_links:
                         try:
-                            product_data = await self._scrape_single_product(
-                                page, product_url, vendor_name, config['product_selectors']
-                            )
+                            product_data = await self._scrape_single_product(page, product_url, vendor_name)
                             
                             if product_data:
                                 self.scraped_products.append(product_data)
@@ -214,90 +270,80 @@ class FurnitureDatabase:
         
         return {'products_found': products_found}
     
-    async def _extract_product_links(self, page, base_url: str) -> List[str]:
-        """Extract all product links from a category page"""
+    async def _extract_product_links(self, page, base_url: str, max_links: int = MAX_PRODUCT_LINKS) -> List[str]:
+        """
+        Extract all product links from a category page, following rel=next
+        pagination and infinite scroll; one evaluate call per page or scroll step
+        """
+        product_links = {}  # insertion-ordered set of canonical URLs
+        visited_pages = {page.url}
+        pages = 1
+        scrolls = 0
+        
         try:
-            # Common product link selectors across furniture sites
-            link_selectors = [
-                'a[href*="/products/"]',
-                'a[href*="/product/"]', 
-                'a[href*="/items/"]',
-                '.product-item a',
-                '.product-card a',
-                '.product-grid a'
-            ]
-            
-            product_links = []
-            
-            for selector in link_selectors:
-                elements = await page.query_selector_all(selector)
-                for element in elements:
-                    href = await element.get_attribute('href')
-                    if href:
-                        # Make absolute URL
-                        if href.startswith('/'):
-                            href = base_url + href
-                        elif not href.startswith('http'):
-                            continue
-                        
-                        if href not in product_links:
-                            product_links.append(href)
-            
-            return product_links[:50]  # Limit for performance
+            while True:
+                collected = await page.evaluate(COLLECT_LINKS_SCRIPT, {
+                    'linkSelectors': PRODUCT_LINK_SELECTORS,
+                    'nextSelectors': NEXT_PAGE_SELECTORS,
+                    'scroll': scrolls < MAX_SCROLLS
+                })
+                
+                found_before = len(product_links)
+                for href in collected['links']:
+                    canonical = canonicalize_product_url(href, base_url)
+                    if canonical:
+                        product_links.setdefault(canonical, None)
+                if len(product_links) >= max_links:
+                    break
+                
+                next_page = collected['next']
+                if next_page and next_page not in visited_pages and pages < MAX_LISTING_PAGES:
+                    visited_pages.add(next_page)
+                    pages += 1
+                    scrolls = 0
+                    await page.goto(next_page, wait_until='networkidle', timeout=30000)
+                    continue
+                
+                # Infinite scroll: keep going while scrolling keeps loading new products
+                if scrolls >= MAX_SCROLLS or (scrolls and len(product_links) == found_before):
+                    break
+                scrolls += 1
+                await page.wait_for_timeout(SCROLL_WAIT_MS)
             
         except Exception as e:
             self.logger.error(f"Failed to extract product links: {str(e)}")
-            return []
+        
+        return list(product_links)[:max_links]
     
-    async def _scrape_single_product(self, page, product_url: str, vendor: str, selectors: Dict) -> Optional[Dict]:
-        """Scrape detailed information from a single product page"""
+    async def _scrape_single_product(self, page, product_url: str, vendor: str) -> Optional[Dict]:
+        """Scrape detailed information from a single product page using the vendor's profile"""
         try:
             await page.goto(product_url, wait_until='networkidle', timeout=20000)
+            profile = get_vendor_profile(vendor)
+            
+            # One HTML snapshot, parsed server-side by the compiled profile
+            started = time.perf_counter()
+            html = await page.content()
+            fields, sources = await asyncio.to_thread(profile.extract, html, product_url)
+            self.extraction_ms.append((time.perf_counter() - started) * 1000)
             
             product_data = {
                 'vendor': vendor,
                 'url': product_url,
                 'scraped_at': datetime.utcnow(),
-                'name': '',
-                'price': '',
-                'image_url': '',
-                'description': '',
-                'sku': '',
-                'dimensions': '',
-                'materials': '',
+                'name': fields['name'] or '',
+                'price': fields['price'] or '',
+                'image_url': fields['image'] or '',
+                'description': fields['description'] or '',
+                'sku': fields['sku'] or '',
+                'dimensions': fields['dimensions'] or '',
+                'materials': fields['materials'] or '',
                 'category': self._extract_category_from_url(product_url),
-                'availability': 'Available'  # Default
+                'availability': fields['availability'] or 'Available',  # Default when the page doesn't say
+                'profile_version': profile.version,
+                'extraction_sources': sources
             }
             
-            # Extract each field using the vendor-specific selectors
-            for field, selector in selectors.items():
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        if field == 'image':
-                            src = await element.get_attribute('src')
-                            if src:
-                                # Make absolute URL
-                                if src.startswith('//'):
-                                    src = 'https:' + src
-                                elif src.startswith('/'):
-                                    src = urljoin(product_url, src)
-                                product_data['image_url'] = src
-                        else:
-                            text = await element.text_content()
-                            if text and text.strip():
-                                if field == 'price':
-                                    # Extract price with regex
-                                    price_match = re.search(r'\$[\d,]+\.?\d*', text)
-                                    if price_match:
-                                        product_data['price'] = price_match.group().replace(',', '')
-                                else:
-                                    product_data[field] = text.strip()[:500]  # Limit length
-                                    
-                except Exception as e:
-                    self.logger.debug(f"Failed to extract {field}: {str(e)}")
-                    continue
-            
             # Only return if we got essential data
             if product_data['name'] and (product_data['price'] or product_data['image_url']):
                 return product_data
@@ -343,6 +389,8 @@ class FurnitureDatabase:
         """Save scraped products to MongoDB with deduplication"""
         new_count = 0
         updated_count = 0
+        saved_ids = []
+        price_observations = []
         
         try:
             for product in products:
@@ -356,17 +404,42 @@ class FurnitureDatabase:
                 product['unique_id'] = unique_id
                 product['last_updated'] = datetime.utcnow()
                 
+                # Numeric inch sizes for "fits the space" range filters
+                product.update({field: None for field in DIMENSION_FIELDS})
+                product.update(parse_dimensions(product.get('dimensions')))
+                product['dimensions_parsed'] = DIMENSION_PARSER_VERSION
+                
+                # MinHash signature + LSH bands for near-duplicate clustering
+                product.update(signature_fields(product))
+                
+                # Price/availability change against the stored copy, before it is overwritten
+                change = detect_change(existing, product)
+                product['price_tracked'] = True
+                
                 if existing:
                     # Update existing product
                     await db.furniture_products.update_one(
                         {'unique_id': unique_id},
                         {'$set': product}
                     )
+                    saved_ids.append(existing['_id'])
                     updated_count += 1
                 else:
                     # Insert new product
-                    await db.furniture_products.insert_one(product)
+                    result = await db.furniture_products.insert_one(product)
+                    saved_ids.append(result.inserted_id)
                     new_count += 1
+                
+                if change:
+                    price_observations.append({'product': dict(product, _id=saved_ids[-1]), 'change': change})
+            
+            # Append-only price history; alerts for changes on products used in projects
+            prices = await record_price_observations(db, price_observations)
+            self.logger.info(f"💲 Price history: {prices['changes']} changes, {prices['alerts']} project alerts")
+            
+            # Link only this batch against the catalog via their LSH buckets
+            duplicates = await link_duplicates(db, saved_ids)
+            self.logger.info(f"🔗 Duplicates linked: {duplicates['linked']} products, {duplicates['clusters_merged']} clusters merged")
             
             self.logger.info(f"💾 Database updated: {new_count} new, {updated_count} updated")
             
@@ -407,6 +480,10 @@ class FurnitureDatabase:
                 
                 if filters.get('max_price'):
                     search_conditions.append({'price': {'$regex': f'\\$[0-{filters["max_price"][0]}\\d]'}})
+                
+                # Size filters: 'fits' ("width <= 84in, depth <= 38in") and max_/min_ width/depth/height/diameter in inches
+                for field, condition in size_conditions(filters).items():
+                    search_conditions.append({field: condition})
             
             # Combine all conditions
             if search_conditions:
@@ -415,9 +492,14 @@ class FurnitureDatabase:
                 query_doc = {}
             
             # Execute search
-            cursor = db.furniture_products.find(query_doc).sort('last_updated', -1).limit(100)
+            await ensure_dimension_indexes(db)
+            cursor = db.furniture_products.find(query_doc, SIGNATURE_PROJECTION).sort('last_updated', -1).limit(100)
             results = await cursor.to_list(length=100)
             
+            # One result per duplicate cluster (same piece from several vendors/listings)
+            if filters and filters.get('collapse_duplicates'):
+                results = collapse_duplicates(results)
+            
             return results
             
         except Exception as e:
@@ -433,4 +515,10 @@ async def scrape_all_furniture_vendors():
 
 async def search_unified_furniture(query: str, filters: Optional[Dict] = None):
     """Convenience function to search furniture database"""
-    return await furniture_db.search_furniture(query, filters)
\ No newline at end of file
+    return await furniture_db.search_furniture(query, filters)
+async def backfill_furniture_dimensions():
+    """Convenience function to parse sizes for products saved before dimension parsing"""
+    return await backfill_dimensions(db)
+async def backfill_furniture_duplicates():
+    """Convenience function to sign and cluster products saved before duplicate detection"""
+    return await sign_unsigned_products(db)
@@ -0,0 +1,208 @@
+"""
+Furniture Dimension Parsing
+Turns vendor dimension strings ('84"W x 38"D x 30"H', 'W 213 x D 97 x H 76 cm',
+'36" Dia', "8' x 10'") into numeric inch fields at ingest, and size filters
+("width <= 84in, depth <= 38in") into indexed range queries on furniture_products
+"""
+import re
+from typing import Dict, Any, Optional
+from pymongo import UpdateOne
+
+DIMENSION_FIELDS = ('width_in', 'depth_in', 'height_in', 'diameter_in')
+# Stored as dimensions_parsed; bump when parsing changes so backfill_dimensions re-reads old products
+DIMENSION_PARSER_VERSION = 2
+
+UNIT_TO_INCHES = {'in': 1.0, 'ft': 12.0, 'cm': 1 / 2.54, 'mm': 1 / 25.4}
+
+_LABELS = {
+    'width': 'width_in', 'wide': 'width_in', 'w': 'width_in',
+    'length': 'length', 'long': 'length', 'l': 'length',
+    'depth': 'depth_in', 'deep': 'depth_in', 'd': 'depth_in', 'dp': 'depth_in',
+    'height': 'height_in', 'high': 'height_in', 'tall': 'height_in', 'h': 'height_in', 'ht': 'height_in',
+    'diameter': 'diameter_in', 'diam': 'diameter_in', 'dia': 'diameter_in', 'ø': 'diameter_in',
+}
+# Longest first so 'dia' wins over 'd' and 'width' over 'w'
+_LABEL_ALTERNATION = '|'.join(sorted((re.escape(label) for label in _LABELS), key=len, reverse=True))
+_NUMBER = r'\d+(?:\.\d+)?'
+_UNIT = r'(?:"|\'\'|in(?:ch(?:es)?)?\b|\'|ft\b|feet\b|cm\b|mm\b)'
+
+# 84"W, 84 in. wide, 84w
+_NUMBER_THEN_LABEL = re.compile(
+    rf'(?P<num>{_NUMBER})\s*(?P<unit>{_UNIT})?\.?\s*(?P<label>{_LABEL_ALTERNATION})(?![a-z])'
+)
+# W 84", Width: 84 in, Ø36
+_LABEL_THEN_NUMBER = re.compile(
+    rf'(?<![a-z])(?P<label>{_LABEL_ALTERNATION})\.?\s*[:=]?\s*(?P<num>{_NUMBER})\s*(?P<unit>{_UNIT})?'
+)
+# 84 x 38 x 30 in, 8' x 10'
+_UNLABELED = re.compile(
+    rf'(?P<a>{_NUMBER})\s*(?P<ua>{_UNIT})?\s*x\s*(?P<b>{_NUMBER})\s*(?P<ub>{_UNIT})?'
+    rf'(?:\s*x\s*(?P<c>{_NUMBER})\s*(?P<uc>{_UNIT})?)?'
+)
+# Secondary measurements that must not be read as the piece's overall size
+_SECONDARY_MEASURE = re.compile(
+    rf'\b(?:seat|arm|back|inside|interior|shade|base|cord|canopy|clearance|drawer)\s*'
+    rf'(?:height|depth|width|ht|h|d|w)\b\.?\s*[:=]?\s*{_NUMBER}\s*{_UNIT}?'
+)
+# 5'3", 5' 3", 5 ft 3 in -> total inches
+_FEET_AND_INCHES = re.compile(
+    rf'(?P<feet>\d+)\s*(?:\'|ft\b\.?|feet\b)\s*(?P<inches>{_NUMBER})\s*(?:"|\'\'|in\b\.?|inch(?:es)?\b)'
+)
+# Separators between the parts of a size ("84 W x 38 D", "W: 84, D: 38")
+_PARTS = re.compile(r'\s+x\s+|[,;|]')
+_FRACTION = re.compile(r'(\d+)(?:\s+|-)(\d+)/(\d+)')
+_BARE_FRACTION = re.compile(r'(?<![\d.])(\d+)/(\d+)')
+
+_FILTER = re.compile(
+    rf'(?P<field>width|depth|height|diameter|w|d|h|dia)\s*(?P<op><=|≤|<|>=|≥|>|=)\s*(?P<num>{_NUMBER})\s*(?P<unit>{_UNIT})?'
+)
+_FILTER_FIELDS = {'width': 'width_in', 'w': 'width_in', 'depth': 'depth_in', 'd': 'depth_in',
+                  'height': 'height_in', 'h': 'height_in', 'diameter': 'diameter_in', 'dia': 'diameter_in'}
+_FILTER_OPERATORS = {'<=': '$lte', '≤': '$lte', '<': '$lt', '>=': '$gte', '≥': '$gte', '>': '$gt', '=': '$eq'}
+
+_indexes_ready = False
+
+
+def _normalize(text: str) -> str:
+    text = (text.lower()
+            .replace('×', ' x ').replace('”', '"').replace('″', '"').replace('“', '"')
+            .replace('′', "'").replace('’', "'").replace('⌀', 'ø'))
+    text = _FRACTION.sub(lambda m: str(int(m.group(1)) + int(m.group(2)) / int(m.group(3))), text)
+    text = _BARE_FRACTION.sub(lambda m: str(int(m.group(1)) / int(m.group(2))), text)
+    # Compound sizes first, so 5'3" isn't read as 5 ft and a separate 3 in
+    text = _FEET_AND_INCHES.sub(
+        lambda m: f'{round(int(m.group("feet")) * 12 + float(m.group("inches")), 2):g}"', text
+    )
+    # "84x38" -> "84 x 38" without splitting words like "box"
+    return re.sub(r'(?<=[\d"\'])\s*x\s*(?=\d)', ' x ', text)
+
+
+def _unit_name(unit: Optional[str], default: str) -> str:
+    if not unit:
+        return default
+    if unit in ("'", 'ft', 'feet'):
+        return 'ft'
+    if unit in ('cm', 'mm'):
+        return unit
+    return 'in'
+
+
+def _default_unit(text: str) -> str:
+    if re.search(r'\bcm\b', text) and not re.search(r'"|\bin\b|inch', text):
+        return 'cm'
+    if re.search(r'\bmm\b', text) and not re.search(r'"|\bin\b|inch', text):
+        return 'mm'
+    return 'in'
+
+
+def _to_inches(number: str, unit: Optional[str], default: str) -> float:
+    return round(float(number) * UNIT_TO_INCHES[_unit_name(unit, default)], 2)
+
+
+def parse_dimensions(text: Optional[str]) -> Dict[str, float]:
+    """
+    Numeric width/depth/height/diameter in inches from a dimension string
+    Only fields that could be read are returned; round pieces also get
+    width and depth equal to their diameter so "fits" filters include them
+    """
+    if not text:
+        return {}
+    text = _SECONDARY_MEASURE.sub(' ', _normalize(text))
+    default = _default_unit(text)
+
+    # Labels can follow numbers ('84"W') or precede them ('W 84"'), and the style can
+    # change between parts ('Dia 24" x 30"H'); per part keep the reading that finds
+    # more fields, or on a tie the one matching how the part starts
+    dimensions: Dict[str, float] = {}
+    for part in _PARTS.split(text):
+        number_first, label_first = [
+            {
+                _LABELS[match.group('label')]: _to_inches(match.group('num'), match.group('unit'), default)
+                for match in reversed(list(pattern.finditer(part)))
+            }
+            for pattern in (_NUMBER_THEN_LABEL, _LABEL_THEN_NUMBER)
+        ]
+        if len(number_first) != len(label_first):
+            readings = max(number_first, label_first, key=len)
+        else:
+            readings = number_first if re.match(r'\s*\d', part) else label_first
+        for field, value in readings.items():
+            dimensions.setdefault(field, value)
+
+    if not dimensions:
+        match = _UNLABELED.search(text)
+        if match:
+            # Unlabeled sizes are listed width x depth (x height)
+            trailing_unit = match.group('uc') or match.group('ub')
+            for field, number, unit in (('width_in', 'a', 'ua'), ('depth_in', 'b', 'ub'), ('height_in', 'c', 'uc')):
+                if match.group(number):
+                    dimensions[field] = _to_inches(match.group(number), match.group(unit) or trailing_unit, default)
+
+    # L x W (x H): length is the long side (our width) and the labelled width is the depth
+    length = dimensions.pop('length', None)
+    if length is not None:
+        if 'width_in' in dimensions and 'depth_in' not in dimensions:
+            dimensions['depth_in'] = dimensions['width_in']
+            dimensions['width_in'] = length
+        else:
+            dimensions.setdefault('width_in', length)
+    if 'diameter_in' in dimensions:
+        dimensions.setdefault('width_in', dimensions['diameter_in'])
+        dimensions.setdefault('depth_in', dimensions['diameter_in'])
+    return dimensions
+
+
+def parse_size_filter(text: str) -> Dict[str, Dict[str, float]]:
+    """'width <= 84in, depth <= 38in' -> {'width_in': {'$lte': 84.0}, 'depth_in': {'$lte': 38.0}}"""
+    text = _normalize(text)
+    default = _default_unit(text)
+    conditions: Dict[str, Dict[str, float]] = {}
+    for match in _FILTER.finditer(text):
+        field = _FILTER_FIELDS[match.group('field')]
+        operator = _FILTER_OPERATORS[match.group('op')]
+        conditions.setdefault(field, {})[operator] = _to_inches(match.group('num'), match.group('unit'), default)
+    return conditions
+
+
+def size_conditions(filters: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Range conditions from a 'fits' expression and/or max_*/min_* inch filters"""
+    conditions = parse_size_filter(filters['fits']) if filters.get('fits') else {}
+    for field in DIMENSION_FIELDS:
+        name = field[:-3]
+        for prefix, operator in (('max_', '$lte'), ('min_', '$gte')):
+            value = filters.get(f'{prefix}{name}')
+            if value not in (None, ''):
+                conditions.setdefault(field, {})[operator] = float(value)
+    return conditions
+
+
+async def ensure_dimension_indexes(db) -> None:
+    """Range indexes for size filters (once per process)"""
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    await db.furniture_products.create_index([('width_in', 1), ('depth_in', 1), ('height_in', 1)])
+    await db.furniture_products.create_index('depth_in')
+    await db.furniture_products.create_index('height_in')
+    await db.furniture_products.create_index([('category', 1), ('width_in', 1)])
+    _indexes_ready = True
+
+
+async def backfill_dimensions(db, batch_size: int = 500) -> int:
+    """Parse dimensions for stored products that predate ingest-time parsing or the current parser"""
+    updated = 0
+    operations = []
+    cursor = db.furniture_products.find(
+        {'dimensions': {'$nin': ['', None]}, 'dimensions_parsed': {'$ne': DIMENSION_PARSER_VERSION}},
+        {'dimensions': 1}
+    )
+    async for product in cursor:
+        fields = {field: None for field in DIMENSION_FIELDS}
+        fields.update(parse_dimensions(product['dimensions']))
+        operations.append(UpdateOne({'_id': product['_id']}, {'$set': {**fields, 'dimensions_parsed': DIMENSION_PARSER_VERSION}}))
+        if len(operations) >= batch_size:
+            updated += (await db.furniture_products.bulk_write(operations, ordered=False)).modified_count
+            operations = []
+    if operations:
+        updated += (await db.furniture_products.bulk_write(operations, ordered=False)).modified_count
+    return updated
@@ -0,0 +1,190 @@
+"""
+Near-Duplicate Product Detection
+MinHash signatures over normalized titles and specs, bucketed with LSH banding
+so each newly saved product is compared only with the few products sharing a
+band. Matches are linked into clusters (duplicate_cluster_id) that search
+results can collapse, whether the duplicate is a re-listing by the same vendor
+or the same piece sold by another vendor.
+"""
+import hashlib
+import re
+import zlib
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+from bson import ObjectId
+from pymongo import UpdateOne
+
+NUM_PERMUTATIONS = 128
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+# Estimated Jaccard similarity at which two listings are the same product
+DUPLICATE_THRESHOLD = 0.8
+
+# Fields that must never be sent to API clients
+SIGNATURE_PROJECTION = {'minhash': 0, 'lsh_bands': 0}
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_random = np.random.RandomState(20240601)
+_PERMUTATION_A = _random.randint(1, _MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.int64).astype(np.uint64)
+_PERMUTATION_B = _random.randint(0, _MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.int64).astype(np.uint64)
+
+_WORD_PATTERN = re.compile(r'[a-z0-9]+')
+# Marketing words that vary between listings of the same piece
+_NOISE_WORDS = {'the', 'and', 'with', 'in', 'by', 'of', 'new', 'sale', 'collection', 'set', 'a', 'an'}
+
+_indexes_ready = False
+
+
+def product_shingles(product: Dict[str, Any]) -> set:
+    """Word pairs and character 4-grams of the normalized title, plus spec words"""
+    title_words = [
+        word for word in _WORD_PATTERN.findall(str(product.get('name') or '').lower())
+        if word not in _NOISE_WORDS
+    ]
+    title = ' '.join(title_words)
+    shingles = {f'w:{a} {b}' for a, b in zip(title_words, title_words[1:])}
+    shingles.update(f'c:{title[i:i + 4]}' for i in range(max(len(title) - 3, 1)))
+    for field in ('dimensions', 'materials'):
+        shingles.update(f's:{word}' for word in _WORD_PATTERN.findall(str(product.get(field) or '').lower()))
+    return shingles
+
+
+def minhash_signature(shingles: set) -> np.ndarray:
+    """NUM_PERMUTATIONS minimum hash values (uint32) under (a*x + b) mod p"""
+    if not shingles:
+        return np.full(NUM_PERMUTATIONS, _MERSENNE_PRIME, dtype=np.uint32)
+    values = np.array([zlib.crc32(shingle.encode('utf-8')) & _MERSENNE_PRIME for shingle in shingles], dtype=np.uint64)
+    hashed = (values[:, None] * _PERMUTATION_A[None, :] + _PERMUTATION_B[None, :]) % _MERSENNE_PRIME
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def lsh_bands(signature: np.ndarray) -> List[str]:
+    """One bucket key per band; products sharing any key are candidate duplicates"""
+    return [
+        f"{band}:{hashlib.blake2b(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes(), digest_size=8).hexdigest()}"
+        for band in range(LSH_BANDS)
+    ]
+
+
+def estimated_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.mean(a == b))
+
+
+def signature_fields(product: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields to store with a product so later listings can be matched against it"""
+    signature = minhash_signature(product_shingles(product))
+    return {'minhash': signature.tobytes(), 'lsh_bands': lsh_bands(signature)}
+
+
+def _signature(stored: bytes) -> np.ndarray:
+    return np.frombuffer(stored, dtype=np.uint32)
+
+
+async def ensure_duplicate_indexes(db) -> None:
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    await db.furniture_products.create_index('lsh_bands')
+    await db.furniture_products.create_index('duplicate_cluster_id')
+    _indexes_ready = True
+
+
+async def link_duplicates(db, product_ids: List[ObjectId]) -> Dict[str, int]:
+    """
+    Cluster the given (already saved, signed) products with their near duplicates
+    A cluster is identified by the smallest product id in it; when a product
+    bridges two clusters they are merged
+    """
+    await ensure_duplicate_indexes(db)
+    linked = 0
+    merged = 0
+
+    products = await db.furniture_products.find(
+        {'_id': {'$in': product_ids}, 'minhash': {'$exists': True}},
+        {'minhash': 1, 'lsh_bands': 1, 'duplicate_cluster_id': 1}
+    ).to_list(length=None)
+
+    for product in products:
+        signature = _signature(product['minhash'])
+        candidates = await db.furniture_products.find(
+            {'lsh_bands': {'$in': product['lsh_bands']}, '_id': {'$ne': product['_id']}},
+            {'minhash': 1, 'duplicate_cluster_id': 1}
+        ).to_list(length=None)
+
+        matches = [
+            candidate for candidate in candidates
+            if estimated_similarity(signature, _signature(candidate['minhash'])) >= DUPLICATE_THRESHOLD
+        ]
+        if not matches:
+            # No longer similar to anything (e.g. retitled): leave its old cluster
+            if product.get('duplicate_cluster_id') and product['duplicate_cluster_id'] != str(product['_id']):
+                await db.furniture_products.update_one({'_id': product['_id']}, {'$unset': {'duplicate_cluster_id': ''}})
+            continue
+
+        members = [product] + matches
+        clusters = {member.get('duplicate_cluster_id') for member in members} - {None}
+        cluster_id = min(clusters | {str(member['_id']) for member in members})
+
+        await db.furniture_products.update_many(
+            {'_id': {'$in': [member['_id'] for member in members]}},
+            {'$set': {'duplicate_cluster_id': cluster_id}}
+        )
+        stale = clusters - {cluster_id}
+        if stale:
+            await db.furniture_products.update_many(
+                {'duplicate_cluster_id': {'$in': list(stale)}},
+                {'$set': {'duplicate_cluster_id': cluster_id}}
+            )
+            merged += len(stale)
+        linked += 1
+
+    return {'linked': linked, 'clusters_merged': merged}
+
+
+async def sign_unsigned_products(db, batch_size: int = 500) -> Dict[str, int]:
+    """Backfill signatures for products saved before duplicate detection, then cluster them"""
+    totals = {'signed': 0, 'linked': 0, 'clusters_merged': 0}
+    while True:
+        batch = await db.furniture_products.find(
+            {'minhash': {'$exists': False}}, {'name': 1, 'dimensions': 1, 'materials': 1}
+        ).limit(batch_size).to_list(length=batch_size)
+        if not batch:
+            return totals
+        await db.furniture_products.bulk_write(
+            [UpdateOne({'_id': product['_id']}, {'$set': signature_fields(product)}) for product in batch],
+            ordered=False
+        )
+        result = await link_duplicates(db, [product['_id'] for product in batch])
+        totals['signed'] += len(batch)
+        totals['linked'] += result['linked']
+        totals['clusters_merged'] += result['clusters_merged']
+
+
+def collapse_duplicates(products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep the first result of each duplicate cluster, counting the listings it stands for"""
+    collapsed = []
+    representatives: Dict[str, Dict[str, Any]] = {}
+    for product in products:
+        cluster_id = product.get('duplicate_cluster_id')
+        if cluster_id and cluster_id in representatives:
+            representatives[cluster_id]['duplicate_listings'] += 1
+            continue
+        product['duplicate_listings'] = 1
+        if cluster_id:
+            representatives[cluster_id] = product
+        collapsed.append(product)
+    return collapsed
+
+
+async def get_duplicates(db, product_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Other listings in a product's duplicate cluster (None if the product doesn't exist)"""
+    product = await db.furniture_products.find_one({'_id': ObjectId(product_id)}, {'duplicate_cluster_id': 1})
+    if not product:
+        return None
+    if not product.get('duplicate_cluster_id'):
+        return []
+    return await db.furniture_products.find(
+        {'duplicate_cluster_id': product['duplicate_cluster_id'], '_id': {'$ne': product['_id']}},
+        SIGNATURE_PROJECTION
+    ).to_list(length=None)
@@ -0,0 +1,282 @@
+"""
+Visual Similarity for Catalog Images
+Background pipeline that downloads product images, computes 64-bit perceptual
+hashes (pHash and dHash) in a process pool and stores them on furniture_products;
+near-duplicate lookups use an in-memory BK-tree over the pHashes, so the same
+piece sold by different vendors can be found from any one listing
+"""
+import asyncio
+import io
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+import aiohttp
+import numpy as np
+from PIL import Image
+from pymongo import UpdateOne
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_IMAGE_DOWNLOADS = 16
+IMAGE_DOWNLOAD_TIMEOUT_SECONDS = 20
+MAX_IMAGE_BYTES = 15 * 1024 * 1024
+# Statuses that mean the image is gone for good; anything else non-200 is retried
+PERMANENT_IMAGE_STATUSES = (404, 410)
+# Transient failures wait 1h, 2h, 4h ... up to a day before the next attempt
+IMAGE_RETRY_BASE = timedelta(hours=1)
+IMAGE_RETRY_MAX = timedelta(days=1)
+# Products downloaded, hashed and written per batch
+HASH_WRITE_BATCH = 200
+# Hamming distance (of 64 bits) still considered the same image
+DEFAULT_MAX_DISTANCE = 10
+# Other workers pick up newly hashed images after this long
+IMAGE_INDEX_MAX_AGE_SECONDS = 600
+
+_DCT_SIZE = 32
+_HASH_SIZE = 8
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II basis, so a 2-D DCT is M @ X @ M.T"""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * n + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(_DCT_SIZE)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    value = 0
+    for bit in bits.ravel():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def compute_image_hashes(data: bytes) -> Tuple[int, int]:
+    """(pHash, dHash) of an image as unsigned 64-bit ints; runs in worker processes"""
+    with Image.open(io.BytesIO(data)) as image:
+        gray = image.convert('L')
+        pixels = np.asarray(gray.resize((_DCT_SIZE, _DCT_SIZE), Image.LANCZOS), dtype=np.float64)
+        gradient = np.asarray(gray.resize((_HASH_SIZE + 1, _HASH_SIZE), Image.LANCZOS), dtype=np.int16)
+
+    # pHash: low frequencies of the DCT compared with their median (DC term excluded)
+    low = (_DCT @ pixels @ _DCT.T)[:_HASH_SIZE, :_HASH_SIZE]
+    phash = _bits_to_int(low > np.median(low.ravel()[1:]))
+    # dHash: is each pixel brighter than its right-hand neighbour
+    dhash = _bits_to_int(gradient[:, 1:] > gradient[:, :-1])
+    return phash, dhash
+
+
+def to_signed(value: int) -> int:
+    """MongoDB stores signed int64"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    """Metric tree over 64-bit hashes under Hamming distance"""
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, value: int, item: Any) -> None:
+        self.size += 1
+        if self.root is None:
+            self.root = [value, [item], {}]
+            return
+        node = self.root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> List[Tuple[int, Any]]:
+        """Every (distance, item) within max_distance of value"""
+        results = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= max_distance:
+                results.extend((distance, item) for item in node[1])
+            # Triangle inequality: only children in [d - r, d + r] can hold matches
+            for edge, child in node[2].items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        return results
+
+
+class ImageHashIndex:
+    """BK-tree over pHashes plus each product's hashes and vendor for re-ranking"""
+
+    def __init__(self, products: List[Dict[str, Any]]):
+        self.tree = BKTree()
+        self.products: Dict[str, Dict[str, Any]] = {}
+        for product in products:
+            product_id = str(product['_id'])
+            phash, dhash = to_unsigned(product['image_phash']), to_unsigned(product['image_dhash'])
+            self.products[product_id] = {'phash': phash, 'dhash': dhash, 'vendor': product.get('vendor')}
+            self.tree.add(phash, product_id)
+
+    def similar(self, product_id: str, max_distance: int = DEFAULT_MAX_DISTANCE, k: int = 20,
+                other_vendors_only: bool = False) -> List[Dict[str, Any]]:
+        source = self.products.get(product_id)
+        if source is None:
+            return []
+        matches = []
+        for distance, other_id in self.tree.search(source['phash'], max_distance):
+            other = self.products[other_id]
+            if other_id == product_id or (other_vendors_only and other['vendor'] == source['vendor']):
+                continue
+            matches.append({
+                'product_id': other_id,
+                'phash_distance': distance,
+                'dhash_distance': hamming(source['dhash'], other['dhash'])
+            })
+        matches.sort(key=lambda match: (match['phash_distance'] + match['dhash_distance'], match['product_id']))
+        return matches[:k]
+
+
+_image_index: Optional[ImageHashIndex] = None
+_image_index_built = 0.0
+
+
+async def get_image_index(db) -> ImageHashIndex:
+    """Index of every hashed product image, built on first use and refreshed periodically"""
+    global _image_index, _image_index_built
+    if _image_index is None or time.monotonic() - _image_index_built > IMAGE_INDEX_MAX_AGE_SECONDS:
+        products = await db.furniture_products.find(
+            {'image_phash': {'$exists': True}}, {'image_phash': 1, 'image_dhash': 1, 'vendor': 1}
+        ).to_list(length=None)
+        _image_index = ImageHashIndex(products)
+        _image_index_built = time.monotonic()
+    return _image_index
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt after `attempts` transient failures in a row"""
+    return min(IMAGE_RETRY_BASE * (2 ** max(attempts - 1, 0)), IMAGE_RETRY_MAX)
+
+
+async def _download_image(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                          url: str) -> Tuple[Optional[bytes], bool]:
+    """(image bytes, False) on success, otherwise (None, whether the failure is permanent)"""
+    async with semaphore:
+        try:
+            timeout = aiohttp.ClientTimeout(total=IMAGE_DOWNLOAD_TIMEOUT_SECONDS)
+            async with session.get(url, timeout=timeout) as response:
+                if response.status != 200:
+                    logger.debug(f"Image download for {url} returned {response.status}")
+                    return None, response.status in PERMANENT_IMAGE_STATUSES
+                data = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    data.extend(chunk)
+                    if len(data) > MAX_IMAGE_BYTES:
+                        return None, True
+                return bytes(data), False
+        except Exception as e:
+            # Timeouts, resets and DNS errors are worth another try later
+            logger.debug(f"Image download failed for {url}: {str(e)}")
+            return None, False
+
+
+async def hash_product_images(db, limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Hash every product image that is new or changed since it was last hashed
+    Downloads run concurrently; hashing runs in a process pool off the event loop.
+    Missing (404/410), oversized and undecodable images are marked done for their
+    URL; timeouts, rate limits and server errors are retried after a backoff.
+    """
+    global _image_index
+    query = {
+        'image_url': {'$nin': ['', None]},
+        '$expr': {'$ne': ['$image_url', {'$ifNull': ['$image_hashed_url', None]}]},
+        '$or': [{'image_retry_after': None}, {'image_retry_after': {'$lte': datetime.utcnow()}}]
+    }
+    cursor = db.furniture_products.find(query, {'image_url': 1, 'image_retry_count': 1})
+    if limit:
+        cursor = cursor.limit(limit)
+    products = await cursor.to_list(length=None)
+
+    results = {'candidates': len(products), 'hashed': 0, 'failed': 0, 'retry_later': 0}
+    if not products:
+        return results
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGE_DOWNLOADS)
+    operations = []
+
+    async def process(product, session, pool):
+        data, permanent = await _download_image(session, semaphore, product['image_url'])
+        if data is None:
+            return product, None, permanent
+        try:
+            return product, await loop.run_in_executor(pool, compute_image_hashes, data), False
+        except Exception as e:
+            logger.debug(f"Image hashing failed for {product['image_url']}: {str(e)}")
+            return product, None, True
+
+    with ProcessPoolExecutor() as pool:
+        async with aiohttp.ClientSession(headers={'User-Agent': 'Mozilla/5.0'}) as session:
+            for start in range(0, len(products), HASH_WRITE_BATCH):
+                chunk = products[start:start + HASH_WRITE_BATCH]
+                for product, hashes, permanent in await asyncio.gather(
+                    *(process(product, session, pool) for product in chunk)
+                ):
+                    if hashes is None and not permanent:
+                        # Left unhashed; picked up again once the backoff has passed
+                        attempts = product.get('image_retry_count', 0) + 1
+                        operations.append(UpdateOne({'_id': product['_id']}, {'$set': {
+                            'image_retry_count': attempts,
+                            'image_retry_after': datetime.utcnow() + retry_delay(attempts)
+                        }}))
+                        results['retry_later'] += 1
+                        continue
+                    if hashes is None:
+                        # Not retried until the product's image_url changes
+                        operations.append(UpdateOne({'_id': product['_id']}, {
+                            '$set': {'image_hashed_url': product['image_url'], 'image_hashed_at': datetime.utcnow()},
+                            '$unset': {'image_phash': '', 'image_dhash': '',
+                                       'image_retry_count': '', 'image_retry_after': ''}
+                        }))
+                        results['failed'] += 1
+                        continue
+                    operations.append(UpdateOne({'_id': product['_id']}, {
+                        '$set': {
+                            'image_phash': to_signed(hashes[0]),
+                            'image_dhash': to_signed(hashes[1]),
+                            'image_hashed_url': product['image_url'],
+                            'image_hashed_at': datetime.utcnow()
+                        },
+                        '$unset': {'image_retry_count': '', 'image_retry_after': ''}
+                    }))
+                    results['hashed'] += 1
+                if operations:
+                    await db.furniture_products.bulk_write(operations, ordered=False)
+                    operations = []
+
+    # Rebuilt on next lookup
+    _image_index = None
+    logger.info(f"Image hashing: {results['hashed']} hashed, {results['failed']} failed, "
+                f"{results['retry_later']} to retry")
+    return results
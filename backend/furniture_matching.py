@@ -0,0 +1,226 @@
+"""
+Catalog Auto-Suggest for Checklist Rows
+Maps generic template rows ("Chandelier", "Coffee Table", "Area Rug") to catalog
+keywords and categories once, through an index built from the room structures,
+then ranks catalog products for every row of a room in one pass over the
+similar-products TF-IDF postings. Rows for trade items the furniture vendors
+don't sell (plumbing, appliances, cabinetry, tile) are left without suggestions.
+"""
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+from bson import ObjectId
+
+from enhanced_rooms import load_room_structures
+from furniture_similarity import tokenize, get_similarity_index
+from furniture_duplicates import SIGNATURE_PROJECTION
+
+# Template category (or "category/subcategory") -> catalog category; unmapped categories are not suggested
+CATALOG_CATEGORIES = {
+    'lighting': 'Lighting',
+    'furniture': 'General',
+    'furniture/seating': 'Seating',
+    'furniture/tables': 'Tables',
+    'furniture/storage': 'Storage',
+    'furniture/bedroom set': 'Bedroom',
+    'furniture/dining set': 'Dining Room',
+    'furniture & storage': 'Storage',
+    'textiles & soft goods': 'Rugs & Textiles',
+    'window treatments/drapery': 'Rugs & Textiles',
+    'window treatments/window coverings': 'Rugs & Textiles',
+    'art & accessories': 'Accessories',
+    'art & accessories/art & decor': 'Mirrors & Wall Art',
+    'decor & accessories': 'Accessories',
+    'fireplace & built-ins/fireplace accessories': 'Accessories',
+}
+
+# Head words that settle the catalog category whatever section the row sits in
+KEYWORD_CATEGORIES = {
+    'rug': 'Rugs & Textiles', 'runner': 'Rugs & Textiles', 'pillow': 'Rugs & Textiles', 'throw': 'Rugs & Textiles',
+    'mirror': 'Mirrors & Wall Art', 'art': 'Mirrors & Wall Art', 'artwork': 'Mirrors & Wall Art',
+    'lamp': 'Lighting', 'chandelier': 'Lighting', 'sconce': 'Lighting', 'pendant': 'Lighting',
+    'sofa': 'Seating', 'chair': 'Seating', 'stool': 'Seating', 'bench': 'Seating', 'ottoman': 'Seating',
+    'table': 'Tables', 'desk': 'Tables', 'console': 'Tables',
+    'bed': 'Bedroom', 'nightstand': 'Bedroom', 'dresser': 'Bedroom',
+}
+
+# Query weights: the row's head word, its other words, and its catalog category
+HEAD_WEIGHT = 2.0
+KEYWORD_WEIGHT = 1.0
+CATEGORY_WEIGHT = 0.5
+MAX_SUGGESTIONS = 20
+
+# "Chandelier (Nook)", "Ceiling Fan w/ Light", "Coffee Machine - Built-in"
+_QUALIFIER = re.compile(r'\(.*?\)|\s-\s.*$|\s(?:w/|with)\s.*$')
+
+
+def _singular(word: str) -> str:
+    if word.endswith('ies') and len(word) > 4:
+        return word[:-3] + 'y'
+    if word.endswith(('ches', 'shes', 'xes', 'sses')):
+        return word[:-2]
+    if word.endswith('s') and not word.endswith('ss') and len(word) > 3:
+        return word[:-1]
+    return word
+
+
+def _variants(word: str) -> List[str]:
+    """Singular and plural spellings, so 'Sconces' rows find 'Sconce' products and vice versa"""
+    singular = _singular(word)
+    if re.search(r'[^aeiou]y$', singular):
+        plural = singular[:-1] + 'ies'
+    elif singular.endswith(('s', 'x', 'ch', 'sh')):
+        plural = singular + 'es'
+    else:
+        plural = singular + 's'
+    return list(dict.fromkeys([singular, word, plural]))
+
+
+def _section_category(category: Optional[str], subcategory: Optional[str]) -> Optional[str]:
+    category = (category or '').strip().lower()
+    subcategory = (subcategory or '').strip().lower()
+    return CATALOG_CATEGORIES.get(f'{category}/{subcategory}', CATALOG_CATEGORIES.get(category))
+
+
+def match_profile(name: str, category: Optional[str] = None, subcategory: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Query terms for one checklist row, or None when its section isn't sold by catalog vendors
+    "Area Rug/Runner" -> head words rug/runner (one of them required), keyword area, category Rugs & Textiles
+    """
+    catalog_category = _section_category(category, subcategory)
+    if catalog_category is None:
+        return None
+
+    heads: List[str] = []
+    keywords: List[str] = []
+    for alternative in _QUALIFIER.sub(' ', name.lower()).split('/'):
+        words = [_singular(word) for word in tokenize(alternative)]
+        if not words:
+            continue
+        heads.append(words[-1])
+        keywords.extend(words[:-1])
+    if not heads:
+        return None
+
+    for head in heads:
+        if head in KEYWORD_CATEGORIES:
+            catalog_category = KEYWORD_CATEGORIES[head]
+            break
+
+    terms: Counter = Counter()
+    for head in heads:
+        for variant in _variants(head):
+            terms[variant] = max(terms[variant], HEAD_WEIGHT)
+    for keyword in keywords:
+        for variant in _variants(keyword):
+            terms[variant] = max(terms[variant], KEYWORD_WEIGHT)
+    if catalog_category != 'General':
+        for token in tokenize(catalog_category):
+            terms.setdefault(token, CATEGORY_WEIGHT)
+
+    return {
+        'catalog_category': catalog_category,
+        'keywords': list(dict.fromkeys(heads + keywords)),
+        'terms': dict(terms),
+        'required': [variant for head in heads for variant in _variants(head)]
+    }
+
+
+def _row_key(name: str, category: Optional[str], subcategory: Optional[str]) -> tuple:
+    return (name.strip().lower(), (category or '').strip().lower(), (subcategory or '').strip().lower())
+
+
+@lru_cache(maxsize=1)
+def template_match_index() -> Dict[tuple, Optional[Dict[str, Any]]]:
+    """Match profile of every (item, category, subcategory) row in the room structures, built once"""
+    index: Dict[tuple, Optional[Dict[str, Any]]] = {}
+    structures = load_room_structures()
+    rooms = list(structures['comprehensive'].values()) + list(structures['intelligent'].values())
+    rooms.append(structures['default'])
+    for room in rooms:
+        for category in room.get('categories', []):
+            for subcategory in category.get('subcategories', []):
+                for item in subcategory.get('items', []):
+                    key = _row_key(item['name'], category['name'], subcategory['name'])
+                    if key not in index:
+                        index[key] = match_profile(item['name'], category['name'], subcategory['name'])
+    return index
+
+
+def row_profile(name: str, category: Optional[str], subcategory: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Precomputed profile for template rows; rows designers added by hand are profiled on the fly"""
+    key = _row_key(name, category, subcategory)
+    index = template_match_index()
+    if key in index:
+        return index[key]
+    return match_profile(name, category, subcategory)
+
+
+async def suggest_room_matches(db, room_id: str, k: int = 5, include_filled: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Top catalog candidates for every checklist row of a room
+    Rows with the same name and section are ranked once; all candidate products
+    are fetched with a single query. Returns None before the catalog index exists.
+    """
+    index = get_similarity_index()
+    if index is None:
+        return None
+    k = min(k, MAX_SUGGESTIONS)
+
+    categories = await db.categories.find({'room_id': room_id}, {'name': 1}).to_list(length=None)
+    subcategories = await db.subcategories.find({'room_id': room_id}, {'name': 1}).to_list(length=None)
+    category_names = {str(doc['_id']): doc['name'] for doc in categories}
+    subcategory_names = {str(doc['_id']): doc['name'] for doc in subcategories}
+
+    query: Dict[str, Any] = {'room_id': room_id}
+    if not include_filled:
+        # Rows already specified with a product link or SKU are done
+        query['url'] = {'$in': ['', None]}
+        query['sku'] = {'$in': ['', None]}
+    items = await db.items.find(
+        query, {'name': 1, 'category_id': 1, 'subcategory_id': 1, 'order': 1}
+    ).sort('order', 1).to_list(length=None)
+
+    ranked: Dict[tuple, List[Dict[str, Any]]] = {}
+    rows = []
+    for item in items:
+        category = category_names.get(item.get('category_id'))
+        subcategory = subcategory_names.get(item.get('subcategory_id'))
+        key = _row_key(item['name'], category, subcategory)
+        profile = row_profile(item['name'], category, subcategory)
+        if profile is not None and key not in ranked:
+            ranked[key] = index.search(profile['terms'], k, profile['required'])
+        rows.append({
+            'item_id': str(item['_id']),
+            'name': item['name'],
+            'category': category,
+            'subcategory': subcategory,
+            'catalog_category': profile['catalog_category'] if profile else None,
+            'keywords': profile['keywords'] if profile else [],
+            '_key': key if profile else None
+        })
+
+    product_ids = {match['product_id'] for matches in ranked.values() for match in matches}
+    products = await db.furniture_products.find(
+        {'_id': {'$in': [ObjectId(product_id) for product_id in product_ids]}}, SIGNATURE_PROJECTION
+    ).to_list(length=None)
+    by_id = {}
+    for product in products:
+        product['id'] = str(product.pop('_id'))
+        by_id[product['id']] = product
+
+    for row in rows:
+        key = row.pop('_key')
+        row['candidates'] = [
+            dict(by_id[match['product_id']], score=match['score'])
+            for match in ranked.get(key, []) if match['product_id'] in by_id
+        ]
+
+    return {
+        'room_id': room_id,
+        'total_rows': len(rows),
+        'matched_rows': sum(1 for row in rows if row['candidates']),
+        'rows': rows
+    }
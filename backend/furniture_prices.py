@@ -0,0 +1,271 @@
+"""
+Catalog Price History and Change Alerts
+Append-only price/availability observations kept in furniture_price_history as
+one bucket document per product per month, so a product's whole history is a
+handful of small documents instead of one row per scrape. A point is appended
+only when the price or availability actually changes. Changes to products that
+are linked to a project item (same product URL, or same vendor + SKU) raise a
+price_alerts entry for the designer. Item links are compared in canonical form
+(items.canonical_url), since designers paste raw URLs with www, trailing
+slashes and tracking parameters.
+"""
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from furniture_sitemaps import canonicalize_product_url
+from vendor_profiles import load_vendor_profiles
+
+_PRICE_NUMBER = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+_indexes_ready = False
+
+
+def parse_price(text: Any) -> Optional[float]:
+    """'$1,899.00' -> 1899.0 (None when there is no amount)"""
+    if isinstance(text, (int, float)):
+        return float(text)
+    match = _PRICE_NUMBER.search(str(text or ''))
+    return float(match.group().replace(',', '')) if match else None
+
+
+@lru_cache(maxsize=1)
+def _vendor_base_urls() -> Dict[str, str]:
+    """Vendor base URL by bare host (no www)"""
+    return {
+        urlparse(profile.base_url).netloc.lower().removeprefix('www.'): profile.base_url
+        for profile in load_vendor_profiles().values()
+    }
+
+
+def canonical_item_url(url: Optional[str]) -> Optional[str]:
+    """
+    A project item's link in the same canonical form as furniture_products.url
+    'www.fourhands.com/product/248067-003/?utm_source=x' -> 'https://fourhands.com/product/248067-003'
+    None for links that aren't on a catalog vendor's site
+    """
+    url = (url or '').strip()
+    if not url:
+        return None
+    if '://' not in url:
+        url = 'https://' + url
+    base_url = _vendor_base_urls().get(urlparse(url).netloc.lower().removeprefix('www.'))
+    return canonicalize_product_url(url, base_url) if base_url else None
+
+
+def month_key(moment: datetime) -> str:
+    return moment.strftime('%Y-%m')
+
+
+def detect_change(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Price/availability change between the stored product and a fresh scrape
+    A product that has never been tracked returns an 'initial' observation
+    """
+    price = parse_price(current.get('price'))
+    availability = current.get('availability')
+    if previous is None or not previous.get('price_tracked'):
+        return {'kind': 'initial', 'price': price, 'availability': availability}
+
+    previous_price = parse_price(previous.get('price'))
+    previous_availability = previous.get('availability')
+    kinds = []
+    if price is not None and previous_price is not None and price != previous_price:
+        kinds.append('price_drop' if price < previous_price else 'price_increase')
+    if availability and previous_availability and availability != previous_availability:
+        kinds.append('availability')
+    if not kinds:
+        return None
+    return {
+        'kind': kinds[0] if len(kinds) == 1 else 'price_and_availability',
+        'changes': kinds,
+        'price': price,
+        'previous_price': previous_price,
+        'availability': availability,
+        'previous_availability': previous_availability
+    }
+
+
+def history_update(product_id: ObjectId, vendor: str, observed_at: datetime,
+                   price: Optional[float], availability: Optional[str]) -> UpdateOne:
+    """Append one point to the product's bucket for the month (created on first point)"""
+    update: Dict[str, Any] = {
+        '$push': {'points': {'at': observed_at, 'price': price, 'availability': availability}},
+        '$inc': {'count': 1},
+        '$set': {'last_at': observed_at, 'vendor': vendor},
+        '$setOnInsert': {'first_at': observed_at}
+    }
+    if price is not None:
+        update['$min'] = {'min_price': price}
+        update['$max'] = {'max_price': price}
+    return UpdateOne({'product_id': product_id, 'month': month_key(observed_at)}, update, upsert=True)
+
+
+async def ensure_price_indexes(db) -> None:
+    """Create price history, alert and item-link indexes once per process"""
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    await db.furniture_price_history.create_index([('product_id', 1), ('month', 1)], unique=True)
+    await db.price_alerts.create_index([('project_id', 1), ('acknowledged', 1), ('detected_at', -1)])
+    await db.price_alerts.create_index('product_id')
+    await db.items.create_index('canonical_url')
+    await db.items.create_index('sku')
+    await backfill_item_canonical_urls(db)
+    _indexes_ready = True
+
+
+async def backfill_item_canonical_urls(db) -> int:
+    """Set canonical_url on items written before it was stored (only items still missing it)"""
+    items = await db.items.find(
+        {'url': {'$nin': ['', None]}, 'canonical_url': {'$exists': False}}, {'url': 1}
+    ).to_list(length=None)
+    operations = [
+        UpdateOne({'_id': item['_id']}, {'$set': {'canonical_url': canonical_item_url(item['url'])}})
+        for item in items
+    ]
+    if operations:
+        await db.items.bulk_write(operations, ordered=False)
+    return len(operations)
+
+
+async def _linked_items(db, products: List[Dict[str, Any]]) -> Dict[ObjectId, List[Dict[str, Any]]]:
+    """Project items that reference each product, by canonical URL or by vendor + SKU (one query for the batch)"""
+    by_url = {product['url']: product['_id'] for product in products if product.get('url')}
+    by_sku = {
+        (str(product.get('vendor') or '').lower(), product['sku']): product['_id']
+        for product in products if product.get('sku')
+    }
+    if not by_url and not by_sku:
+        return {}
+
+    conditions = []
+    if by_url:
+        conditions.append({'canonical_url': {'$in': list(by_url)}})
+    if by_sku:
+        conditions.append({'sku': {'$in': list({sku for _, sku in by_sku})}})
+    items = await db.items.find(
+        {'$or': conditions},
+        {'project_id': 1, 'room_id': 1, 'name': 1, 'canonical_url': 1, 'sku': 1, 'vendor': 1, 'cost': 1}
+    ).to_list(length=None)
+
+    linked: Dict[ObjectId, List[Dict[str, Any]]] = {}
+    for item in items:
+        product_id = by_url.get(item.get('canonical_url')) or by_sku.get((str(item.get('vendor') or '').lower(), item.get('sku')))
+        if product_id is not None:
+            linked.setdefault(product_id, []).append(item)
+    return linked
+
+
+async def record_price_observations(db, observations: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Store a batch of scrape observations and raise alerts for linked items
+    Each observation is the saved product (with _id) plus the change from detect_change
+    """
+    results = {'history_points': 0, 'changes': 0, 'alerts': 0}
+    if not observations:
+        return results
+    await ensure_price_indexes(db)
+
+    operations = []
+    changed = []
+    for observation in observations:
+        product, change = observation['product'], observation['change']
+        operations.append(history_update(
+            product['_id'], product.get('vendor'), product.get('last_updated') or datetime.utcnow(),
+            change['price'], change['availability']
+        ))
+        if change['kind'] != 'initial':
+            changed.append(observation)
+    await db.furniture_price_history.bulk_write(operations, ordered=False)
+    results['history_points'] = len(operations)
+    results['changes'] = len(changed)
+
+    if changed:
+        linked = await _linked_items(db, [observation['product'] for observation in changed])
+        alerts = []
+        for observation in changed:
+            product, change = observation['product'], observation['change']
+            for item in linked.get(product['_id'], []):
+                alerts.append({
+                    'product_id': product['_id'],
+                    'item_id': str(item['_id']),
+                    'project_id': item.get('project_id'),
+                    'room_id': item.get('room_id'),
+                    'item_name': item.get('name'),
+                    'vendor': product.get('vendor'),
+                    'product_name': product.get('name'),
+                    'url': product.get('url'),
+                    'kind': change['kind'],
+                    'changes': change['changes'],
+                    'previous_price': change['previous_price'],
+                    'price': change['price'],
+                    'previous_availability': change['previous_availability'],
+                    'availability': change['availability'],
+                    'detected_at': datetime.utcnow(),
+                    'acknowledged': False
+                })
+        if alerts:
+            await db.price_alerts.insert_many(alerts)
+            results['alerts'] = len(alerts)
+    return results
+
+
+async def get_price_history(db, product_id: str, months: int = 12) -> Dict[str, Any]:
+    """Points and per-month low/high/close for the last N months"""
+    since = month_key(datetime.utcnow() - timedelta(days=31 * max(months - 1, 0)))
+    buckets = await db.furniture_price_history.find(
+        {'product_id': ObjectId(product_id), 'month': {'$gte': since}}
+    ).sort('month', 1).to_list(length=None)
+
+    points = [point for bucket in buckets for point in bucket['points']]
+    prices = [point['price'] for point in points if point['price'] is not None]
+    monthly = []
+    last_price = None
+    for bucket in buckets:
+        month_prices = [point['price'] for point in bucket['points'] if point['price'] is not None]
+        if month_prices:
+            last_price = month_prices[-1]
+        monthly.append({
+            'month': bucket['month'],
+            'low': bucket.get('min_price'),
+            'high': bucket.get('max_price'),
+            'close': last_price,
+            'observations': bucket['count']
+        })
+
+    summary = None
+    if prices:
+        summary = {
+            'current': prices[-1],
+            'first': prices[0],
+            'low': min(prices),
+            'high': max(prices),
+            'change': round(prices[-1] - prices[0], 2),
+            'change_pct': round((prices[-1] - prices[0]) / prices[0] * 100, 1) if prices[0] else None,
+            'availability': points[-1]['availability']
+        }
+    return {'product_id': product_id, 'months': months, 'summary': summary, 'monthly': monthly, 'points': points}
+
+
+async def get_price_alerts(db, project_id: Optional[str] = None, include_acknowledged: bool = False,
+                           limit: int = 100) -> List[Dict[str, Any]]:
+    query: Dict[str, Any] = {}
+    if project_id:
+        query['project_id'] = project_id
+    if not include_acknowledged:
+        query['acknowledged'] = False
+    return await db.price_alerts.find(query).sort('detected_at', -1).limit(limit).to_list(length=limit)
+
+
+async def acknowledge_price_alert(db, alert_id: str) -> bool:
+    result = await db.price_alerts.update_one(
+        {'_id': ObjectId(alert_id)},
+        {'$set': {'acknowledged': True, 'acknowledged_at': datetime.utcnow()}}
+    )
+    return result.matched_count > 0
@@ -0,0 +1,146 @@
+"""
+Furniture Catalog API Routes
+FastAPI routes for the unified vendor catalog: search, similar products and
+visually similar products, near-duplicate listings, price history/alerts and
+catalog suggestions for checklist rows
+"""
+
+from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from typing import Optional
+from bson import ObjectId
+import logging
+from furniture_database import db, search_unified_furniture, backfill_furniture_duplicates
+from furniture_similarity import get_similarity_index, refresh_similarity_index
+from furniture_images import get_image_index, hash_product_images, DEFAULT_MAX_DISTANCE
+from furniture_duplicates import SIGNATURE_PROJECTION, get_duplicates
+from furniture_prices import get_price_history, get_price_alerts, acknowledge_price_alert
+from furniture_matching import suggest_room_matches, MAX_SUGGESTIONS
+
+router = APIRouter(prefix="/api/furniture", tags=["Furniture Catalog"])
+
+def _serialize_product(product):
+    product['id'] = str(product.pop('_id'))
+    return product
+
+@router.get("/search")
+async def search_catalog(q: str = "", vendor: Optional[str] = None, category: Optional[str] = None,
+                         fits: Optional[str] = None, max_width: Optional[float] = None,
+                         max_depth: Optional[float] = None, max_height: Optional[float] = None,
+                         collapse_duplicates: bool = True):
+    """
+    Search every vendor at once; fits takes e.g. "width <= 84in, depth <= 38in"
+    Near-duplicate listings are collapsed into one result unless collapse_duplicates=false
+    """
+    filters = {
+        'vendor': vendor, 'category': category, 'fits': fits,
+        'max_width': max_width, 'max_depth': max_depth, 'max_height': max_height,
+        'collapse_duplicates': collapse_duplicates
+    }
+    results = await search_unified_furniture(q, {key: value for key, value in filters.items() if value is not None})
+    return {"query": q, "total": len(results), "products": [_serialize_product(product) for product in results]}
+
+@router.get("/products/{product_id}/similar")
+async def get_similar_products(product_id: str, k: int = Query(10, ge=1, le=100), other_vendors_only: bool = False):
+    """Top-k most similar catalog products by name, description and materials (TF-IDF cosine)"""
+    index = get_similarity_index()
+    if index is None:
+        raise HTTPException(status_code=503, detail="Similarity index has not been built yet")
+    if product_id not in index.rows:
+        raise HTTPException(status_code=404, detail="Product not in similarity index")
+
+    matches = index.similar(product_id, k, other_vendors_only)
+    products = await db.furniture_products.find(
+        {'_id': {'$in': [ObjectId(match['product_id']) for match in matches]}}, SIGNATURE_PROJECTION
+    ).to_list(length=len(matches))
+    by_id = {str(product['_id']): _serialize_product(product) for product in products}
+
+    return {
+        "product_id": product_id,
+        "similar": [
+            dict(by_id[match['product_id']], similarity=match['score'])
+            for match in matches if match['product_id'] in by_id
+        ]
+    }
+
+@router.post("/similarity-index/rebuild")
+async def rebuild_similarity_index():
+    """Rebuild the similar-products index (unchanged products are not re-tokenized)"""
+    try:
+        return await refresh_similarity_index(db)
+    except Exception as e:
+        logging.error(f"Similarity index rebuild failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Similarity index rebuild failed: {str(e)}")
+
+@router.get("/products/{product_id}/visually-similar")
+async def get_visually_similar_products(product_id: str, max_distance: int = Query(DEFAULT_MAX_DISTANCE, ge=0, le=32),
+                                        k: int = Query(20, ge=1, le=100), other_vendors_only: bool = True):
+    """Products whose image is a near duplicate (perceptual hash distance), e.g. the same piece from another vendor"""
+    index = await get_image_index(db)
+    if product_id not in index.products:
+        raise HTTPException(status_code=404, detail="Product image has not been hashed")
+
+    matches = index.similar(product_id, max_distance, k, other_vendors_only)
+    products = await db.furniture_products.find(
+        {'_id': {'$in': [ObjectId(match['product_id']) for match in matches]}}, SIGNATURE_PROJECTION
+    ).to_list(length=len(matches))
+    by_id = {str(product['_id']): _serialize_product(product) for product in products}
+
+    return {
+        "product_id": product_id,
+        "similar": [
+            dict(by_id[match['product_id']], phash_distance=match['phash_distance'], dhash_distance=match['dhash_distance'])
+            for match in matches if match['product_id'] in by_id
+        ]
+    }
+
+@router.post("/image-index/rebuild")
+async def rebuild_image_index(background_tasks: BackgroundTasks, limit: Optional[int] = None):
+    """Download and hash new or changed product images in the background"""
+    background_tasks.add_task(hash_product_images, db, limit)
+    return {"success": True, "message": "Image hashing started"}
+
+@router.get("/products/{product_id}/duplicates")
+async def get_duplicate_listings(product_id: str):
+    """Other listings of the same piece (same duplicate cluster), from any vendor"""
+    if not ObjectId.is_valid(product_id):
+        raise HTTPException(status_code=404, detail="Product not found")
+    duplicates = await get_duplicates(db, product_id)
+    if duplicates is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    return {"product_id": product_id, "duplicates": [_serialize_product(product) for product in duplicates]}
+
+@router.post("/duplicates/rebuild")
+async def rebuild_duplicates(background_tasks: BackgroundTasks):
+    """Sign and cluster products saved before duplicate detection, in the background"""
+    background_tasks.add_task(backfill_furniture_duplicates)
+    return {"success": True, "message": "Duplicate clustering started"}
+
+@router.get("/products/{product_id}/price-history")
+async def get_product_price_history(product_id: str, months: int = Query(12, ge=1, le=120)):
+    """Price/availability changes with monthly low/high/close, for trend charts"""
+    if not ObjectId.is_valid(product_id):
+        raise HTTPException(status_code=404, detail="Product not found")
+    return await get_price_history(db, product_id, months)
+
+@router.get("/price-alerts")
+async def list_price_alerts(project_id: Optional[str] = None, include_acknowledged: bool = False,
+                            limit: int = Query(100, ge=1, le=500)):
+    """Price/availability changes on catalog products linked to project items"""
+    alerts = await get_price_alerts(db, project_id, include_acknowledged, limit)
+    for alert in alerts:
+        alert['product_id'] = str(alert['product_id'])
+    return {"total": len(alerts), "alerts": [_serialize_product(alert) for alert in alerts]}
+
+@router.post("/price-alerts/{alert_id}/acknowledge")
+async def acknowledge_alert(alert_id: str):
+    if not ObjectId.is_valid(alert_id) or not await acknowledge_price_alert(db, alert_id):
+        raise HTTPException(status_code=404, detail="Alert not found")
+    return {"success": True}
+
+@router.get("/rooms/{room_id}/suggestions")
+async def get_room_suggestions(room_id: str, k: int = Query(5, ge=1, le=MAX_SUGGESTIONS), include_filled: bool = False):
+    """Top catalog candidates for every checklist row of a room in one request"""
+    suggestions = await suggest_room_matches(db, room_id, k, include_filled)
+    if suggestions is None:
+        raise HTTPException(status_code=503, detail="Similarity index has not been built yet")
+    return suggestions
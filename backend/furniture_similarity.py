@@ -0,0 +1,284 @@
+"""
+Similar Products Engine
+Sparse TF-IDF vectors over product name, description, materials and category,
+stored as NumPy arrays (CSR rows plus an inverted index) that are memory-mapped
+on load. Rebuilds reuse the term counts of products whose text hasn't changed,
+so a catalog refresh only tokenizes new or edited products.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+SIMILARITY_INDEX_DIR = Path(os.environ.get(
+    'FURNITURE_SIMILARITY_INDEX_DIR', Path(__file__).parent / 'indexes' / 'similarity'
+))
+
+# Name tokens count this many times as much as description tokens
+NAME_WEIGHT = 3
+MAX_TOP_K = 100
+
+TEXT_FIELDS = {'name': 1, 'description': 1, 'materials': 1, 'category': 1, 'vendor': 1, 'last_updated': 1}
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+_STOP_WORDS = {
+    'the', 'and', 'with', 'for', 'from', 'this', 'that', 'its', 'our', 'your', 'are', 'was',
+    'has', 'have', 'all', 'any', 'can', 'each', 'into', 'more', 'than', 'other', 'also', 'x'
+}
+
+logger = logging.getLogger(__name__)
+
+_loaded_index: Optional['SimilarityIndex'] = None
+_loaded_mtime: Optional[float] = None
+
+
+def tokenize(text: Any) -> List[str]:
+    """Index tokens of a text: lowercase alphanumerics, stop words and single characters dropped"""
+    return [
+        token for token in _TOKEN_PATTERN.findall(str(text or '').lower())
+        if len(token) > 1 and token not in _STOP_WORDS
+    ]
+
+
+def product_terms(product: Dict[str, Any]) -> Counter:
+    """Term counts for one product; name tokens are boosted"""
+    terms = Counter()
+    for field, weight in (('name', NAME_WEIGHT), ('description', 1), ('materials', 1), ('category', 1)):
+        for token in tokenize(product.get(field)):
+            terms[token] += weight
+    return terms
+
+
+def text_hash(product: Dict[str, Any]) -> str:
+    text = '\x1f'.join(str(product.get(field) or '') for field in ('name', 'description', 'materials', 'category'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class SimilarityIndex:
+    """
+    Loaded index; arrays are read-only memory maps
+      indptr/indices/weights          CSR rows: product -> (term, tf-idf weight), L2 normalized
+      counts                          raw term counts aligned with indices (for incremental rebuilds)
+      postings_indptr/docs/weights    inverted index: term -> (product row, weight)
+    """
+
+    ARRAYS = ('indptr', 'indices', 'counts', 'weights', 'postings_indptr', 'postings_docs', 'postings_weights')
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]):
+        self.arrays = arrays
+        self.meta = meta
+        self.vocabulary: List[str] = meta['vocabulary']
+        self.product_ids: List[str] = meta['product_ids']
+        self.vendors: List[str] = meta['vendors']
+        self.hashes: List[str] = meta['hashes']
+        self.rows = {product_id: row for row, product_id in enumerate(self.product_ids)}
+        self.term_ids = {term: index for index, term in enumerate(self.vocabulary)}
+        vendor_codes = {vendor: code for code, vendor in enumerate(sorted(set(self.vendors)))}
+        self.vendor_codes = np.array([vendor_codes[vendor] for vendor in self.vendors], dtype=np.int32)
+
+    @classmethod
+    def load(cls, directory: Path = SIMILARITY_INDEX_DIR) -> Optional['SimilarityIndex']:
+        if not (directory / 'meta.json').exists():
+            return None
+        with open(directory / 'meta.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        arrays = {name: np.load(directory / f'{name}.npy', mmap_mode='r') for name in cls.ARRAYS}
+        return cls(arrays, meta)
+
+    def save(self, directory: Path = SIMILARITY_INDEX_DIR) -> None:
+        """Write to a sibling directory and swap it in, so readers never see a partial index"""
+        staging = directory.with_name(directory.name + '.tmp')
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        for name in self.ARRAYS:
+            np.save(staging / f'{name}.npy', np.asarray(self.arrays[name]))
+        with open(staging / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f)
+
+        retired = directory.with_name(directory.name + '.old')
+        shutil.rmtree(retired, ignore_errors=True)
+        if directory.exists():
+            directory.rename(retired)
+        staging.rename(directory)
+        shutil.rmtree(retired, ignore_errors=True)
+
+    def row_terms(self, row: int) -> Counter:
+        start, end = self.arrays['indptr'][row], self.arrays['indptr'][row + 1]
+        return Counter({
+            self.vocabulary[term]: float(count)
+            for term, count in zip(self.arrays['indices'][start:end], self.arrays['counts'][start:end])
+        })
+
+    def similar(self, product_id: str, k: int = 10, other_vendors_only: bool = False) -> List[Dict[str, Any]]:
+        """Top-k products by cosine similarity; only rows sharing a term are scored"""
+        row = self.rows.get(product_id)
+        if row is None:
+            return []
+        indptr, indices, weights = self.arrays['indptr'], self.arrays['indices'], self.arrays['weights']
+
+        terms = indices[indptr[row]:indptr[row + 1]]
+        query_weights = weights[indptr[row]:indptr[row + 1]]
+        if not len(terms):
+            return []
+
+        scores = self._scores(terms, query_weights)
+        scores[row] = 0.0
+        if other_vendors_only:
+            scores[self.vendor_codes == self.vendor_codes[row]] = 0.0
+        return self._top(scores, k)
+
+    def search(self, terms: Dict[str, float], k: int = 10, required: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Top-k products for weighted query terms (terms outside the vocabulary are ignored)
+        With required, only products containing at least one of those terms are ranked
+        """
+        known = [(self.term_ids[term], weight) for term, weight in terms.items() if term in self.term_ids]
+        required_ids = [self.term_ids[term] for term in required or [] if term in self.term_ids]
+        if not known or (required and not required_ids):
+            return []
+        scores = self._scores(
+            np.array([term for term, _ in known], dtype=np.int64),
+            np.array([weight for _, weight in known], dtype=np.float32)
+        )
+        if required_ids:
+            p_indptr, p_docs = self.arrays['postings_indptr'], self.arrays['postings_docs']
+            allowed = np.zeros(len(self.product_ids), dtype=bool)
+            for term in required_ids:
+                allowed[p_docs[p_indptr[term]:p_indptr[term + 1]]] = True
+            scores[~allowed] = 0.0
+        return self._top(scores, k)
+
+    def _scores(self, terms: np.ndarray, query_weights: np.ndarray) -> np.ndarray:
+        """Dot product of the query with every product, accumulated from the postings of its terms"""
+        p_indptr, p_docs, p_weights = (
+            self.arrays['postings_indptr'], self.arrays['postings_docs'], self.arrays['postings_weights']
+        )
+        starts, ends = p_indptr[terms], p_indptr[terms + 1]
+        lengths = ends - starts
+        positions = np.concatenate([np.arange(start, end) for start, end in zip(starts, ends)])
+        return np.bincount(
+            p_docs[positions],
+            weights=p_weights[positions] * np.repeat(query_weights, lengths),
+            minlength=len(self.product_ids)
+        )
+
+    def _top(self, scores: np.ndarray, k: int) -> List[Dict[str, Any]]:
+        k = min(k, MAX_TOP_K, int(np.count_nonzero(scores)))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [{'product_id': self.product_ids[index], 'score': round(float(scores[index]), 4)} for index in top]
+
+
+def build_similarity_index(products: List[Dict[str, Any]], previous: Optional[SimilarityIndex] = None) -> SimilarityIndex:
+    """
+    Build the index from product documents (ids as strings under 'id')
+    Term counts of products whose text hash matches the previous index are reused
+    """
+    reused = 0
+    rows: List[Counter] = []
+    for product in products:
+        digest = text_hash(product)
+        previous_row = previous.rows.get(product['id']) if previous else None
+        if previous_row is not None and previous.hashes[previous_row] == digest:
+            rows.append(previous.row_terms(previous_row))
+            reused += 1
+        else:
+            rows.append(product_terms(product))
+        product['_text_hash'] = digest
+
+    vocabulary = sorted({term for terms in rows for term in terms})
+    term_ids = {term: index for index, term in enumerate(vocabulary)}
+
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(terms) for terms in rows])
+    indices = np.empty(indptr[-1], dtype=np.int32)
+    counts = np.empty(indptr[-1], dtype=np.float32)
+    for row, terms in enumerate(rows):
+        ordered = sorted((term_ids[term], count) for term, count in terms.items())
+        indices[indptr[row]:indptr[row + 1]] = [term for term, _ in ordered]
+        counts[indptr[row]:indptr[row + 1]] = [count for _, count in ordered]
+
+    # Sublinear tf, smoothed idf, rows L2-normalized so dot product = cosine
+    document_frequency = np.bincount(indices, minlength=len(vocabulary))
+    idf = (np.log((1 + len(rows)) / (1 + document_frequency)) + 1).astype(np.float32)
+    weights = ((1 + np.log(counts)) * idf[indices]).astype(np.float32)
+    row_ids = np.repeat(np.arange(len(rows)), np.diff(indptr))
+    norms = np.sqrt(np.bincount(row_ids, weights=weights ** 2, minlength=len(rows)))
+    weights /= np.where(norms > 0, norms, 1)[row_ids].astype(np.float32)
+
+    # Inverted index: same entries sorted by term
+    order = np.argsort(indices, kind='stable')
+    postings_indptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+    postings_indptr[1:] = np.cumsum(document_frequency)
+
+    meta = {
+        'built_at': datetime.utcnow().isoformat(),
+        'vocabulary': vocabulary,
+        'product_ids': [product['id'] for product in products],
+        'vendors': [product.get('vendor') or '' for product in products],
+        'hashes': [product.pop('_text_hash') for product in products],
+        'reused_rows': reused
+    }
+    arrays = {
+        'indptr': indptr,
+        'indices': indices,
+        'counts': counts,
+        'weights': weights,
+        'postings_indptr': postings_indptr,
+        'postings_docs': row_ids[order].astype(np.int32),
+        'postings_weights': weights[order]
+    }
+    return SimilarityIndex(arrays, meta)
+
+
+def get_similarity_index() -> Optional[SimilarityIndex]:
+    """
+    The current index, memory-mapped from disk on first use and re-mapped when
+    another worker has swapped in a rebuilt one
+    """
+    global _loaded_index, _loaded_mtime
+    try:
+        mtime = (SIMILARITY_INDEX_DIR / 'meta.json').stat().st_mtime
+    except FileNotFoundError:
+        return _loaded_index
+    if _loaded_index is None or mtime != _loaded_mtime:
+        _loaded_index = SimilarityIndex.load()
+        _loaded_mtime = mtime
+    return _loaded_index
+
+
+async def refresh_similarity_index(db) -> Dict[str, Any]:
+    """Rebuild from furniture_products (reusing unchanged rows) and swap it in"""
+    global _loaded_index, _loaded_mtime
+    products = []
+    async for product in db.furniture_products.find({}, TEXT_FIELDS):
+        product['id'] = str(product.pop('_id'))
+        products.append(product)
+
+    previous = get_similarity_index()
+
+    def build_and_save():
+        index = build_similarity_index(products, previous)
+        index.save()
+        return SimilarityIndex.load()
+
+    _loaded_index = await asyncio.to_thread(build_and_save)
+    _loaded_mtime = (SIMILARITY_INDEX_DIR / 'meta.json').stat().st_mtime
+    logger.info(f"Similarity index rebuilt: {len(products)} products, {_loaded_index.meta['reused_rows']} unchanged")
+    return {
+        'products': len(products),
+        'terms': len(_loaded_index.vocabulary),
+        'reused_rows': _loaded_index.meta['reused_rows'],
+        'built_at': _loaded_index.meta['built_at']
+    }
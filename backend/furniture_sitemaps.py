@@ -0,0 +1,219 @@
+"""
+Sitemap-Driven Product Discovery
+Streams vendor sitemap.xml files and sitemap indexes (plain or gzipped) and feeds
+product URLs into a crawl frontier, so full-catalog coverage doesn't require
+rendering listing pages
+"""
+import heapq
+import logging
+import re
+import zlib
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+import xml.etree.ElementTree as ET
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+SITEMAP_TIMEOUT_SECONDS = 60
+SITEMAP_CHUNK_SIZE = 64 * 1024
+# Safety limits per vendor crawl
+MAX_SITEMAPS = 200
+MAX_SITEMAP_URLS = 200000
+
+# Matches product detail pages when a vendor has no product_url_pattern of its own
+DEFAULT_PRODUCT_URL_PATTERN = r'/(products?|items?)/'
+
+# Query parameters that never identify a different product
+TRACKING_PARAMS = {'gclid', 'fbclid', 'msclkid', 'ref', 'ref_', 'srsltid', '_pos', '_sid', '_ss', '_psq', '_v'}
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def canonicalize_product_url(url: str, base_url: str) -> Optional[str]:
+    """
+    Canonical form of a product link on the vendor's own site, or None
+    Lowercases scheme and host, drops www, fragments, tracking parameters and
+    trailing slashes, and sorts the remaining query so equal products compare equal
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return None
+
+    host = parsed.netloc.lower()
+    base_host = urlparse(base_url).netloc.lower()
+    if host.removeprefix('www.') != base_host.removeprefix('www.'):
+        return None
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse(('https', base_host, path, '', urlencode(query), ''))
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """W3C datetime (date only or full timestamp) as naive UTC, or None"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+async def stream_sitemap(session: aiohttp.ClientSession, url: str) -> AsyncIterator[Tuple[str, str, Optional[datetime]]]:
+    """
+    Yield (kind, loc, lastmod) for every entry of one sitemap file, where kind is
+    'sitemap' for a child of a sitemap index and 'url' for a page
+    The body is decompressed and parsed incrementally; elements are cleared once read
+    """
+    timeout = aiohttp.ClientTimeout(total=SITEMAP_TIMEOUT_SECONDS)
+    async with session.get(url, timeout=timeout) as response:
+        response.raise_for_status()
+
+        parser = ET.XMLPullParser(events=('end',))
+        decompressor = None
+        first_chunk = True
+
+        async for chunk in response.content.iter_chunked(SITEMAP_CHUNK_SIZE):
+            if first_chunk:
+                first_chunk = False
+                # .xml.gz files are served as binary, not with Content-Encoding
+                if chunk.startswith(_GZIP_MAGIC):
+                    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+            if decompressor:
+                chunk = decompressor.decompress(chunk)
+            parser.feed(chunk)
+
+            for _, element in parser.read_events():
+                entry = _read_entry(element)
+                if entry:
+                    yield entry
+                    element.clear()
+
+        if decompressor:
+            parser.feed(decompressor.flush())
+        parser.close()
+        for _, element in parser.read_events():
+            entry = _read_entry(element)
+            if entry:
+                yield entry
+
+
+def _read_entry(element) -> Optional[Tuple[str, str, Optional[datetime]]]:
+    kind = _local_name(element.tag)
+    if kind not in ('sitemap', 'url'):
+        return None
+
+    loc = lastmod = None
+    for child in element:
+        name = _local_name(child.tag)
+        if name == 'loc':
+            loc = (child.text or '').strip()
+        elif name == 'lastmod':
+            lastmod = parse_lastmod(child.text)
+    if not loc:
+        return None
+    return kind, loc, lastmod
+
+
+async def find_sitemaps(session: aiohttp.ClientSession, base_url: str) -> List[str]:
+    """Sitemaps declared in robots.txt, falling back to /sitemap.xml"""
+    sitemaps = []
+    try:
+        timeout = aiohttp.ClientTimeout(total=SITEMAP_TIMEOUT_SECONDS)
+        async with session.get(urljoin(base_url, '/robots.txt'), timeout=timeout) as response:
+            if response.status == 200:
+                for line in (await response.text()).splitlines():
+                    if line.lower().startswith('sitemap:'):
+                        sitemaps.append(line.split(':', 1)[1].strip())
+    except Exception as e:
+        logger.warning(f"Failed to read robots.txt for {base_url}: {str(e)}")
+
+    return sitemaps or [urljoin(base_url, '/sitemap.xml')]
+
+
+async def iter_sitemap_urls(session: aiohttp.ClientSession, base_url: str,
+                            sitemap_urls: Optional[List[str]] = None,
+                            since: Optional[datetime] = None) -> AsyncIterator[Tuple[str, Optional[datetime]]]:
+    """
+    Walk a vendor's sitemap tree breadth-first and yield (page url, lastmod)
+    Child sitemaps and pages whose lastmod is older than `since` are skipped
+    """
+    pending = list(sitemap_urls or await find_sitemaps(session, base_url))
+    seen_sitemaps = set(pending)
+    sitemaps_read = 0
+    urls_yielded = 0
+
+    while pending and sitemaps_read < MAX_SITEMAPS:
+        sitemap_url = pending.pop(0)
+        sitemaps_read += 1
+        try:
+            async for kind, loc, lastmod in stream_sitemap(session, sitemap_url):
+                if since and lastmod and lastmod < since:
+                    continue
+                if kind == 'sitemap':
+                    if loc not in seen_sitemaps:
+                        seen_sitemaps.add(loc)
+                        pending.append(loc)
+                    continue
+                yield loc, lastmod
+                urls_yielded += 1
+                if urls_yielded >= MAX_SITEMAP_URLS:
+                    return
+        except Exception as e:
+            logger.warning(f"Failed to read sitemap {sitemap_url}: {str(e)}")
+
+
+class UrlFrontier:
+    """
+    Deduplicated crawl queue; most recently modified pages come out first and
+    pages without a lastmod come last
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._seen = set()
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, url: str, lastmod: Optional[datetime] = None, meta: Optional[Dict] = None) -> bool:
+        """Queue a URL once; returns False if it was already seen"""
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        # Negated timestamp so the newest pages pop first; ties keep insertion order
+        priority = -lastmod.timestamp() if lastmod else float('inf')
+        heapq.heappush(self._heap, (priority, self._counter, url, lastmod, meta or {}))
+        self._counter += 1
+        return True
+
+    def pop(self) -> Optional[Tuple[str, Optional[datetime], Dict]]:
+        if not self._heap:
+            return None
+        _, _, url, lastmod, meta = heapq.heappop(self._heap)
+        return url, lastmod, meta
+
+    def pop_batch(self, size: int) -> List[Tuple[str, Optional[datetime], Dict]]:
+        batch = []
+        while self._heap and len(batch) < size:
+            batch.append(self.pop())
+        return batch
+
+
+def product_url_matcher(config: Dict) -> re.Pattern:
+    return re.compile(config.get('product_url_pattern', DEFAULT_PRODUCT_URL_PATTERN))
@@ -5,13 +5,52 @@ Imports comprehensive client data from Google Sheets into the Interior Design sy
 """
 
 import requests
+import aiohttp
+import asyncio
 import pandas as pd
 import re
 import io
-from typing import Dict, List, Optional, Any
+import codecs
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
 from datetime import datetime
+import hashlib
 import json
 
+DOWNLOAD_TIMEOUT_SECONDS = 30
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Approximate CSV text handed to pandas per parsed frame in streaming mode
+STREAM_BLOCK_SIZE = 1024 * 1024
+# Tabs downloaded at the same time in a multi-tab import
+MAX_CONCURRENT_TAB_DOWNLOADS = 4
+
+_GID_PATTERN = re.compile(r'[#&?]gid=(\d+)')
+
+_CSV_DELIMITERS = re.compile(r'["\n]')
+
+def read_sheet_csv(source) -> pd.DataFrame:
+    """
+    Parse sheet CSV with every cell kept as text
+    All download paths go through here: type inference depends on which rows a
+    parse sees, so a streamed block and a full download would otherwise turn
+    the same phone number into '5551234567' and '5551234567.0'
+    """
+    return pd.read_csv(source, dtype=str, keep_default_na=True, na_filter=True)
+
+def find_record_boundary(text: str, start: int, quoted: bool, first_only: bool = False) -> Tuple[int, bool]:
+    """
+    Scan text[start:] for newlines that end a CSV record (i.e. outside quotes)
+    Returns (offset just past the last such newline or -1, quote state at the end of text)
+    """
+    boundary = -1
+    for match in _CSV_DELIMITERS.finditer(text, start):
+        if match.group() == '"':
+            quoted = not quoted
+        elif not quoted:
+            boundary = match.end()
+            if first_only:
+                return boundary, quoted
+    return boundary, quoted
+
 class GoogleSheetsImporter:
     def __init__(self):
         self.column_mapping = {
@@ -66,6 +105,16 @@ class GoogleSheetsImporter:
             'Any additional comments or questions?': 'design_additional_comments',
         }
         
+        # Comma-separated multi-select answers -> (target list field, drop duplicates)
+        self.multi_select_columns = {
+            'ROOMS INVOLVED IN PROJECT': ('rooms_involved', True),
+            'Which interior design styles do you prefer? (Select all that apply)': ('style_preferences', False),
+            'Contact Preferences ': ('contact_preferences', False),
+        }
+        
+        # Parsed header mappings keyed by the sheet's column tuple
+        self._header_mapping_cache: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        
         self.project_type_mapping = {
             'Primary Residence': 'Renovation',
             'New Build': 'New Construction', 
@@ -79,14 +128,18 @@ class GoogleSheetsImporter:
         match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', url)
         return match.group(1) if match else None
 
+    def build_export_url(self, sheet_id: str, gid: str = '0') -> str:
+        """CSV export URL for one tab of a Google Sheet"""
+        return f'https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}'
+
     def download_sheet_data(self, sheet_id: str, gid: str = '0') -> Optional[pd.DataFrame]:
-        """Download CSV data from Google Sheets"""
+        """Download CSV data from Google Sheets (blocking - use download_sheet_data_async in API routes)"""
         try:
-            csv_url = f'https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}'
-            response = requests.get(csv_url, timeout=30)
+            csv_url = self.build_export_url(sheet_id, gid)
+            response = requests.get(csv_url, timeout=DOWNLOAD_TIMEOUT_SECONDS)
             
             if response.status_code == 200:
-                df = pd.read_csv(io.StringIO(response.text))
+                df = read_sheet_csv(io.StringIO(response.text))
                 return df
             else:
                 print(f"Error downloading sheet: HTTP {response.status_code}")
@@ -96,6 +149,147 @@ class GoogleSheetsImporter:
             print(f"Error downloading sheet: {e}")
             return None
 
+    async def fetch_sheet_csv(self, sheet_id: str, gid: str = '0') -> Optional[bytes]:
+        """Stream the CSV export over aiohttp without blocking the event loop"""
+        try:
+            timeout = aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT_SECONDS)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(self.build_export_url(sheet_id, gid)) as response:
+                    if response.status != 200:
+                        print(f"Error downloading sheet: HTTP {response.status}")
+                        return None
+                    
+                    chunks = []
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        chunks.append(chunk)
+                    return b''.join(chunks)
+                    
+        except Exception as e:
+            print(f"Error downloading sheet: {e}")
+            return None
+
+    async def download_sheet_data_async(self, sheet_id: str, gid: str = '0') -> Optional[pd.DataFrame]:
+        """Non-blocking download_sheet_data: async fetch, CSV parsing in a worker thread"""
+        data = await self.fetch_sheet_csv(sheet_id, gid)
+        if data is None:
+            return None
+        
+        try:
+            return await asyncio.to_thread(read_sheet_csv, io.BytesIO(data))
+        except Exception as e:
+            print(f"Error parsing sheet: {e}")
+            return None
+
+    def _parse_csv_block(self, header: str, block: str, first_row: int) -> pd.DataFrame:
+        df = read_sheet_csv(io.StringIO(header + block))
+        df.index = pd.RangeIndex(first_row, first_row + len(df))
+        return df
+
+    async def iter_sheet_frames(self, sheet_id: str, gid: str = '0',
+                                block_size: int = STREAM_BLOCK_SIZE) -> AsyncIterator[pd.DataFrame]:
+        """
+        Stream a sheet as DataFrames of roughly block_size bytes each
+        Only the current block is held in memory; frames keep sheet-wide row
+        indexes so row numbers match a full download_sheet_data parse
+        """
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=DOWNLOAD_TIMEOUT_SECONDS)
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        header = None
+        buffer = ''
+        scanned = 0
+        boundary = 0
+        quoted = False
+        next_row = 0
+        
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(self.build_export_url(sheet_id, gid)) as response:
+                if response.status != 200:
+                    raise ValueError(f"Error downloading sheet: HTTP {response.status}")
+                
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    buffer += decoder.decode(chunk)
+                    
+                    if header is None:
+                        end, _ = find_record_boundary(buffer, 0, False, first_only=True)
+                        if end < 0:
+                            continue
+                        header, buffer = buffer[:end], buffer[end:]
+                        scanned, boundary, quoted = 0, 0, False
+                    
+                    end, quoted = find_record_boundary(buffer, scanned, quoted)
+                    scanned = len(buffer)
+                    boundary = max(boundary, end)
+                    
+                    if boundary >= block_size:
+                        block, buffer = buffer[:boundary], buffer[boundary:]
+                        scanned -= boundary
+                        boundary = 0
+                        df = await asyncio.to_thread(self._parse_csv_block, header, block, next_row)
+                        next_row += len(df)
+                        yield df
+        
+        buffer += decoder.decode(b'', final=True)
+        if header is None:
+            return
+        if buffer.strip():
+            yield await asyncio.to_thread(self._parse_csv_block, header, buffer, next_row)
+
+    async def download_sheet_head(self, sheet_id: str, gid: str = '0', max_rows: int = 5) -> Optional[pd.DataFrame]:
+        """
+        Download just the header and the first max_rows records of a sheet
+        The stream is closed as soon as enough complete records have arrived
+        """
+        try:
+            timeout = aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT_SECONDS)
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            buffer = ''
+            position = 0
+            quoted = False
+            records = 0
+            cutoff = -1
+            
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(self.build_export_url(sheet_id, gid)) as response:
+                    if response.status != 200:
+                        print(f"Error downloading sheet: HTTP {response.status}")
+                        return None
+                    
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        buffer += decoder.decode(chunk)
+                        while cutoff < 0:
+                            end, quoted = find_record_boundary(buffer, position, quoted, first_only=True)
+                            if end < 0:
+                                position = len(buffer)
+                                break
+                            position = end
+                            records += 1
+                            # header record + max_rows data records
+                            if records > max_rows:
+                                cutoff = end
+                        if cutoff >= 0:
+                            break
+            
+            text = buffer[:cutoff] if cutoff >= 0 else buffer + decoder.decode(b'', final=True)
+            return await asyncio.to_thread(read_sheet_csv, io.StringIO(text))
+            
+        except Exception as e:
+            print(f"Error downloading sheet: {e}")
+            return None
+
+    def header_mapping(self, columns: List[str]) -> Dict[str, Any]:
+        """Which sheet columns map to project fields (cached per distinct header)"""
+        key = tuple(columns)
+        cached = self._header_mapping_cache.get(key)
+        if cached is None:
+            column_set = set(key)
+            cached = {
+                'mapped': {col: self.column_mapping[col] for col in key if col in self.column_mapping},
+                'unmapped': [col for col in key if col not in self.column_mapping],
+                'missing': [col for col in self.column_mapping if col not in column_set]
+            }
+            self._header_mapping_cache[key] = cached
+        return cached
+
     def parse_rooms_list(self, rooms_string: str) -> List[str]:
         """Parse comma-separated rooms list"""
         if pd.isna(rooms_string) or not rooms_string:
@@ -197,65 +391,217 @@ class GoogleSheetsImporter:
         
         return project_data
 
-    def import_sheet_data(self, url: str, start_row: int = 1) -> Dict[str, Any]:
-        """Import data from Google Sheets URL"""
-        result = {
-            'success': False,
-            'message': '',
-            'projects_created': 0,
-            'projects_data': [],
-            'errors': []
+    def fingerprint_project(self, project_data: Dict[str, Any]) -> str:
+        """Stable identity of a questionnaire response: submission timestamp + hashed email"""
+        client_info = project_data.get('client_info', {})
+        email = (client_info.get('email') or client_info.get('full_name') or '').strip().lower()
+        email_hash = hashlib.sha256(email.encode()).hexdigest()
+        timestamp = project_data.get('questionnaire_completed_at') or f"row-{project_data.get('import_row')}"
+        return hashlib.sha256(f"{timestamp}|{email_hash}".encode()).hexdigest()
+
+    def content_hash(self, project_data: Dict[str, Any]) -> str:
+        """Hash of the imported answers, used to detect edited responses"""
+        answers = {
+            key: value for key, value in project_data.items()
+            if key not in ('created_at', 'source') and not key.startswith('import_')
+        }
+        return hashlib.sha256(json.dumps(answers, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _split_multi_select(self, column: pd.Series, dedupe: bool) -> Dict[Any, List[str]]:
+        """Split a comma-separated answer column for every row at once"""
+        parts = column.dropna().astype(str).str.split(',').explode().str.strip()
+        parts = parts[parts.notna() & (parts != '')].to_frame('value')
+        parts['row'] = parts.index
+        if dedupe:
+            parts = parts.drop_duplicates(['row', 'value'])
+        return parts.groupby('row', sort=False)['value'].agg(list).to_dict()
+
+    def convert_dataframe_to_projects(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Column-wise equivalent of convert_row_to_project for a whole sheet
+        Columns are cleaned and mapped once, then rows are emitted via to_dict('records')
+        """
+        present = list(self.header_mapping(list(df.columns))['mapped'])
+        
+        # Clean every mapped column in one pass: stringify, strip, blanks -> missing
+        columns = {}
+        for col in present:
+            values = df[col].astype('string').str.strip()
+            columns[self.column_mapping[col]] = values.mask((values == '').fillna(False))
+        cleaned = pd.DataFrame(columns, index=df.index)
+        
+        if 'project_type' in cleaned:
+            cleaned['project_type'] = cleaned['project_type'].map(self.project_type_mapping)
+        
+        if 'client_info.full_name' in cleaned:
+            full_names = cleaned['client_info.full_name']
+        else:
+            full_names = pd.Series(pd.NA, index=df.index, dtype='string')
+        cleaned['name'] = full_names.fillna('Unknown Client') + ' Interior Design Project'
+        
+        if 'Timestamp' in df.columns:
+            cleaned['questionnaire_completed_at'] = df['Timestamp'].astype('string')
+        
+        multi_select = {
+            target: self._split_multi_select(df[col], dedupe)
+            for col, (target, dedupe) in self.multi_select_columns.items()
+            if col in df.columns
         }
         
-        # Extract sheet ID
+        cleaned = cleaned.astype(object).where(cleaned.notna(), None)
+        nested_paths = {path: path.split('.') for path in cleaned.columns if '.' in path}
+        created_at = datetime.now().isoformat()
+        
+        projects = []
+        errors = []
+        for index, record in zip(cleaned.index, cleaned.to_dict('records')):
+            if not record.get('client_info.full_name'):
+                errors.append(f"Row {index + 1}: Missing client name")
+                continue
+            
+            project_data = {
+                'client_info': {},
+                'rooms_involved': [],
+                'contact_preferences': [],
+                'style_preferences': [],
+                'created_at': created_at,
+                'source': 'Google Sheets Import',
+                'project_type': 'Renovation'
+            }
+            for key, value in record.items():
+                if value is None:
+                    continue
+                if key in nested_paths:
+                    parent, child = nested_paths[key]
+                    project_data.setdefault(parent, {})[child] = value
+                else:
+                    project_data[key] = value
+            
+            for target, values_by_row in multi_select.items():
+                project_data[target] = values_by_row.get(index, [])
+            
+            project_data['import_row'] = int(index) + 1
+            project_data['import_fingerprint'] = self.fingerprint_project(project_data)
+            project_data['import_content_hash'] = self.content_hash(project_data)
+            projects.append(project_data)
+        
+        return projects, errors
+
+    def import_sheet_data(self, url: str, start_row: int = 1) -> Dict[str, Any]:
+        """Import data from Google Sheets URL (blocking - use import_sheet_data_async in API routes)"""
+        sheet_id = self.extract_sheet_id(url)
+        if not sheet_id:
+            return self._failed_import('Invalid Google Sheets URL')
+        
+        return self.process_sheet_dataframe(self.download_sheet_data(sheet_id), start_row)
+
+    async def import_sheet_data_async(self, url: str, start_row: int = 1, gid: str = '0') -> Dict[str, Any]:
+        """Import data from Google Sheets URL without blocking the event loop"""
         sheet_id = self.extract_sheet_id(url)
         if not sheet_id:
-            result['message'] = 'Invalid Google Sheets URL'
+            return self._failed_import('Invalid Google Sheets URL')
+        
+        df = await self.download_sheet_data_async(sheet_id, gid)
+        return await asyncio.to_thread(self.process_sheet_dataframe, df, start_row)
+
+    async def discover_sheet_gids(self, sheet_id: str) -> List[str]:
+        """Best-effort list of tab gids from the sheet's public HTML view (falls back to the first tab)"""
+        try:
+            timeout = aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT_SECONDS)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                url = f'https://docs.google.com/spreadsheets/d/{sheet_id}/htmlview'
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        gids = list(dict.fromkeys(_GID_PATTERN.findall(await response.text())))
+                        if gids:
+                            return gids
+        except Exception as e:
+            print(f"Error discovering sheet tabs: {e}")
+        return ['0']
+
+    async def import_sheet_tabs_async(self, url: str, gids: Optional[List[str]] = None, start_row: int = 1,
+                                      max_concurrency: int = MAX_CONCURRENT_TAB_DOWNLOADS) -> Dict[str, Any]:
+        """
+        Import several tabs of one spreadsheet concurrently (bounded by max_concurrency)
+        gids=None discovers the tabs; results are merged with a per-tab report under 'tabs'
+        and every project is tagged with the import_gid it came from
+        """
+        sheet_id = self.extract_sheet_id(url)
+        if not sheet_id:
+            return {**self._failed_import('Invalid Google Sheets URL'), 'tabs': {}}
+        
+        if not gids:
+            gids = await self.discover_sheet_gids(sheet_id)
+        gids = list(dict.fromkeys(str(gid) for gid in gids))
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def import_tab(gid: str) -> Dict[str, Any]:
+            async with semaphore:
+                df = await self.download_sheet_data_async(sheet_id, gid)
+            result = await asyncio.to_thread(self.process_sheet_dataframe, df, start_row)
+            for project in result['projects_data']:
+                project['import_gid'] = gid
             return result
         
-        # Download data
-        df = self.download_sheet_data(sheet_id)
+        results = await asyncio.gather(*(import_tab(gid) for gid in gids), return_exceptions=True)
+        
+        merged = {'projects_data': [], 'errors': [], 'tabs': {}}
+        for gid, result in zip(gids, results):
+            if isinstance(result, Exception):
+                result = self._failed_import(f"Tab import failed: {str(result)}")
+            merged['tabs'][gid] = {
+                'success': result['success'],
+                'message': result['message'],
+                'projects_created': result['projects_created'],
+                'errors': result['errors']
+            }
+            merged['projects_data'].extend(result['projects_data'])
+            merged['errors'].extend(f"Tab {gid}: {error}" for error in result['errors'])
+            if not result['success']:
+                merged['errors'].append(f"Tab {gid}: {result['message']}")
+        
+        succeeded = [gid for gid, tab in merged['tabs'].items() if tab['success']]
+        merged['success'] = bool(succeeded)
+        merged['projects_created'] = len(merged['projects_data'])
+        if succeeded:
+            merged['message'] = f"Successfully processed {merged['projects_created']} projects from {len(succeeded)} of {len(gids)} tabs"
+        else:
+            merged['message'] = merged['tabs'][gids[0]]['message'] if len(gids) == 1 else 'Failed to import any tab'
+        return merged
+
+    def _failed_import(self, message: str) -> Dict[str, Any]:
+        return {
+            'success': False,
+            'message': message,
+            'projects_created': 0,
+            'projects_data': [],
+            'errors': []
+        }
+
+    def process_sheet_dataframe(self, df: Optional[pd.DataFrame], start_row: int = 1) -> Dict[str, Any]:
+        """Convert a downloaded questionnaire sheet into project data"""
         if df is None:
-            result['message'] = 'Failed to download sheet data'
-            return result
+            return self._failed_import('Failed to download sheet data')
         
         if len(df) == 0:
-            result['message'] = 'Sheet contains no data'
-            return result
+            return self._failed_import('Sheet contains no data')
         
-        # Process each row (skip header if start_row > 0)
-        projects_created = []
-        errors = []
+        # Skip rows before start_row and fully empty rows, then convert column-wise
+        rows = df[df.index >= start_row].dropna(how='all')
         
-        for index, row in df.iterrows():
-            if index < start_row:
-                continue
-                
-            try:
-                # Skip empty rows
-                if row.isna().all():
-                    continue
-                
-                # Convert row to project data
-                project_data = self.convert_row_to_project(row)
-                
-                # Validate required fields
-                if not project_data.get('client_info', {}).get('full_name'):
-                    errors.append(f"Row {index + 1}: Missing client name")
-                    continue
-                
-                projects_created.append(project_data)
-                
-            except Exception as e:
-                errors.append(f"Row {index + 1}: {str(e)}")
-        
-        result['success'] = True
-        result['projects_created'] = len(projects_created)
-        result['projects_data'] = projects_created
-        result['errors'] = errors
-        result['message'] = f"Successfully processed {len(projects_created)} projects"
+        try:
+            projects_created, errors = self.convert_dataframe_to_projects(rows)
+        except Exception as e:
+            return self._failed_import(f'Failed to convert sheet data: {str(e)}')
         
-        return result
+        return {
+            'success': True,
+            'message': f"Successfully processed {len(projects_created)} projects",
+            'projects_created': len(projects_created),
+            'projects_data': projects_created,
+            'errors': errors
+        }
 
     def create_sample_mapping_info(self) -> Dict[str, Any]:
         """Create sample mapping information for frontend display"""
@@ -0,0 +1,147 @@
+"""
+Google Sheets Background Import Jobs
+Runs streaming imports outside the HTTP request and records progress in import_jobs
+so any worker can report status and request cancellation
+"""
+
+from typing import Dict, Any, Optional, List
+from datetime import datetime, timezone
+import logging
+import time
+import uuid
+from .google_sheets_sync import stream_import_projects
+from .database import get_database
+
+# Keep only the most recent error messages on the job document
+MAX_JOB_ERRORS = 200
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+def _serialize_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    job['job_id'] = job.pop('_id')
+    return job
+
+async def create_import_job(params: Dict[str, Any]) -> str:
+    """Register a queued job and return its id"""
+    db = get_database()
+    job_id = uuid.uuid4().hex
+    await db.import_jobs.insert_one({
+        '_id': job_id,
+        'status': 'queued',
+        'url': params['url'],
+        'gid': params.get('gid', '0'),
+        'params': params,
+        'rows_processed': 0,
+        'projects_converted': 0,
+        'projects_created': 0,
+        'projects_updated': 0,
+        'rows_skipped': 0,
+        'failed_rows': 0,
+        'error_count': 0,
+        'errors': [],
+        'rows_per_second': 0.0,
+        'cancel_requested': False,
+        'message': '',
+        'created_at': datetime.now(timezone.utc),
+        'started_at': None,
+        'finished_at': None
+    })
+    return job_id
+
+async def run_import_job(importer, job_id: str) -> None:
+    """
+    Execute a queued job; progress is written after every streamed block and
+    cancellation is checked between blocks
+    """
+    db = get_database()
+    job = await db.import_jobs.find_one({'_id': job_id})
+    if not job or job['status'] != 'queued':
+        return
+
+    started = time.monotonic()
+    # Conditional on still being queued, so a cancel landing after the read above wins
+    claimed = await db.import_jobs.update_one(
+        {'_id': job_id, 'status': 'queued'},
+        {'$set': {'status': 'running', 'started_at': datetime.now(timezone.utc)}}
+    )
+    if claimed.modified_count == 0:
+        return
+
+    params = job['params']
+    reports = stream_import_projects(
+        importer,
+        params['url'],
+        start_row=params.get('start_row', 1),
+        gid=params.get('gid', '0'),
+        project_prefix=params.get('project_prefix', ''),
+        incremental=params.get('incremental', True),
+        gids=params.get('gids'),
+        discover_tabs=params.get('discover_tabs', False),
+        create_projects=params.get('create_projects', True)
+    )
+
+    final_status = 'failed'
+    message = 'Import ended without a summary'
+    try:
+        async for report in reports:
+            elapsed = max(time.monotonic() - started, 1e-6)
+            update = {
+                key: report[key]
+                for key in ('rows_processed', 'projects_converted', 'projects_created', 'projects_updated',
+                            'rows_skipped', 'failed_rows', 'error_count')
+                if key in report
+            }
+            update['rows_per_second'] = round(report.get('rows_processed', 0) / elapsed, 1)
+            change = {'$set': update}
+            block_report = report['type'] == 'progress' or (report['type'] == 'error' and not report.get('fatal', True))
+            if block_report and report.get('errors'):
+                change['$push'] = {'errors': {'$each': report['errors'], '$slice': -MAX_JOB_ERRORS}}
+            await db.import_jobs.update_one({'_id': job_id}, change)
+
+            if report['type'] == 'complete':
+                final_status, message = 'completed', report['message']
+            elif report['type'] == 'error' and report.get('fatal', True):
+                final_status, message = 'failed', report['message']
+            elif await _cancel_requested(db, job_id):
+                final_status, message = 'cancelled', f"Cancelled after {report['rows_processed']} rows"
+                break
+    except Exception as e:
+        logging.error(f"Import job {job_id} failed: {str(e)}")
+        message = f"Import job failed: {str(e)}"
+    finally:
+        await reports.aclose()
+
+    await db.import_jobs.update_one(
+        {'_id': job_id},
+        {'$set': {'status': final_status, 'message': message, 'finished_at': datetime.now(timezone.utc)}}
+    )
+
+async def _cancel_requested(db, job_id: str) -> bool:
+    job = await db.import_jobs.find_one({'_id': job_id}, {'cancel_requested': 1})
+    return bool(job and job.get('cancel_requested'))
+
+async def get_import_job(job_id: str) -> Optional[Dict[str, Any]]:
+    db = get_database()
+    job = await db.import_jobs.find_one({'_id': job_id}, {'params': 0})
+    return _serialize_job(job) if job else None
+
+async def list_import_jobs(limit: int = 20) -> List[Dict[str, Any]]:
+    db = get_database()
+    jobs = await db.import_jobs.find({}, {'params': 0, 'errors': 0}).sort('created_at', -1).to_list(length=limit)
+    return [_serialize_job(job) for job in jobs]
+
+async def cancel_import_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Request cancellation; a queued job is cancelled immediately, a running one
+    stops after its current block (already written projects are kept)
+    """
+    db = get_database()
+    await db.import_jobs.update_one(
+        {'_id': job_id, 'status': 'queued'},
+        {'$set': {'status': 'cancelled', 'message': 'Cancelled before start', 'finished_at': datetime.now(timezone.utc)}}
+    )
+    await db.import_jobs.update_one(
+        {'_id': job_id, 'status': {'$in': list(ACTIVE_STATUSES)}},
+        {'$set': {'cancel_requested': True}}
+    )
+    return await get_import_job(job_id)
@@ -4,10 +4,17 @@ FastAPI routes for importing client questionnaires from Google Sheets
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, HttpUrl
 from typing import List, Dict, Any, Optional
+import asyncio
+import json
 import logging
 from .google_sheets_importer import GoogleSheetsImporter
+from .google_sheets_sync import persist_projects, stream_import_projects
+from .google_sheets_jobs import (
+    create_import_job, run_import_job, get_import_job, list_import_jobs, cancel_import_job
+)
 from .database import get_database
 
 router = APIRouter(prefix="/api/google-sheets", tags=["Google Sheets Import"])
@@ -17,14 +24,24 @@ class GoogleSheetsImportRequest(BaseModel):
     start_row: Optional[int] = 1
     create_projects: Optional[bool] = True
     project_prefix: Optional[str] = ""
+    gid: Optional[str] = "0"
+    # Several tabs of the same spreadsheet; with discover_tabs every tab is imported
+    gids: Optional[List[str]] = None
+    discover_tabs: Optional[bool] = False
+    # Upsert by response fingerprint and skip rows already imported from this sheet
+    incremental: Optional[bool] = True
+    preview_rows: Optional[int] = 5
 
 class ImportPreviewResponse(BaseModel):
     success: bool
     message: str
-    total_rows: int
+    # Only the preview rows are downloaded, so the sheet's full row count is unknown here
+    total_rows: Optional[int] = None
+    preview_rows: int = 0
     sample_projects: List[Dict[str, Any]]
     column_mappings: Dict[str, Any]
     errors: List[str]
+    header_mapping: Dict[str, Any] = {}
 
 class ImportExecuteResponse(BaseModel):
     success: bool
@@ -32,6 +49,9 @@ class ImportExecuteResponse(BaseModel):
     projects_created: int
     project_ids: List[str]
     errors: List[str]
+    projects_updated: int = 0
+    rows_skipped: int = 0
+    tabs: Dict[str, Any] = {}
 
 # Initialize importer
 importer = GoogleSheetsImporter()
@@ -45,25 +65,31 @@ async def get_mapping_info():
 async def preview_import(request: GoogleSheetsImportRequest):
     """Preview what will be imported from Google Sheets without creating projects"""
     try:
-        # Import data from sheet
-        result = importer.import_sheet_data(request.url, request.start_row)
+        sheet_id = importer.extract_sheet_id(request.url)
+        if not sheet_id:
+            raise HTTPException(status_code=400, detail='Invalid Google Sheets URL')
+        
+        # Fetch only the header and the rows needed for the preview
+        df = await importer.download_sheet_head(sheet_id, request.gid, request.start_row + request.preview_rows)
+        result = await asyncio.to_thread(importer.process_sheet_dataframe, df, request.start_row)
         
         if not result['success']:
             raise HTTPException(status_code=400, detail=result['message'])
         
-        # Create preview response with sample data
-        sample_projects = result['projects_data'][:5]  # First 5 projects for preview
+        sample_projects = result['projects_data'][:request.preview_rows]
         
         # Get column mapping info
         mapping_info = importer.create_sample_mapping_info()
         
         return ImportPreviewResponse(
             success=True,
-            message=f"Found {result['projects_created']} client questionnaires ready for import",
-            total_rows=result['projects_created'],
+            message=f"Previewing the first {len(sample_projects)} client questionnaires",
+            total_rows=None,
+            preview_rows=len(sample_projects),
             sample_projects=sample_projects,
             column_mappings=mapping_info,
-            errors=result['errors']
+            errors=result['errors'],
+            header_mapping=importer.header_mapping(list(df.columns))
         )
         
     except Exception as e:
@@ -74,8 +100,9 @@ async def preview_import(request: GoogleSheetsImportRequest):
 async def execute_import(request: GoogleSheetsImportRequest, background_tasks: BackgroundTasks):
     """Execute the Google Sheets import and create projects"""
     try:
-        # Import data from sheet
-        result = importer.import_sheet_data(request.url, request.start_row)
+        # Import data from sheet (one tab, an explicit list of tabs, or every discovered tab)
+        gids = request.gids or (None if request.discover_tabs else [request.gid])
+        result = await importer.import_sheet_tabs_async(request.url, gids, request.start_row)
         
         if not result['success']:
             raise HTTPException(status_code=400, detail=result['message'])
@@ -86,63 +113,107 @@ async def execute_import(request: GoogleSheetsImportRequest, background_tasks: B
                 message="Preview only - no projects created",
                 projects_created=0,
                 project_ids=[],
-                errors=result['errors']
+                errors=result['errors'],
+                tabs=result['tabs']
             )
         
-        # Create projects in database
-        db = get_database()
-        projects_collection = db.projects
-        rooms_collection = db.rooms
-        items_collection = db.items
-        
+        # Create (or sync) projects and their rooms in database with batched writes, tab by tab
+        sheet_id = importer.extract_sheet_id(request.url)
         created_project_ids = []
         creation_errors = []
+        projects_updated = 0
+        rows_skipped = 0
         
-        for project_data in result['projects_data']:
-            try:
-                # Add prefix if specified
-                if request.project_prefix:
-                    project_data['name'] = f"{request.project_prefix} {project_data['name']}"
-                
-                # Insert project into database
-                project_result = projects_collection.insert_one(project_data)
-                project_id = str(project_result.inserted_id)
-                project_data['id'] = project_id
-                
-                created_project_ids.append(project_id)
-                
-                # Create rooms if specified in questionnaire
-                if project_data.get('rooms_involved'):
-                    for room_name in project_data['rooms_involved']:
-                        room_data = {
-                            'project_id': project_id,
-                            'name': room_name.strip(),
-                            'description': f"Imported from questionnaire",
-                            'created_at': project_data.get('created_at'),
-                            'source': 'Google Sheets Import'
-                        }
-                        
-                        try:
-                            rooms_collection.insert_one(room_data)
-                        except Exception as room_error:
-                            creation_errors.append(f"Failed to create room '{room_name}': {str(room_error)}")
-                
-            except Exception as project_error:
-                client_name = project_data.get('client_info', {}).get('full_name', 'Unknown')
-                creation_errors.append(f"Failed to create project for '{client_name}': {str(project_error)}")
+        for gid, tab in result['tabs'].items():
+            if not tab['success']:
+                continue
+            
+            persisted = await persist_projects(
+                [project for project in result['projects_data'] if project['import_gid'] == gid],
+                project_prefix=request.project_prefix,
+                sheet_id=sheet_id,
+                gid=gid,
+                incremental=request.incremental
+            )
+            created_project_ids.extend(persisted['project_ids'])
+            creation_errors.extend(f"Tab {gid}: {error}" for error in persisted['errors'])
+            projects_updated += persisted['projects_updated']
+            rows_skipped += persisted['rows_skipped']
+            tab.update(
+                projects_created=len(persisted['project_ids']),
+                projects_updated=persisted['projects_updated'],
+                rows_skipped=persisted['rows_skipped'],
+                errors=tab['errors'] + persisted['errors']
+            )
         
         return ImportExecuteResponse(
             success=True,
             message=f"Successfully created {len(created_project_ids)} projects from Google Sheets questionnaires",
             projects_created=len(created_project_ids),
             project_ids=created_project_ids,
-            errors=result['errors'] + creation_errors
+            errors=result['errors'] + creation_errors,
+            projects_updated=projects_updated,
+            rows_skipped=rows_skipped,
+            tabs=result['tabs']
         )
         
     except Exception as e:
         logging.error(f"Execute import error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Import execution failed: {str(e)}")
 
+@router.post("/execute-stream")
+async def execute_import_streaming(request: GoogleSheetsImportRequest):
+    """
+    Execute the import block by block for very large sheets
+    Responds with newline-delimited JSON: one progress report per block, then a final summary
+    """
+    async def progress_lines():
+        async for report in stream_import_projects(
+            importer,
+            request.url,
+            start_row=request.start_row,
+            gid=request.gid,
+            project_prefix=request.project_prefix,
+            incremental=request.incremental,
+            gids=request.gids,
+            discover_tabs=request.discover_tabs,
+            create_projects=request.create_projects
+        ):
+            yield json.dumps(report, default=str) + "\n"
+    
+    return StreamingResponse(progress_lines(), media_type="application/x-ndjson")
+
+@router.post("/jobs")
+async def start_import_job(request: GoogleSheetsImportRequest, background_tasks: BackgroundTasks):
+    """Start the import as a background job and return its id for progress polling"""
+    if not importer.extract_sheet_id(request.url):
+        raise HTTPException(status_code=400, detail="Invalid Google Sheets URL")
+    
+    job_id = await create_import_job(request.dict())
+    background_tasks.add_task(run_import_job, importer, job_id)
+    return {"success": True, "job_id": job_id, "status": "queued"}
+
+@router.get("/jobs")
+async def get_import_jobs(limit: int = 20):
+    """Most recent import jobs"""
+    return await list_import_jobs(limit)
+
+@router.get("/jobs/{job_id}")
+async def get_import_job_status(job_id: str):
+    """Progress of an import job: rows processed, projects created/updated, errors, throughput"""
+    job = await get_import_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
+@router.post("/jobs/{job_id}/cancel")
+async def cancel_import(job_id: str):
+    """Cancel an import job; a running job stops after its current block"""
+    job = await cancel_import_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
 @router.get("/test-url/{path:path}")
 async def test_sheet_url(path: str):
     """Test if a Google Sheets URL is accessible"""
@@ -155,7 +226,7 @@ async def test_sheet_url(path: str):
             return {"success": False, "message": "Invalid Google Sheets URL format"}
         
         # Try to download a small sample
-        df = importer.download_sheet_data(sheet_id)
+        df = await importer.download_sheet_data_async(sheet_id)
         if df is None:
             return {"success": False, "message": "Cannot access sheet - check sharing permissions"}
         
@@ -177,10 +248,13 @@ async def clear_imported_projects():
         db = get_database()
         
         # Delete projects with source = 'Google Sheets Import'
-        result = db.projects.delete_many({"source": "Google Sheets Import"})
+        result = await db.projects.delete_many({"source": "Google Sheets Import"})
         
         # Delete associated rooms
-        db.rooms.delete_many({"source": "Google Sheets Import"})
+        await db.rooms.delete_many({"source": "Google Sheets Import"})
+        
+        # Reset sync high-water marks so the sheets can be imported again
+        await db.sheet_import_state.delete_many({})
         
         return {
             "success": True,
@@ -0,0 +1,363 @@
+"""
+Google Sheets Import Persistence
+Writes imported questionnaire projects (and their rooms) to MongoDB, either as
+a one-off batched insert or as an idempotent incremental sync of a sheet
+"""
+
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from datetime import datetime
+import asyncio
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import hashlib
+from .google_sheets_importer import STREAM_BLOCK_SIZE
+from .database import get_database
+
+# Documents per insert_many / bulk_write call
+INSERT_CHUNK_SIZE = 500
+
+_indexes_ready = False
+
+async def ensure_import_indexes(db) -> None:
+    """Create import indexes once per process"""
+    global _indexes_ready
+    if _indexes_ready:
+        return
+
+    await db.projects.create_index(
+        'import_fingerprint', unique=True,
+        partialFilterExpression={'import_fingerprint': {'$exists': True}}
+    )
+    await db.sheet_import_state.create_index([('sheet_id', 1), ('gid', 1)], unique=True)
+    _indexes_ready = True
+
+async def insert_in_chunks(collection, documents: List[Dict[str, Any]]) -> Dict[int, str]:
+    """
+    Insert documents with unordered insert_many calls of INSERT_CHUNK_SIZE
+    Returns {document index: error message} for every document that failed
+    """
+    failures = {}
+    for start in range(0, len(documents), INSERT_CHUNK_SIZE):
+        chunk = documents[start:start + INSERT_CHUNK_SIZE]
+        try:
+            await collection.insert_many(chunk, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get('writeErrors', []):
+                failures[start + error['index']] = error.get('errmsg', 'write error')
+        except Exception as e:
+            for offset in range(len(chunk)):
+                failures[start + offset] = str(e)
+    return failures
+
+def build_room_documents(project_id: str, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Room documents for every room listed in a questionnaire response"""
+    return [
+        {
+            'project_id': project_id,
+            'name': room_name.strip(),
+            'description': "Imported from questionnaire",
+            'created_at': project_data.get('created_at'),
+            'source': 'Google Sheets Import'
+        }
+        for room_name in project_data.get('rooms_involved') or []
+    ]
+
+def build_import_documents(projects_data: List[Dict[str, Any]], project_prefix: str = "") -> Tuple[List[Dict], List[Dict], List[int]]:
+    """
+    Build every project and room document up front
+    Project ids are assigned client-side so rooms can reference them before insertion;
+    the third value maps each room document to the index of its project
+    """
+    project_docs = []
+    room_docs = []
+    room_owners = []
+
+    for project_index, project_data in enumerate(projects_data):
+        project_doc = dict(project_data)
+        project_doc['_id'] = ObjectId()
+        # One-off imports are not tracked for incremental sync
+        project_doc.pop('import_fingerprint', None)
+        if project_prefix:
+            project_doc['name'] = f"{project_prefix} {project_doc['name']}"
+        project_docs.append(project_doc)
+
+        rooms = build_room_documents(str(project_doc['_id']), project_doc)
+        room_docs.extend(rooms)
+        room_owners.extend([project_index] * len(rooms))
+
+    return project_docs, room_docs, room_owners
+
+def update_rows_digest(digest, projects: List[Dict[str, Any]]) -> None:
+    """Feed rows into a running digest in sheet order (chunks must arrive in order)"""
+    for project in sorted(projects, key=lambda p: p['import_row']):
+        digest.update(f"{project['import_fingerprint']}:{project['import_content_hash']};".encode())
+
+def rows_digest(projects: List[Dict[str, Any]]) -> str:
+    """Digest over the content hashes of a run of imported rows"""
+    digest = hashlib.sha256()
+    update_rows_digest(digest, projects)
+    return digest.hexdigest()
+
+async def save_import_state(db, sheet_id: str, gid: str, last_row: int, prefix_digest: str) -> None:
+    await db.sheet_import_state.update_one(
+        {'sheet_id': sheet_id, 'gid': gid},
+        {'$set': {'last_row': last_row, 'prefix_digest': prefix_digest, 'last_synced_at': datetime.now().isoformat()}},
+        upsert=True
+    )
+
+async def plan_incremental_import(db, sheet_id: str, gid: str, projects: List[Dict[str, Any]],
+                                  use_high_water: bool = True) -> Dict[str, Any]:
+    """
+    Decide which converted rows must be written
+    Rows at or below the sheet's high-water mark are skipped wholesale when their
+    digest is unchanged; everything else is compared against stored content hashes
+    """
+    state = {}
+    if use_high_water:
+        state = await db.sheet_import_state.find_one({'sheet_id': sheet_id, 'gid': gid}) or {}
+    last_row = state.get('last_row', 0)
+
+    seen = [project for project in projects if project['import_row'] <= last_row]
+    if state and rows_digest(seen) == state.get('prefix_digest'):
+        candidates = [project for project in projects if project['import_row'] > last_row]
+    else:
+        candidates = projects
+
+    stored_hashes = {}
+    if candidates:
+        cursor = db.projects.find(
+            {'import_fingerprint': {'$in': [project['import_fingerprint'] for project in candidates]}},
+            {'import_fingerprint': 1, 'import_content_hash': 1}
+        )
+        async for doc in cursor:
+            stored_hashes[doc['import_fingerprint']] = doc.get('import_content_hash')
+
+    to_write = [
+        project for project in candidates
+        if stored_hashes.get(project['import_fingerprint']) != project['import_content_hash']
+    ]
+
+    return {
+        'to_write': to_write,
+        'rows_skipped': len(projects) - len(to_write),
+        'state': {
+            'last_row': max([last_row] + [project['import_row'] for project in projects]),
+            'prefix_digest': rows_digest(projects)
+        }
+    }
+
+async def upsert_projects(collection, projects: List[Dict[str, Any]], project_prefix: str = "") -> Tuple[Dict[int, ObjectId], int, Dict[int, str]]:
+    """
+    Upsert projects by import fingerprint with unordered bulk_write calls
+    Returns ({index: new _id} for inserted rows, number of updated rows, {index: error})
+    """
+    upserted = {}
+    updated = 0
+    failures = {}
+
+    operations = []
+    for project in projects:
+        fields = dict(project)
+        created_at = fields.pop('created_at', None)
+        if project_prefix:
+            fields['name'] = f"{project_prefix} {fields['name']}"
+        fields['updated_at'] = datetime.now().isoformat()
+        operations.append(UpdateOne(
+            {'import_fingerprint': project['import_fingerprint']},
+            {'$set': fields, '$setOnInsert': {'created_at': created_at}},
+            upsert=True
+        ))
+
+    for start in range(0, len(operations), INSERT_CHUNK_SIZE):
+        chunk = operations[start:start + INSERT_CHUNK_SIZE]
+        try:
+            result = await collection.bulk_write(chunk, ordered=False)
+            upserted.update({start + index: _id for index, _id in result.upserted_ids.items()})
+            updated += result.matched_count
+        except BulkWriteError as e:
+            upserted.update({start + op['index']: op['_id'] for op in e.details.get('upserted', [])})
+            updated += e.details.get('nMatched', 0)
+            for error in e.details.get('writeErrors', []):
+                failures[start + error['index']] = error.get('errmsg', 'write error')
+        except Exception as e:
+            for offset in range(len(chunk)):
+                failures[start + offset] = str(e)
+
+    return upserted, updated, failures
+
+def _project_error(project: Dict[str, Any], error: str) -> str:
+    client_name = project.get('client_info', {}).get('full_name', 'Unknown')
+    return f"Failed to create project for '{client_name}': {error}"
+
+async def persist_projects(projects_data: List[Dict[str, Any]], project_prefix: str = "",
+                           sheet_id: Optional[str] = None, gid: str = '0',
+                           incremental: bool = True, update_state: bool = True) -> Dict[str, Any]:
+    """
+    Write converted questionnaire projects and their rooms
+    Incremental mode upserts by fingerprint and only touches new or edited rows;
+    otherwise every row is inserted as a new project. update_state=False is for
+    callers that only hold part of the sheet (streaming) and save state themselves
+    """
+    db = get_database()
+    errors = []
+
+    if incremental and sheet_id:
+        await ensure_import_indexes(db)
+        plan = await plan_incremental_import(db, sheet_id, gid, projects_data, use_high_water=update_state)
+        to_write = plan['to_write']
+
+        upserted, updated, failures = await upsert_projects(db.projects, to_write, project_prefix)
+        for index, error in sorted(failures.items()):
+            errors.append(_project_error(to_write[index], error))
+
+        # Rooms are only created for responses seen for the first time
+        room_docs = []
+        for index, project_id in sorted(upserted.items()):
+            room_docs.extend(build_room_documents(str(project_id), to_write[index]))
+        room_failures = await insert_in_chunks(db.rooms, room_docs)
+        for index, error in sorted(room_failures.items()):
+            errors.append(f"Failed to create room '{room_docs[index]['name']}': {error}")
+
+        # Advance the high-water mark only after a clean sync so failed rows are retried
+        if update_state and not failures:
+            await save_import_state(db, sheet_id, gid, plan['state']['last_row'], plan['state']['prefix_digest'])
+
+        return {
+            'project_ids': [str(project_id) for _, project_id in sorted(upserted.items())],
+            'projects_updated': updated,
+            'rows_skipped': plan['rows_skipped'],
+            'failed_rows': len(failures),
+            'errors': errors
+        }
+
+    project_docs, room_docs, room_owners = build_import_documents(projects_data, project_prefix)
+
+    project_failures = await insert_in_chunks(db.projects, project_docs)
+    for index, error in sorted(project_failures.items()):
+        errors.append(_project_error(project_docs[index], error))
+
+    # Only create rooms whose project was inserted
+    pending_rooms = [room for room, owner in zip(room_docs, room_owners) if owner not in project_failures]
+    room_failures = await insert_in_chunks(db.rooms, pending_rooms)
+    for index, error in sorted(room_failures.items()):
+        errors.append(f"Failed to create room '{pending_rooms[index]['name']}': {error}")
+
+    return {
+        'project_ids': [str(doc['_id']) for index, doc in enumerate(project_docs) if index not in project_failures],
+        'projects_updated': 0,
+        'rows_skipped': 0,
+        'failed_rows': len(project_failures),
+        'errors': errors
+    }
+
+async def stream_import_projects(importer, url: str, start_row: int = 1, gid: str = '0',
+                                 project_prefix: str = "", incremental: bool = True,
+                                 block_size: int = STREAM_BLOCK_SIZE, gids: Optional[List[str]] = None,
+                                 discover_tabs: bool = False, create_projects: bool = True) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Import a sheet block by block: parse, convert and persist each block before
+    downloading the next, yielding a progress report after every block
+    Memory stays flat regardless of sheet size; only counters and errors accumulate
+    A block that fails to convert yields a non-fatal error report and its rows
+    count as failed; the saved high-water mark stops before that block
+    Tabs are resolved like /execute (gids, every discovered tab, or just gid) and
+    streamed one after another; create_projects=False converts without writing
+    """
+    sheet_id = importer.extract_sheet_id(url)
+    if not sheet_id:
+        yield {'type': 'error', 'message': 'Invalid Google Sheets URL'}
+        return
+
+    db = get_database()
+    progress = {
+        'type': 'progress',
+        'rows_processed': 0,
+        'projects_converted': 0,
+        'projects_created': 0,
+        'projects_updated': 0,
+        'rows_skipped': 0,
+        'failed_rows': 0,
+        'error_count': 0
+    }
+    errors = []
+
+    try:
+        if not gids:
+            gids = await importer.discover_sheet_gids(sheet_id) if discover_tabs else [gid]
+        gids = list(dict.fromkeys(str(tab_gid) for tab_gid in gids))
+        for tab_gid in gids:
+            label = f"Tab {tab_gid}: " if len(gids) > 1 else ''
+            async for report in _stream_tab(importer, db, sheet_id, tab_gid, label, progress, errors, start_row,
+                                            project_prefix, incremental, create_projects, block_size):
+                yield report
+    except Exception as e:
+        yield dict(progress, type='error', fatal=True, message=f"Streaming import failed: {str(e)}", errors=errors)
+        return
+
+    if create_projects:
+        message = (
+            f"Imported {progress['rows_processed']} rows: {progress['projects_created']} created, "
+            f"{progress['projects_updated']} updated, {progress['rows_skipped']} unchanged"
+        )
+    else:
+        message = f"Preview only - {progress['projects_converted']} projects in {progress['rows_processed']} rows, none written"
+    yield dict(progress, type='complete', errors=errors, message=message)
+
+async def _stream_tab(importer, db, sheet_id: str, gid: str, label: str, progress: Dict[str, Any],
+                      errors: List[str], start_row: int, project_prefix: str, incremental: bool,
+                      create_projects: bool, block_size: int) -> AsyncIterator[Dict[str, Any]]:
+    """One tab of stream_import_projects; updates the shared progress and errors in place"""
+    digest = hashlib.sha256()
+    last_row = 0
+    # High-water state as of the last block before the first failure; failed rows are retried next sync
+    saved_state = None
+
+    async for df in importer.iter_sheet_frames(sheet_id, gid, block_size):
+        progress['rows_processed'] += len(df)
+        if len(df) == 0:
+            continue
+        converted = await asyncio.to_thread(importer.process_sheet_dataframe, df, start_row)
+        if not converted['success']:
+            if saved_state is None:
+                saved_state = (last_row, digest.copy())
+            block_rows = len(df[df.index >= start_row].dropna(how='all'))
+            progress['failed_rows'] += block_rows
+            block_errors = [f"{label}Rows {df.index[0] + 1}-{df.index[-1] + 1}: {converted['message']}"]
+            errors.extend(block_errors)
+            progress['error_count'] = len(errors)
+            # Not fatal: later blocks are still imported
+            yield dict(progress, type='error', fatal=False, message=converted['message'], errors=block_errors)
+            continue
+
+        projects = converted['projects_data']
+        for project in projects:
+            project['import_gid'] = gid
+        progress['projects_converted'] += len(projects)
+        block_errors = [f"{label}{error}" for error in converted['errors']]
+
+        if create_projects:
+            persisted = await persist_projects(
+                projects, project_prefix=project_prefix, sheet_id=sheet_id, gid=gid,
+                incremental=incremental, update_state=False
+            )
+            if persisted['failed_rows'] and saved_state is None:
+                saved_state = (last_row, digest.copy())
+            update_rows_digest(digest, projects)
+            last_row = max([last_row] + [project['import_row'] for project in projects])
+
+            progress['projects_created'] += len(persisted['project_ids'])
+            progress['projects_updated'] += persisted['projects_updated']
+            progress['rows_skipped'] += persisted['rows_skipped']
+            progress['failed_rows'] += persisted['failed_rows']
+            block_errors += [f"{label}{error}" for error in persisted['errors']]
+
+        errors.extend(block_errors)
+        progress['error_count'] = len(errors)
+        yield dict(progress, errors=block_errors)
+
+    if create_projects and incremental:
+        state_row, state_digest = saved_state or (last_row, digest)
+        if state_row:
+            await ensure_import_indexes(db)
+            await save_import_state(db, sheet_id, gid, state_row, state_digest.hexdigest())
@@ -0,0 +1,319 @@
+"""
+Room Auto-Population Templates
+Flattens the nested room structures into per-room-type document templates so
+creating a room inserts its categories, subcategories and items with one
+insert_many per level. Structures are read from room_structures.json on first
+use and each room type is flattened once, the first time it is requested
+"""
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+import re
+from bson import ObjectId
+
+from enhanced_rooms import load_room_structures
+from delivery_rollup import apply_items_added
+
+DEFAULT_ITEM_STATUS = "Walkthrough"
+
+# Whole-name aliases checked before token matching
+ROOM_ALIASES = {
+    'bath': 'bathroom',
+    'full bath': 'bathroom',
+    'half bath': 'powder room',
+    'ensuite': 'primary bathroom',
+    'family room': 'living room',
+    'great room': 'living room',
+    'sitting room': 'living room',
+    'home office': 'office',
+    'study': 'office',
+    'mudroom': 'laundry room',
+    'utility room': 'laundry room',
+    'wet bar': 'bar',
+    'breakfast nook': 'dining room',
+}
+
+# Per-token rewrites applied to both template keys and room names
+TOKEN_SYNONYMS = {
+    'bath': 'bathroom',
+    'bathrm': 'bathroom',
+    'bdrm': 'bedroom',
+    'br': 'bedroom',
+    'master': 'primary',
+    'main': 'primary',
+    'owners': 'primary',
+    'lr': 'living',
+    'dr': 'dining',
+    'ofc': 'office',
+}
+
+# Qualifiers that don't change which template a room gets ("Kids Bedroom 2")
+IGNORED_TOKENS = {
+    'room', 'the', 'and', 'of', 'kids', 'kid', 'childrens', 'children', 'boys', 'girls',
+    'guest', 'nanny', 'upstairs', 'downstairs', 'upper', 'lower', 'first', 'second',
+    'third', 'new', 'his', 'her', 'hers', 'north', 'south', 'east', 'west',
+}
+
+# Room words with no template of their own; never spell-corrected into one ("barn" is not "bar")
+KNOWN_WORDS = {
+    'attic', 'balcony', 'basement', 'bonus', 'cabana', 'cellar', 'closet', 'entry', 'entryway',
+    'foyer', 'garage', 'garden', 'gallery', 'hallway', 'landing', 'lanai', 'library', 'lounge',
+    'media', 'nursery', 'pantry', 'patio', 'playroom', 'porch', 'sunroom', 'studio', 'terrace',
+    'theater', 'theatre', 'workshop',
+}
+# Shorter tokens are too close to other short words to correct safely
+MIN_CORRECTION_LENGTH = 5
+
+_TOKEN_PATTERN = re.compile(r"[a-z]+")
+
+
+class RoomTemplate:
+    """Flat category/subcategory/item rows for one room type, linked by list position"""
+
+    def __init__(self, room_type: str, structure: Dict[str, Any]):
+        self.room_type = room_type
+        self.categories: List[Dict[str, Any]] = []
+        self.subcategories: List[Dict[str, Any]] = []
+        self.items: List[Dict[str, Any]] = []
+
+        for category_order, category in enumerate(structure.get('categories', [])):
+            category_index = len(self.categories)
+            self.categories.append({
+                'name': category['name'],
+                'color': category.get('color'),
+                'order': category_order
+            })
+            for subcategory_order, subcategory in enumerate(category.get('subcategories', [])):
+                subcategory_index = len(self.subcategories)
+                self.subcategories.append({
+                    'category_index': category_index,
+                    'name': subcategory['name'],
+                    'color': subcategory.get('color'),
+                    'order': subcategory_order
+                })
+                for item_order, item in enumerate(subcategory.get('items', [])):
+                    self.items.append({
+                        'category_index': category_index,
+                        'subcategory_index': subcategory_index,
+                        'name': item['name'],
+                        'finish_color': item.get('finish_color', ''),
+                        'order': item_order
+                    })
+
+    def instantiate(self, project_id: str, room_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Concrete documents for one room, with ids assigned so every level can be inserted in one call"""
+        now = datetime.now(timezone.utc)
+        category_ids = [ObjectId() for _ in self.categories]
+        subcategory_ids = [ObjectId() for _ in self.subcategories]
+
+        categories = [
+            {
+                '_id': category_ids[index],
+                'project_id': project_id,
+                'room_id': room_id,
+                'name': row['name'],
+                'color': row['color'],
+                'order': row['order']
+            }
+            for index, row in enumerate(self.categories)
+        ]
+        subcategories = [
+            {
+                '_id': subcategory_ids[index],
+                'project_id': project_id,
+                'room_id': room_id,
+                'category_id': str(category_ids[row['category_index']]),
+                'name': row['name'],
+                'color': row['color'],
+                'order': row['order']
+            }
+            for index, row in enumerate(self.subcategories)
+        ]
+        items = [
+            {
+                '_id': ObjectId(),
+                'project_id': project_id,
+                'room_id': room_id,
+                'category_id': str(category_ids[row['category_index']]),
+                'subcategory_id': str(subcategory_ids[row['subcategory_index']]),
+                'name': row['name'],
+                'finish_color': row['finish_color'],
+                'order': row['order'],
+                'quantity': 1,
+                'status': DEFAULT_ITEM_STATUS,
+                'created_at': now,
+                'updated_at': now
+            }
+            for row in self.items
+        ]
+        return {'categories': categories, 'subcategories': subcategories, 'items': items}
+
+
+@lru_cache(maxsize=1)
+def _room_structures() -> Dict[str, Dict[str, Any]]:
+    structures = load_room_structures()
+    # Intelligent structures only fill room types the comprehensive list doesn't define
+    return {**structures['intelligent'], **structures['comprehensive']}
+
+
+def room_types() -> List[str]:
+    """Room types that have their own template"""
+    return sorted(_room_structures())
+
+
+@lru_cache(maxsize=None)
+def get_template(room_type: str) -> RoomTemplate:
+    """Flattened template for a known room type, or the default template"""
+    structure = _room_structures().get(room_type)
+    if structure is None:
+        return RoomTemplate('default', load_room_structures()['default'])
+    return RoomTemplate(room_type, structure)
+
+
+def _tokens(name: str) -> List[str]:
+    """Lowercase word tokens with synonyms applied and qualifiers and numbers dropped"""
+    words = _TOKEN_PATTERN.findall(name.lower().replace("'", ''))
+    tokens = [TOKEN_SYNONYMS.get(word, word) for word in words]
+    return [token for token in tokens if token not in IGNORED_TOKENS]
+
+
+def _deletions(word: str) -> List[str]:
+    return [word[:index] + word[index + 1:] for index in range(len(word))]
+
+
+class RoomNameIndex:
+    """
+    Precomputed lookup from free-form room names to template room types
+    Names are normalized through the token synonyms before any lookup, so
+    "master bedroom" and "Primary Bedroom" get the same template; normalized keys
+    and aliases are dictionary hits. Otherwise each unknown token of 5+ letters
+    is spell corrected through a single-deletion neighbourhood index and
+    candidates come from the room types whose head word (e.g. "bedroom") appears
+    """
+
+    def __init__(self, room_types: List[str]):
+        self.exact = {room_type: room_type for room_type in room_types}
+        self.token_sets: Dict[str, frozenset] = {}
+        self.by_head: Dict[str, List[str]] = {}
+        self.vocabulary: set = set()
+
+        # Keys that normalize alike ("master bedroom" / "primary bedroom") keep the one already in normal form
+        by_tokens: Dict[tuple, str] = {}
+        for room_type in sorted(room_types):
+            tokens = tuple(_tokens(room_type))
+            if tokens not in by_tokens or ' '.join(tokens) == room_type:
+                by_tokens[tokens] = room_type
+        for tokens, room_type in by_tokens.items():
+            self.token_sets[room_type] = frozenset(tokens)
+            self.by_head.setdefault(tokens[-1], []).append(room_type)
+            self.vocabulary.update(tokens)
+
+        self.aliases = {}
+        for alias, room_type in ROOM_ALIASES.items():
+            if room_type in self.exact:
+                self.aliases[' '.join(_tokens(alias))] = room_type
+        for tokens, room_type in by_tokens.items():
+            self.aliases.setdefault(' '.join(tokens), room_type)
+        self.vocabulary.update(token for alias in self.aliases for token in alias.split())
+
+        self.corrections: Dict[str, str] = {}
+        for word in sorted(self.vocabulary):
+            for variant in _deletions(word):
+                self.corrections.setdefault(variant, word)
+
+    def _correct(self, token: str) -> str:
+        """Nearest vocabulary word within about one edit (short and known words are kept as they are)"""
+        if token in self.vocabulary or token in KNOWN_WORDS or len(token) < MIN_CORRECTION_LENGTH:
+            return token
+        if token in self.corrections:
+            return self.corrections[token]
+        for variant in _deletions(token):
+            if variant in self.vocabulary:
+                return variant
+            if variant in self.corrections:
+                return self.corrections[variant]
+        return token
+
+    def resolve(self, room_name: str) -> Optional[str]:
+        """Template room type for a room name, or None when nothing matches"""
+        name = room_name.strip().lower()
+        tokens = _tokens(name)
+        if not tokens:
+            return self.exact.get(name)
+        # Template keys go through the same synonyms, so an exact "master bedroom" is a "primary bedroom"
+        key = ' '.join(tokens)
+        if key in self.aliases:
+            return self.aliases[key]
+
+        tokens = [self._correct(token) for token in tokens]
+        key = ' '.join(tokens)
+        if key in self.aliases:
+            return self.aliases[key]
+
+        query = set(tokens)
+        candidates = {room_type for token in query for room_type in self.by_head.get(token, [])}
+        if not candidates:
+            return None
+
+        def rank(room_type):
+            room_tokens = self.token_sets[room_type]
+            overlap = len(room_tokens & query) / len(room_tokens | query)
+            return (-overlap, len(room_tokens), room_type)
+
+        return min(candidates, key=rank)
+
+
+@lru_cache(maxsize=1)
+def room_name_index() -> RoomNameIndex:
+    return RoomNameIndex(room_types())
+
+
+@lru_cache(maxsize=1024)
+def resolve_room_type(room_name: str) -> str:
+    """Template room type for a room name ("Primary Bath" -> "primary bathroom"), or 'default'"""
+    return room_name_index().resolve(room_name) or 'default'
+
+
+def get_room_template(room_name: str) -> RoomTemplate:
+    """Template for a room name, falling back to the default structure"""
+    return get_template(resolve_room_type(room_name))
+
+
+def nest_room_documents(documents: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Rebuild categories -> subcategories -> items for API responses"""
+    def public(doc):
+        doc = dict(doc)
+        doc['id'] = str(doc.pop('_id'))
+        return doc
+
+    categories = [dict(public(doc), subcategories=[]) for doc in documents['categories']]
+    categories_by_id = {category['id']: category for category in categories}
+    subcategories_by_id = {}
+    for doc in documents['subcategories']:
+        subcategory = dict(public(doc), items=[])
+        subcategories_by_id[subcategory['id']] = subcategory
+        categories_by_id[subcategory['category_id']]['subcategories'].append(subcategory)
+    for doc in documents['items']:
+        item = public(doc)
+        subcategories_by_id[item['subcategory_id']]['items'].append(item)
+    return categories
+
+
+async def populate_room(db, project_id: str, room_id: str, room_name: str,
+                        template: Optional[RoomTemplate] = None) -> List[Dict[str, Any]]:
+    """
+    Insert a room's template rows: one insert_many per level (categories,
+    subcategories, items) and returns the nested structure
+    """
+    template = template or get_room_template(room_name)
+    documents = template.instantiate(project_id, room_id)
+
+    if documents['categories']:
+        await db.categories.insert_many(documents['categories'])
+    if documents['subcategories']:
+        await db.subcategories.insert_many(documents['subcategories'])
+    if documents['items']:
+        await db.items.insert_many(documents['items'])
+        await apply_items_added(documents['items'])
+
+    return nest_room_documents(documents)
@@ -18,8 +18,6 @@ import time
 from datetime import datetime, timezone
 from enum import Enum
 from playwright.async_api import async_playwright
-from enhanced_rooms import COMPREHENSIVE_ROOM_STRUCTURE  # Add comprehensive structure import
-from enhanced_rooms_intelligent import INTELLIGENT_ROOM_STRUCTURE  # Add intelligent structure import
 import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -28,6 +26,12 @@ from dotenv import load_dotenv
 
 # Import Google Sheets functionality
 from google_sheets_routes import router as google_sheets_router
+from tracking_routes import router as tracking_router
+from furniture_routes import router as furniture_router
+from tracking_events import link_item_tracking
+from delivery_rollup import apply_item_change, delete_project_rollups
+from room_templates import populate_room
+from furniture_prices import canonical_item_url
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -46,6 +50,12 @@ app.add_middleware(
 # Include Google Sheets import routes
 app.include_router(google_sheets_router)
 
+# Include shipment tracking routes (carrier webhooks)
+app.include_router(tracking_router)
+
+# Include unified furniture catalog routes
+app.include_router(furniture_router)
+
 # ... [rest of existing server.py code remains the same] ...
 
 # Database connection
@@ -207,7 +217,9 @@ async def delete_project(project_id: str):
         # Delete associated rooms, categories, and items
         await rooms_collection.delete_many({"project_id": project_id})
         await categories_collection.delete_many({"project_id": project_id})
+        await db.subcategories.delete_many({"project_id": project_id})
         await items_collection.delete_many({"project_id": project_id})
+        await delete_project_rollups(project_id)
         
         result = await projects_collection.delete_one({"_id": ObjectId(project_id)})
         
@@ -220,14 +232,19 @@ async def delete_project(project_id: str):
 
 # Rooms
 @app.post("/api/rooms")
-async def create_room(room: Room):
+async def create_room(room: Room, auto_populate: bool = True):
     room_dict = room.dict()
     room_dict['created_at'] = datetime.now(timezone.utc)
     
     result = await rooms_collection.insert_one(room_dict)
     created_room = await rooms_collection.find_one({"_id": result.inserted_id})
+    created_room = serialize_doc(created_room)
+    
+    # Add the room type's categories, subcategories and items from the precompiled template
+    if auto_populate:
+        created_room['categories'] = await populate_room(db, room.project_id, created_room['id'], room.name)
     
-    return serialize_doc(created_room)
+    return created_room
 
 @app.get("/api/projects/{project_id}/rooms")
 async def get_project_rooms(project_id: str):
@@ -248,12 +265,18 @@ async def get_room(room_id: str):
 @app.post("/api/items")
 async def create_item(item: Item):
     item_dict = item.dict()
+    item_dict['canonical_url'] = canonical_item_url(item_dict.get('url'))
     item_dict['created_at'] = datetime.now(timezone.utc)
     item_dict['updated_at'] = datetime.now(timezone.utc)
     
     result = await items_collection.insert_one(item_dict)
     created_item = await items_collection.find_one({"_id": result.inserted_id})
     
+    if created_item.get('tracking_number'):
+        await link_item_tracking(str(created_item['_id']), created_item['project_id'],
+                                 created_item.get('room_id'), created_item['tracking_number'])
+    await apply_item_change(None, created_item)
+    
     return serialize_doc(created_item)
 
 @app.get("/api/projects/{project_id}/items")
@@ -265,8 +288,11 @@ async def get_project_items(project_id: str):
 async def update_item(item_id: str, item: Item):
     try:
         item_dict = item.dict(exclude_unset=True)
+        if 'url' in item_dict:
+            item_dict['canonical_url'] = canonical_item_url(item_dict['url'])
         item_dict['updated_at'] = datetime.now(timezone.utc)
         
+        previous_item = await items_collection.find_one({"_id": ObjectId(item_id)})
         result = await items_collection.update_one(
             {"_id": ObjectId(item_id)},
             {"$set": item_dict}
@@ -276,6 +302,12 @@ async def update_item(item_id: str, item: Item):
             raise HTTPException(status_code=404, detail="Item not found")
         
         updated_item = await items_collection.find_one({"_id": ObjectId(item_id)})
+        
+        if item_dict.get('tracking_number'):
+            await link_item_tracking(item_id, updated_item['project_id'],
+                                     updated_item.get('room_id'), updated_item['tracking_number'])
+        await apply_item_change(previous_item, updated_item)
+        
         return serialize_doc(updated_item)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Update failed: {str(e)}")
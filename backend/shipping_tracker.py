@@ -4,13 +4,104 @@ Real-time tracking integration with major carriers
 """
 import aiohttp
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Callable, NamedTuple
 from datetime import datetime
 import logging
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+_SEPARATORS = re.compile(r'[\s\-]+')
+
+
+def _mod10_weighted(digits: str) -> bool:
+    """UCC/IMpb mod 10: weights 3,1,3,1... from the right, last digit is the check digit"""
+    body, check = digits[:-1], int(digits[-1])
+    total = sum(int(d) * (3 if i % 2 == 0 else 1) for i, d in enumerate(reversed(body)))
+    return (10 - total % 10) % 10 == check
+
+
+def _ups_check_digit(tracking_number: str) -> bool:
+    """UPS 1Z check digit: letters map to (ordinal + 2) mod 10, even positions doubled"""
+    body, check = tracking_number[2:-1], tracking_number[-1]
+    if not check.isdigit():
+        return False
+    total = 0
+    for i, char in enumerate(body):
+        value = int(char) if char.isdigit() else (ord(char) - ord('A') + 2) % 10
+        total += value * 2 if i % 2 else value
+    return (10 - total % 10) % 10 == int(check)
+
+
+def _fedex_express_check_digit(tracking_number: str) -> bool:
+    """FedEx 12-digit Express: weights 1,3,7 from the right, mod 11 then mod 10"""
+    body, check = tracking_number[:-1], int(tracking_number[-1])
+    weights = (1, 3, 7)
+    total = sum(int(d) * weights[i % 3] for i, d in enumerate(reversed(body)))
+    return total % 11 % 10 == check
+
+
+def _fedex_ground_check_digit(tracking_number: str) -> bool:
+    """FedEx Ground 96-prefixed barcodes carry a mod 10 check on the trailing 15 digits"""
+    return _mod10_weighted(tracking_number[-15:])
+
+
+def _s10_check_digit(tracking_number: str) -> bool:
+    """UPU S10 international (e.g. EA123456785US): weights 8,6,4,2,3,5,9,7 mod 11"""
+    serial, check = tracking_number[2:10], int(tracking_number[10])
+    total = sum(int(d) * w for d, w in zip(serial, (8, 6, 4, 2, 3, 5, 9, 7)))
+    expected = 11 - total % 11
+    if expected == 10:
+        expected = 0
+    elif expected == 11:
+        expected = 5
+    return expected == check
+
+
+class CarrierPattern(NamedTuple):
+    carrier: str
+    pattern: re.Pattern
+    validator: Optional[Callable[[str], bool]] = None
+
+
+# Ordered registry. Entries with a validator match only when the check digit
+# passes; the first one to pass wins. Numbers that fail every check digit fall
+# back to the first format-only entry (no validator) they match, so hand-typed
+# numbers still resolve to the carrier their shape suggests.
+CARRIER_PATTERNS: List[CarrierPattern] = [
+    CarrierPattern('ups', re.compile(r'^1Z[A-Z0-9]{16}$'), _ups_check_digit),
+    CarrierPattern('usps', re.compile(r'^9[2-5][0-9]{20}$'), _mod10_weighted),
+    CarrierPattern('usps', re.compile(r'^[A-Z]{2}[0-9]{9}[A-Z]{2}$'), _s10_check_digit),
+    CarrierPattern('fedex', re.compile(r'^96[0-9]{20}$'), _fedex_ground_check_digit),
+    CarrierPattern('fedex', re.compile(r'^[0-9]{12}$'), _fedex_express_check_digit),
+    CarrierPattern('fedex', re.compile(r'^[0-9]{15}$'), _mod10_weighted),
+    CarrierPattern('usps', re.compile(r'^[0-9]{20}$'), _mod10_weighted),
+    # Format-only fallbacks
+    CarrierPattern('fedex', re.compile(r'^(?:[0-9]{12}|[0-9]{14}|[0-9]{20}|[0-9]{22})$')),
+    CarrierPattern('ups', re.compile(r'^1Z[A-Z0-9]{16}$')),
+    CarrierPattern('usps', re.compile(r'^[A-Z]{2}[0-9]{9}[A-Z]{2}$')),
+    CarrierPattern('dhl', re.compile(r'^[0-9]{10}$')),
+]
+
+
+def normalize_tracking_number(tracking_number: str) -> str:
+    """Strip spaces/dashes and upper-case a tracking number"""
+    return _SEPARATORS.sub('', str(tracking_number)).upper()
+
+
+def detect_carrier_normalized(tracking_number: str) -> Optional[str]:
+    """Classify an already-normalized tracking number against CARRIER_PATTERNS"""
+    fallback = None
+    for entry in CARRIER_PATTERNS:
+        if not entry.pattern.match(tracking_number):
+            continue
+        if entry.validator is None:
+            if fallback is None:
+                fallback = entry.carrier
+        elif entry.validator(tracking_number):
+            return entry.carrier
+    return fallback
+
 class ShippingTracker:
     def __init__(self):
         self.carriers = {
@@ -79,29 +170,16 @@ class ShippingTracker:
     
     def _detect_carrier(self, tracking_number: str) -> Optional[str]:
         """Auto-detect carrier based on tracking number format"""
-        tracking_number = tracking_number.replace(' ', '').replace('-', '').upper()
-        
-        # FedEx patterns
-        if (len(tracking_number) == 12 and tracking_number.isdigit()) or \
-           (len(tracking_number) == 14 and tracking_number.isdigit()) or \
-           (len(tracking_number) == 20 and tracking_number.isdigit()) or \
-           (len(tracking_number) == 22 and tracking_number.isdigit()):
-            return 'fedex'
-        
-        # UPS patterns
-        if re.match(r'^1Z[A-Z0-9]{16}$', tracking_number):
-            return 'ups'
-        
-        # USPS patterns
-        if re.match(r'^(94|93|92|94|95)[0-9]{20}$', tracking_number) or \
-           re.match(r'^[A-Z]{2}[0-9]{9}[A-Z]{2}$', tracking_number):
-            return 'usps'
-        
-        # DHL patterns
-        if len(tracking_number) == 10 and tracking_number.isdigit():
-            return 'dhl'
-        
-        return None
+        return detect_carrier_normalized(normalize_tracking_number(tracking_number))
+    
+    def detect_carriers(self, tracking_numbers: Iterable[str]) -> List[Optional[str]]:
+        """
+        Classify many tracking numbers at once
+        Duplicates are classified once, so repeated numbers in an import are free
+        """
+        normalized = [normalize_tracking_number(tn) for tn in tracking_numbers]
+        carriers = {tn: detect_carrier_normalized(tn) for tn in dict.fromkeys(normalized)}
+        return [carriers[tn] for tn in normalized]
     
     async def _get_carrier_tracking(self, tracking_number: str, carrier: str) -> Dict[str, Any]:
         """Get tracking information from specific carrier"""
@@ -293,7 +371,9 @@ class ShippingTracker:
         """Track multiple shipments concurrently"""
         import asyncio
         
-        tasks = [self.track_shipment(tn) for tn in tracking_numbers]
+        # Classify the whole batch up front; repeated numbers are detected once
+        carriers = self.detect_carriers(tracking_numbers)
+        tasks = [self.track_shipment(tn, carrier) for tn, carrier in zip(tracking_numbers, carriers)]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Handle any exceptions
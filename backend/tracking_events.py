@@ -0,0 +1,378 @@
+"""
+Shipment Tracking Event Log for Interior Design Management
+Append-only tracking_events collection fed by carrier webhooks and polling,
+linked to items/projects so delivery timelines are read from storage
+"""
+import hashlib
+import hmac
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Callable
+
+import aiohttp
+from pymongo.errors import BulkWriteError
+from dotenv import load_dotenv
+
+from database import get_database
+from shipping_tracker import shipping_tracker, normalize_tracking_number
+from delivery_rollup import refresh_item_etas
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = 'X-Tracking-Signature'
+DUPLICATE_KEY_ERROR = 11000
+
+# Carrier-specific signature checks can be registered here; anything not
+# registered falls back to HMAC-SHA256 over the raw request body.
+SIGNATURE_VERIFIERS: Dict[str, Callable[[bytes, Dict[str, str]], bool]] = {}
+
+_indexes_ready = False
+
+
+def register_signature_verifier(carrier: str, verifier: Callable[[bytes, Dict[str, str]], bool]) -> None:
+    """Plug in a carrier's own webhook signature scheme"""
+    SIGNATURE_VERIFIERS[carrier.lower()] = verifier
+
+
+def _allow_unsigned() -> bool:
+    """Explicit opt-in for local development without a webhook secret"""
+    return os.getenv('TRACKING_WEBHOOK_ALLOW_UNSIGNED', '').lower() in ('1', 'true', 'yes')
+
+
+def _webhook_secret(carrier: str) -> str:
+    return os.getenv(f'TRACKING_WEBHOOK_SECRET_{carrier.upper()}', os.getenv('TRACKING_WEBHOOK_SECRET', ''))
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """HMAC-SHA256 signature in the form sent in the X-Tracking-Signature header"""
+    return 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(carrier: str, body: bytes, headers: Dict[str, str]) -> bool:
+    """
+    Verify an inbound webhook delivery
+    Without a configured secret deliveries are rejected, unless
+    TRACKING_WEBHOOK_ALLOW_UNSIGNED=1 is set (local development)
+    """
+    verifier = SIGNATURE_VERIFIERS.get(carrier.lower())
+    if verifier:
+        return verifier(body, headers)
+
+    secret = _webhook_secret(carrier)
+    if not secret:
+        if _allow_unsigned():
+            logger.warning(f"No webhook secret configured for {carrier}; accepting unsigned delivery (TRACKING_WEBHOOK_ALLOW_UNSIGNED)")
+            return True
+        logger.error(f"No webhook secret configured for {carrier}; rejecting delivery")
+        return False
+
+    signature = headers.get(SIGNATURE_HEADER.lower(), '')
+    return hmac.compare_digest(signature, sign_payload(body, secret))
+
+
+def event_idempotency_key(carrier: str, event: Dict[str, Any]) -> str:
+    """Carrier event id when provided, otherwise a hash of the event identity"""
+    if event.get('event_id'):
+        return f"{carrier}:{event['event_id']}"
+    identity = f"{carrier}|{event['tracking_number']}|{event['timestamp'].isoformat()}|{event['status']}"
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+def normalize_event(carrier: str, event: Dict[str, Any], delivery_key: Optional[str] = None) -> Dict[str, Any]:
+    """Convert a validated webhook event into a tracking_events document"""
+    timestamp = event.get('timestamp') or datetime.now(timezone.utc)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    doc = {
+        'tracking_number': normalize_tracking_number(event['tracking_number']),
+        'carrier': carrier.lower(),
+        'status': event['status'].strip(),
+        'timestamp': timestamp,
+        'location': event.get('location'),
+        'description': event.get('description'),
+        'estimated_delivery': event.get('estimated_delivery'),
+        'event_id': event.get('event_id'),
+        'source': 'webhook',
+        'received_at': datetime.now(timezone.utc)
+    }
+    doc['idempotency_key'] = event_idempotency_key(carrier.lower(), doc)
+    if delivery_key and not doc['event_id']:
+        # A client-supplied Idempotency-Key scopes every event in that delivery
+        doc['idempotency_key'] = f"{delivery_key}:{doc['idempotency_key']}"
+    return doc
+
+
+async def ensure_tracking_indexes() -> None:
+    """Create tracking_events indexes once per process"""
+    global _indexes_ready
+    if _indexes_ready:
+        return
+
+    db = get_database()
+    await db.tracking_events.create_index('idempotency_key', unique=True)
+    await db.tracking_events.create_index(
+        [('tracking_number', 1), ('timestamp', 1), ('status', 1)], unique=True
+    )
+    await db.tracking_events.create_index([('item_ids', 1), ('timestamp', 1)])
+    await db.tracking_events.create_index([('project_ids', 1), ('timestamp', 1)])
+    _indexes_ready = True
+
+
+def serialize_event(doc: Dict[str, Any]) -> Dict[str, Any]:
+    doc['id'] = str(doc.pop('_id'))
+    return doc
+
+
+async def _link_events_to_items(events: List[Dict[str, Any]]) -> None:
+    """Denormalize item/project/room ids onto events so timelines are a single indexed query"""
+    numbers = set()
+    for event in events:
+        numbers.add(event['tracking_number'])
+        numbers.add(event.get('raw_tracking_number', event['tracking_number']))
+
+    db = get_database()
+    links: Dict[str, Dict[str, set]] = {}
+    cursor = db.items.find(
+        {'tracking_number': {'$in': list(numbers)}},
+        {'_id': 1, 'project_id': 1, 'room_id': 1, 'tracking_number': 1}
+    )
+    async for item in cursor:
+        link = links.setdefault(normalize_tracking_number(item['tracking_number']),
+                                {'item_ids': set(), 'project_ids': set(), 'room_ids': set()})
+        link['item_ids'].add(str(item['_id']))
+        if item.get('project_id'):
+            link['project_ids'].add(item['project_id'])
+        if item.get('room_id'):
+            link['room_ids'].add(item['room_id'])
+
+    for event in events:
+        link = links.get(event['tracking_number'], {})
+        for field in ('item_ids', 'project_ids', 'room_ids'):
+            event[field] = sorted(link.get(field, ()))
+
+
+async def _drop_unchanged_polled_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Polled carrier pages stamp events with the fetch time, so only keep a
+    polled event when its status differs from the last stored one
+    """
+    db = get_database()
+    kept = []
+    last_status: Dict[str, Optional[str]] = {}
+    for event in sorted(events, key=lambda e: e['timestamp']):
+        number = event['tracking_number']
+        if number not in last_status:
+            previous = await db.tracking_events.find_one(
+                {'tracking_number': number}, {'status': 1}, sort=[('timestamp', -1)]
+            )
+            last_status[number] = previous['status'] if previous else None
+        if event['status'] != last_status[number]:
+            kept.append(event)
+            last_status[number] = event['status']
+    return kept
+
+
+async def record_tracking_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Append normalized events to the tracking_events log
+    Duplicates on (tracking_number, timestamp, status) or on the idempotency key
+    are skipped; returns the newly stored events so callers only react to fresh data
+    """
+    if not events:
+        return {'recorded': [], 'duplicates': 0}
+
+    await ensure_tracking_indexes()
+    db = get_database()
+    await _link_events_to_items(events)
+
+    duplicate_indexes = set()
+    try:
+        await db.tracking_events.insert_many(events, ordered=False)
+    except BulkWriteError as e:
+        for error in e.details.get('writeErrors', []):
+            if error.get('code') != DUPLICATE_KEY_ERROR:
+                raise
+            duplicate_indexes.add(error['index'])
+
+    recorded = [event for i, event in enumerate(events) if i not in duplicate_indexes]
+    return {'recorded': recorded, 'duplicates': len(duplicate_indexes)}
+
+
+async def link_item_tracking(item_id: str, project_id: str, room_id: Optional[str], tracking_number: str) -> None:
+    """
+    Attach an item to events already stored for its tracking number
+    Called when an item gains a tracking number after events were received;
+    event content itself is never rewritten
+    """
+    if not tracking_number:
+        return
+
+    db = get_database()
+    add = {'item_ids': item_id, 'project_ids': project_id}
+    if room_id:
+        add['room_ids'] = room_id
+    await db.tracking_events.update_many(
+        {'tracking_number': normalize_tracking_number(tracking_number)},
+        {'$addToSet': add}
+    )
+
+
+async def get_item_events(item_id: str) -> List[Dict[str, Any]]:
+    """Stored tracking history for one item, oldest first"""
+    db = get_database()
+    events = await db.tracking_events.find({'item_ids': item_id}).sort('timestamp', 1).to_list(length=None)
+    return [serialize_event(event) for event in events]
+
+
+async def get_project_timeline(project_id: str) -> List[Dict[str, Any]]:
+    """Every stored tracking event across a project, oldest first, in one indexed query"""
+    db = get_database()
+    events = await db.tracking_events.find({'project_ids': project_id}).sort('timestamp', 1).to_list(length=None)
+    return [serialize_event(event) for event in events]
+
+
+async def apply_events_to_items(events: List[Dict[str, Any]]) -> int:
+    """
+    Update items whose tracking number matches, using the newest event per number
+    Older events arriving late never overwrite a newer status
+    """
+    latest: Dict[str, Dict[str, Any]] = {}
+    for event in events:
+        current = latest.get(event['tracking_number'])
+        if current is None or event['timestamp'] > current['timestamp']:
+            latest[event['tracking_number']] = event
+
+    db = get_database()
+    items_updated = 0
+
+    for tracking_number, event in latest.items():
+        update = {
+            'tracking_status': event['status'],
+            'tracking_location': event.get('location'),
+            'tracking_updated_at': event['timestamp'],
+            'updated_at': datetime.now(timezone.utc)
+        }
+        if not update['tracking_location']:
+            del update['tracking_location']
+        if event.get('estimated_delivery'):
+            update['expected_delivery'] = event['estimated_delivery']
+
+        numbers = [tracking_number, event.get('raw_tracking_number', tracking_number)]
+        result = await db.items.update_many(
+            {
+                'tracking_number': {'$in': numbers},
+                '$or': [
+                    {'tracking_updated_at': {'$exists': False}},
+                    {'tracking_updated_at': None},
+                    {'tracking_updated_at': {'$lt': event['timestamp']}}
+                ]
+            },
+            {'$set': update}
+        )
+        items_updated += result.modified_count
+
+        if result.modified_count:
+            items = await db.items.find({'tracking_number': {'$in': numbers}}).to_list(length=None)
+            await refresh_item_etas(items)
+
+    return items_updated
+
+
+async def ingest_webhook_events(carrier: str, events: List[Dict[str, Any]],
+                                delivery_key: Optional[str] = None) -> Dict[str, Any]:
+    """Normalize, store and apply a batch of pushed tracking events"""
+    carrier = carrier.lower()
+    if carrier not in shipping_tracker.carriers:
+        raise ValueError(f"Unsupported carrier: {carrier}")
+
+    docs = []
+    for event in events:
+        doc = normalize_event(carrier, event, delivery_key)
+        doc['raw_tracking_number'] = event['tracking_number']
+        docs.append(doc)
+
+    stored = await record_tracking_events(docs)
+    items_updated = await apply_events_to_items(stored['recorded'])
+
+    return {
+        'success': True,
+        'carrier': shipping_tracker.carriers[carrier]['name'],
+        'received': len(docs),
+        'recorded': len(stored['recorded']),
+        'duplicates': stored['duplicates'],
+        'items_updated': items_updated
+    }
+
+
+async def track_and_record(tracking_number: str, carrier: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Poll a carrier via ShippingTracker and append any status change to the log
+    Views should read stored events instead of calling this on every render
+    """
+    result = await shipping_tracker.track_shipment(tracking_number, carrier)
+    if not result.get('success'):
+        return result
+
+    carrier_key = next(
+        (key for key, info in shipping_tracker.carriers.items() if info['name'] == result['carrier']),
+        result['carrier'].lower()
+    )
+    docs = []
+    for event in result.get('events', []):
+        doc = normalize_event(carrier_key, {
+            'tracking_number': tracking_number,
+            'status': event['status'],
+            'timestamp': datetime.fromisoformat(event['timestamp']),
+            'location': event.get('location'),
+            'estimated_delivery': result.get('estimated_delivery')
+        })
+        doc['source'] = 'poll'
+        doc['raw_tracking_number'] = tracking_number
+        docs.append(doc)
+
+    stored = await record_tracking_events(await _drop_unchanged_polled_events(docs))
+    await apply_events_to_items(stored['recorded'])
+    result['events_recorded'] = len(stored['recorded'])
+    return result
+
+
+async def emit_test_tracking_event(base_url: str, carrier: str, tracking_number: str,
+                                   status: str = 'In Transit', location: str = 'Local test hub',
+                                   secret: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Stand-in carrier for local testing: signs and POSTs one event to the webhook endpoint
+    Uses the same secret lookup as verify_signature unless one is passed explicitly
+    """
+    payload = {
+        'events': [{
+            'tracking_number': tracking_number,
+            'status': status,
+            'location': location,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }]
+    }
+    body = json.dumps(payload).encode()
+    headers = {'Content-Type': 'application/json'}
+
+    secret = secret if secret is not None else _webhook_secret(carrier)
+    if secret:
+        headers[SIGNATURE_HEADER] = sign_payload(body, secret)
+
+    url = f"{base_url.rstrip('/')}/api/tracking/webhooks/{carrier.lower()}"
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url, data=body, headers=headers) as response:
+            return {'status': response.status, 'body': await response.json()}
+
+# Usage example
+if __name__ == "__main__":
+    import asyncio
+    import sys
+
+    base = sys.argv[1] if len(sys.argv) > 1 else 'http://localhost:8001'
+    number = sys.argv[2] if len(sys.argv) > 2 else '1Z999AA10123456784'
+    print(asyncio.run(emit_test_tracking_event(base, 'ups', number)))
@@ -0,0 +1,99 @@
+"""
+Shipment Tracking API Routes
+FastAPI routes for carrier push notifications (webhooks) and stored delivery timelines
+"""
+
+from fastapi import APIRouter, HTTPException, Request, Header
+from pydantic import BaseModel, ValidationError
+from typing import List, Optional
+from datetime import datetime
+import json
+import logging
+from tracking_events import (
+    verify_signature, ingest_webhook_events, get_item_events, get_project_timeline, track_and_record
+)
+from delivery_rollup import get_project_rollup, rebuild_project_rollup
+
+router = APIRouter(prefix="/api/tracking", tags=["Shipment Tracking"])
+
+class TrackingWebhookEvent(BaseModel):
+    tracking_number: str
+    status: str
+    timestamp: Optional[datetime] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+    estimated_delivery: Optional[datetime] = None
+    event_id: Optional[str] = None
+
+class TrackingWebhookPayload(BaseModel):
+    events: List[TrackingWebhookEvent]
+
+class TrackingWebhookResponse(BaseModel):
+    success: bool
+    carrier: str
+    received: int
+    recorded: int
+    duplicates: int
+    items_updated: int
+
+@router.post("/webhooks/{carrier}", response_model=TrackingWebhookResponse)
+async def receive_tracking_webhook(carrier: str, request: Request,
+                                   idempotency_key: Optional[str] = Header(None)):
+    """Accept pushed tracking events from a carrier (single event or {"events": [...]})"""
+    body = await request.body()
+
+    if not verify_signature(carrier, body, dict(request.headers)):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    try:
+        data = json.loads(body)
+        if isinstance(data, dict) and 'events' not in data:
+            data = {'events': [data]}
+        payload = TrackingWebhookPayload(**data)
+    except (ValueError, TypeError, ValidationError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid tracking event payload: {str(e)}")
+
+    try:
+        result = await ingest_webhook_events(
+            carrier,
+            [event.dict() for event in payload.events],
+            delivery_key=idempotency_key
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logging.error(f"Tracking webhook error ({carrier}): {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Tracking webhook failed: {str(e)}")
+
+    return TrackingWebhookResponse(**result)
+
+@router.get("/items/{item_id}/events")
+async def get_item_tracking_events(item_id: str):
+    """Stored tracking history for an item"""
+    events = await get_item_events(item_id)
+    return {"item_id": item_id, "total_events": len(events), "events": events}
+
+@router.get("/projects/{project_id}/timeline")
+async def get_project_delivery_timeline(project_id: str):
+    """Project-wide delivery timeline built from stored tracking events"""
+    events = await get_project_timeline(project_id)
+    return {"project_id": project_id, "total_events": len(events), "events": events}
+
+@router.post("/{tracking_number}/refresh")
+async def refresh_tracking(tracking_number: str, carrier: Optional[str] = None):
+    """Poll the carrier once and append any status change to the event log"""
+    try:
+        return await track_and_record(tracking_number, carrier)
+    except Exception as e:
+        logging.error(f"Tracking refresh error ({tracking_number}): {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Tracking refresh failed: {str(e)}")
+
+@router.get("/projects/{project_id}/delivery-rollup")
+async def get_project_delivery_rollup(project_id: str):
+    """Latest ETA, counts by status and late items for a project and each of its rooms"""
+    return await get_project_rollup(project_id)
+
+@router.post("/projects/{project_id}/delivery-rollup/rebuild")
+async def rebuild_project_delivery_rollup(project_id: str):
+    """Recompute a project's delivery rollup from its items (backfill existing data)"""
+    return await rebuild_project_rollup(project_id)
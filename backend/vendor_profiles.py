@@ -0,0 +1,234 @@
+"""
+Vendor Extraction Profiles
+Declarative per-vendor extraction rules kept in vendor_profiles.json and
+compiled once at load. Every field is a fallback chain tried in order against
+one HTML snapshot of the product page:
+    "css:<selector>"          element text, or "css:<selector>@<attr>" for an attribute
+    "jsonld:<dotted.path>"    value from the page's schema.org Product JSON-LD
+    "meta:<name>"             content of <meta property|name="...">
+Vendor rules come first, then the shared defaults.
+"""
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+import soupsieve
+
+VENDOR_PROFILES_PATH = Path(__file__).parent / 'vendor_profiles.json'
+
+PRODUCT_FIELDS = ('name', 'price', 'image', 'description', 'sku', 'dimensions', 'materials', 'availability')
+FIELD_MAX_LENGTH = 500
+
+_PRICE_PATTERN = re.compile(r'\$[\d,]+\.?\d*')
+_NUMBER_PATTERN = re.compile(r'\d[\d,]*\.?\d*')
+# "css:<selector>@<attr>"
+_CSS_ATTRIBUTE = re.compile(r'^(.*)@([\w:-]+)$', re.DOTALL)
+
+# schema.org ItemAvailability values (and common page wording) -> stored availability
+AVAILABILITY_LABELS = (
+    ('discontinued', 'Discontinued'),
+    ('backorder', 'Backorder'),
+    ('preorder', 'Backorder'),
+    ('outofstock', 'Out of Stock'),
+    ('soldout', 'Out of Stock'),
+    ('instock', 'Available'),
+    ('limitedavailability', 'Available'),
+)
+
+
+class FieldRule:
+    """One compiled step of a field's fallback chain"""
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        self.kind, _, expression = spec.partition(':')
+        if self.kind == 'css':
+            # Only a trailing @attr names an attribute; '@' inside the selector (a[href^="mailto:x@y.com"]) stays
+            match = _CSS_ATTRIBUTE.match(expression)
+            selector, self.attr = match.groups() if match else (expression, '')
+            self.selector = soupsieve.compile(selector)
+        elif self.kind == 'jsonld':
+            self.path = expression.split('.')
+        elif self.kind == 'meta':
+            self.name = expression.lower()
+        else:
+            raise ValueError(f"Unknown extraction rule '{spec}'")
+
+    def apply(self, page: 'ProductPage') -> Optional[str]:
+        if self.kind == 'css':
+            element = self.selector.select_one(page.soup)
+            if element is None:
+                return None
+            return element.get(self.attr) if self.attr else element.get_text()
+        if self.kind == 'jsonld':
+            return _resolve_path(page.product_jsonld, self.path)
+        return page.meta.get(self.name)
+
+
+def _resolve_path(node: Any, path: List[str]) -> Optional[str]:
+    for key in path:
+        if isinstance(node, list):
+            node = node[0] if node else None
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    if isinstance(node, list):
+        node = node[0] if node else None
+    if isinstance(node, dict):
+        # e.g. ImageObject / Brand nodes
+        node = node.get('url') or node.get('name') or node.get('@id')
+    if node is None or isinstance(node, (dict, list)):
+        return None
+    return str(node)
+
+
+class ProductPage:
+    """One parsed HTML snapshot; JSON-LD and meta tags are read once, on first use"""
+
+    def __init__(self, html: str):
+        self.soup = BeautifulSoup(html, 'lxml')
+        self._jsonld = None
+        self._meta = None
+
+    @property
+    def product_jsonld(self) -> Dict[str, Any]:
+        if self._jsonld is None:
+            self._jsonld = {}
+            for script in self.soup.find_all('script', type='application/ld+json'):
+                try:
+                    data = json.loads(script.string or '', strict=False)
+                except ValueError:
+                    continue
+                product = _find_product(data)
+                if product:
+                    self._jsonld = product
+                    break
+        return self._jsonld
+
+    @property
+    def meta(self) -> Dict[str, str]:
+        if self._meta is None:
+            self._meta = {}
+            for tag in self.soup.find_all('meta'):
+                key = tag.get('property') or tag.get('name') or tag.get('itemprop')
+                if key and tag.get('content'):
+                    self._meta.setdefault(key.lower(), tag['content'])
+        return self._meta
+
+
+def _find_product(data: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(data, list):
+        for node in data:
+            product = _find_product(node)
+            if product:
+                return product
+        return None
+    if not isinstance(data, dict):
+        return None
+    types = data.get('@type')
+    if types == 'Product' or (isinstance(types, list) and 'Product' in types):
+        return data
+    return _find_product(data.get('@graph', []))
+
+
+def _clean_value(field: str, value: str, rule: FieldRule, url: str) -> Optional[str]:
+    value = value.strip()
+    if not value:
+        return None
+    if field == 'image':
+        # Make absolute URL
+        if value.startswith('//'):
+            return 'https:' + value
+        return urljoin(url, value)
+    if field == 'price':
+        match = _PRICE_PATTERN.search(value)
+        if match:
+            return match.group().replace(',', '')
+        # Structured data carries bare amounts ("1299.00"); page text must show a $ price
+        if rule.kind != 'css':
+            match = _NUMBER_PATTERN.search(value)
+            if match:
+                return '$' + match.group().replace(',', '')
+        return None
+    if field == 'availability':
+        # "https://schema.org/OutOfStock", "Out of stock", "in_stock"
+        key = re.sub(r'[^a-z]', '', value.lower().rsplit('/', 1)[-1])
+        for marker, label in AVAILABILITY_LABELS:
+            if marker in key:
+                return label
+        return None
+    return value[:FIELD_MAX_LENGTH]
+
+
+class VendorProfile:
+    """A vendor's crawl settings plus its compiled field chains"""
+
+    def __init__(self, vendor: str, spec: Dict[str, Any], defaults: Dict[str, List[str]]):
+        self.vendor = vendor
+        self.version = spec.get('version', 1)
+        self.base_url = spec['base_url']
+        self.search_paths = spec.get('search_paths', [])
+        self.product_url_pattern = spec.get('product_url_pattern')
+        self.sitemap_urls = spec.get('sitemap_urls')
+
+        vendor_fields = spec.get('fields', {})
+        self.fields: Dict[str, List[FieldRule]] = {
+            field: [FieldRule(rule) for rule in vendor_fields.get(field, []) + defaults.get(field, [])]
+            for field in PRODUCT_FIELDS
+        }
+
+    def extract(self, html: str, url: str) -> Tuple[Dict[str, Optional[str]], Dict[str, str]]:
+        """
+        Run every field chain over one HTML snapshot
+        Returns (field values, rule that produced each found field)
+        """
+        page = ProductPage(html)
+        values = {}
+        sources = {}
+        for field, rules in self.fields.items():
+            values[field] = None
+            for rule in rules:
+                raw = rule.apply(page)
+                value = _clean_value(field, raw, rule, url) if raw else None
+                if value:
+                    values[field] = value
+                    sources[field] = rule.spec
+                    break
+        return values, sources
+
+    def site_config(self) -> Dict[str, Any]:
+        """VENDOR_SITES-style settings (product_selectors lists each field's CSS rules)"""
+        config = {
+            'base_url': self.base_url,
+            'search_paths': self.search_paths,
+            'profile_version': self.version,
+            'product_selectors': {
+                field: ', '.join(rule.selector.pattern for rule in rules if rule.kind == 'css')
+                for field, rules in self.fields.items()
+            }
+        }
+        if self.product_url_pattern:
+            config['product_url_pattern'] = self.product_url_pattern
+        if self.sitemap_urls:
+            config['sitemap_urls'] = self.sitemap_urls
+        return config
+
+
+@lru_cache(maxsize=1)
+def load_vendor_profiles() -> Dict[str, VendorProfile]:
+    """Compile every vendor profile (once per process)"""
+    with open(VENDOR_PROFILES_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    defaults = data.get('defaults', {}).get('fields', {})
+    return {vendor: VendorProfile(vendor, spec, defaults) for vendor, spec in data['vendors'].items()}
+
+
+def get_vendor_profile(vendor: str) -> VendorProfile:
+    profiles = load_vendor_profiles()
+    if vendor not in profiles:
+        raise KeyError(f"No extraction profile for vendor '{vendor}'")
+    return profiles[vendor]
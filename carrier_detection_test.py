@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Carrier Detection Test
+Checks tracking-number classification in shipping_tracker: numbers whose check
+digit passes go to the carrier that issued them, and numbers that fail every
+check digit fall back to the carrier their format suggests (as before check
+digits were added) instead of the first checksummed entry with that length.
+
+Usage:
+    python carrier_detection_test.py
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from shipping_tracker import (
+    ShippingTracker, detect_carrier_normalized, _mod10_weighted, _ups_check_digit,
+    _fedex_express_check_digit, _s10_check_digit
+)
+
+RANDOM_SAMPLES = 10000
+
+def with_check_digit(body, validator):
+    """Append the check digit (0-9) that makes validator pass"""
+    for digit in '0123456789':
+        if validator(body + digit):
+            return body + digit
+    raise ValueError(f"No check digit for {body}")
+
+def with_wrong_check_digit(body, validator):
+    for digit in '0123456789':
+        if not validator(body + digit):
+            return body + digit
+    raise ValueError(f"Every check digit passes for {body}")
+
+def s10(serial, valid=True):
+    for digit in '0123456789':
+        number = f'EA{serial}{digit}US'
+        if _s10_check_digit(number) == valid:
+            return number
+    raise ValueError(serial)
+
+CASES = [
+    # (description, tracking number, expected carrier)
+    ('UPS 1Z, valid check digit', with_check_digit('1Z999AA1012345678', _ups_check_digit), 'ups'),
+    ('UPS 1Z, failed check digit', with_wrong_check_digit('1Z999AA1012345678', _ups_check_digit), 'ups'),
+    ('USPS IMpb 22 digits, valid', with_check_digit('940011189922385123456', _mod10_weighted), 'usps'),
+    ('22 digits, failed check digit', with_wrong_check_digit('940011189922385123456', _mod10_weighted), 'fedex'),
+    ('USPS S10, valid', s10('12345678'), 'usps'),
+    ('USPS S10, failed check digit', s10('12345678', valid=False), 'usps'),
+    ('FedEx Express 12 digits, valid', with_check_digit('12345678901', _fedex_express_check_digit), 'fedex'),
+    ('FedEx Express 12 digits, failed check digit', with_wrong_check_digit('12345678901', _fedex_express_check_digit), 'fedex'),
+    ('USPS 20 digits, valid', with_check_digit('7012345678901234567', _mod10_weighted), 'usps'),
+    ('20 digits, failed check digit', with_wrong_check_digit('7012345678901234567', _mod10_weighted), 'fedex'),
+    ('FedEx 14 digits', '12345678901234', 'fedex'),
+    ('DHL 10 digits', '1234567890', 'dhl'),
+    ('15 digits, failed check digit', with_wrong_check_digit('12345678901234', _mod10_weighted), None),
+    ('Unknown format', 'ABC123', None),
+]
+
+if __name__ == "__main__":
+    print("🧪 CARRIER DETECTION TEST")
+    failures = 0
+    for description, number, expected in CASES:
+        carrier = detect_carrier_normalized(number)
+        if carrier == expected:
+            print(f"   ✅ {description}: {number} -> {carrier}")
+        else:
+            failures += 1
+            print(f"   ❌ {description}: {number} -> {carrier}, expected {expected}")
+
+    # Random 20-digit numbers: those failing the USPS mod 10 check must not be called USPS
+    rng = random.Random(20)
+    numbers = [''.join(rng.choice('0123456789') for _ in range(20)) for _ in range(RANDOM_SAMPLES)]
+    failing = [number for number in numbers if not _mod10_weighted(number)]
+    wrong = [number for number in failing if detect_carrier_normalized(number) != 'fedex']
+    if wrong:
+        failures += 1
+        print(f"   ❌ {len(wrong)}/{len(failing)} random 20-digit numbers failing the check were not FedEx, e.g. {wrong[0]}")
+    else:
+        print(f"   ✅ {len(failing)} random 20-digit numbers failing the check -> fedex")
+
+    # Batch detection must agree with one-at-a-time detection (with separators and lower case)
+    raw = ['1z 999 aa1 01 2345 6784', '1234-5678-90'] + [number for _, number, _ in CASES]
+    tracker = ShippingTracker()
+    if tracker.detect_carriers(raw) != [tracker._detect_carrier(number) for number in raw]:
+        failures += 1
+        print("   ❌ detect_carriers disagrees with _detect_carrier")
+    else:
+        print(f"   ✅ detect_carriers matches _detect_carrier for {len(raw)} numbers")
+
+    print(f"\n📊 {'All checks passed' if not failures else f'{failures} failures'}")
+    sys.exit(1 if failures else 0)
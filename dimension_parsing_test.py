@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Dimension Parsing Test
+Checks parse_dimensions and the size filter against the dimension strings
+vendors actually publish: labels before or after the number, feet-and-inch
+rug sizes, L x W ordering, metric sizes and secondary measurements.
+
+Usage:
+    python dimension_parsing_test.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from furniture_dimensions import parse_dimensions, parse_size_filter
+
+# (text, expected fields); fields not listed must be absent
+DIMENSION_CASES = [
+    ('84"W x 38"D x 30"H', {'width_in': 84, 'depth_in': 38, 'height_in': 30}),
+    ('W 84" D 38" H 30"', {'width_in': 84, 'depth_in': 38, 'height_in': 30}),
+    ('Width: 84 in, Depth: 38 in, Height: 30 in', {'width_in': 84, 'depth_in': 38, 'height_in': 30}),
+    ('84 in. wide x 38 in. deep', {'width_in': 84, 'depth_in': 38}),
+    ('84 x 38 x 30', {'width_in': 84, 'depth_in': 38, 'height_in': 30}),
+    ('213 x 97 x 76 cm', {'width_in': 83.86, 'depth_in': 38.19, 'height_in': 29.92}),
+    ('Dia 24" x 30"H', {'diameter_in': 24, 'width_in': 24, 'depth_in': 24, 'height_in': 30}),
+    ('Ø36" x 30"H', {'diameter_in': 36, 'width_in': 36, 'depth_in': 36, 'height_in': 30}),
+    ("8' x 10'", {'width_in': 96, 'depth_in': 120}),
+    ('5\'3" x 7\'6"', {'width_in': 63, 'depth_in': 90}),
+    ('9\' 6" x 13\' 6"', {'width_in': 114, 'depth_in': 162}),
+    ('5 ft 3 in x 7 ft 6 in', {'width_in': 63, 'depth_in': 90}),
+    ('L 96 x W 42 x H 30', {'width_in': 96, 'depth_in': 42, 'height_in': 30}),
+    ('84" L x 38" W', {'width_in': 84, 'depth_in': 38}),
+    ('84"W x 38"D x 30"H; Seat Height: 18"', {'width_in': 84, 'depth_in': 38, 'height_in': 30}),
+    ('32 1/2"W x 18"D', {'width_in': 32.5, 'depth_in': 18}),
+    ('', {}),
+]
+
+# (filter expression, expected Mongo conditions)
+FILTER_CASES = [
+    ('width <= 84in, depth <= 38in', {'width_in': {'$lte': 84}, 'depth_in': {'$lte': 38}}),
+    ('width <= 5\'3"', {'width_in': {'$lte': 63}}),
+    ('h < 100 cm', {'height_in': {'$lt': 39.37}}),
+]
+
+def run_cases(title, cases, parse):
+    print(f"\n📐 {title}")
+    failures = 0
+    for text, expected in cases:
+        result = parse(text)
+        if result == expected:
+            print(f"   ✅ {text!r}")
+        else:
+            failures += 1
+            print(f"   ❌ {text!r}")
+            print(f"      expected {expected}")
+            print(f"      got      {result}")
+    return failures
+
+if __name__ == "__main__":
+    print("🧪 DIMENSION PARSING TEST")
+    failures = run_cases("parse_dimensions", DIMENSION_CASES, parse_dimensions)
+    failures += run_cases("parse_size_filter", FILTER_CASES, parse_size_filter)
+
+    total = len(DIMENSION_CASES) + len(FILTER_CASES)
+    print(f"\n📊 {total - failures}/{total} cases passed")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Product Field Extraction Latency Test
+Compares per-product extraction time on live vendor pages:
+  - per selector: query_selector + text_content/get_attribute for each field (~14 CDP round trips)
+  - evaluate:     one page.evaluate returning every field
+  - profile:      one page.content() snapshot parsed by the compiled vendor profile
+                  (FurnitureDatabase._scrape_single_product)
+Page load time is excluded; all strategies run against the same loaded page.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from statistics import mean, median
+from playwright.async_api import async_playwright
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from furniture_database import VENDOR_SITES
+from vendor_profiles import get_vendor_profile
+
+# Set Playwright browser path
+os.environ.setdefault('PLAYWRIGHT_BROWSERS_PATH', '/pw-browsers')
+
+TEST_PRODUCTS = [
+    ('Four Hands', 'https://fourhands.com/product/248067-003'),
+    ('Uttermost', 'https://uttermost.com/lighting'),
+    ('Visual Comfort', 'https://visualcomfort.com/lighting/chandeliers'),
+]
+
+RUNS_PER_PAGE = 10
+
+EXTRACT_FIELDS_SCRIPT = """
+(selectors) => {
+    const fields = {};
+    for (const [field, selector] of Object.entries(selectors)) {
+        const element = document.querySelector(selector);
+        if (!element) {
+            fields[field] = null;
+        } else if (field === 'image') {
+            fields[field] = element.getAttribute('src');
+        } else {
+            fields[field] = element.textContent;
+        }
+    }
+    return fields;
+}
+"""
+
+async def extract_per_selector(page, selectors):
+    """Previous strategy: one query_selector plus one read per field"""
+    fields = {}
+    for field, selector in selectors.items():
+        element = await page.query_selector(selector)
+        if not element:
+            fields[field] = None
+        elif field == 'image':
+            fields[field] = await element.get_attribute('src')
+        else:
+            fields[field] = await element.text_content()
+    return fields
+
+async def extract_single_evaluate(page, selectors):
+    """Every field in one round trip"""
+    return await page.evaluate(EXTRACT_FIELDS_SCRIPT, selectors)
+
+async def time_strategy(strategy, page, *args):
+    timings = []
+    result = None
+    for _ in range(RUNS_PER_PAGE):
+        started = time.perf_counter()
+        result = await strategy(page, *args)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, result
+
+async def extract_with_profile(page, vendor):
+    """Current strategy: one HTML snapshot, compiled CSS / JSON-LD / meta chains"""
+    html = await page.content()
+    fields, _ = get_vendor_profile(vendor).extract(html, page.url)
+    return fields
+
+async def test_extraction_latency():
+    print("🔍 Testing Product Field Extraction Latency")
+    print("=" * 60)
+
+    before_all, evaluate_all, after_all = [], [], []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+
+        for vendor, url in TEST_PRODUCTS:
+            selectors = VENDOR_SITES[vendor]['product_selectors']
+            print(f"\n--- {vendor}: {url} ---")
+            try:
+                await page.goto(url, wait_until='networkidle', timeout=30000)
+            except Exception as e:
+                print(f"❌ Failed to load page: {str(e)}")
+                continue
+
+            before, before_fields = await time_strategy(extract_per_selector, page, selectors)
+            evaluated, evaluate_fields = await time_strategy(extract_single_evaluate, page, selectors)
+            after, after_fields = await time_strategy(extract_with_profile, page, vendor)
+            before_all.extend(before)
+            evaluate_all.extend(evaluated)
+            after_all.extend(after)
+
+            same = before_fields == evaluate_fields
+            print(f"   Per-selector:    mean {mean(before):7.2f} ms  median {median(before):7.2f} ms")
+            print(f"   Single evaluate: mean {mean(evaluated):7.2f} ms  median {median(evaluated):7.2f} ms")
+            print(f"   Profile:         mean {mean(after):7.2f} ms  median {median(after):7.2f} ms")
+            print(f"   {'✅' if same else '❌'} Per-selector and evaluate fields {'match' if same else 'differ'}")
+            print(f"   Profile found: {sorted(field for field, value in after_fields.items() if value)}")
+
+        await browser.close()
+
+    if before_all and after_all:
+        print("\n" + "=" * 60)
+        print(f"Overall per-product extraction: per-selector {mean(before_all):.2f} ms, "
+              f"evaluate {mean(evaluate_all):.2f} ms, profile {mean(after_all):.2f} ms")
+
+if __name__ == "__main__":
+    asyncio.run(test_extraction_latency())
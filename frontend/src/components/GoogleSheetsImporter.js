@@ -190,7 +190,9 @@ const GoogleSheetsImporter = () => {
                                         className="flex items-center bg-green-600 hover:bg-green-700"
                                     >
                                         <Download className="mr-2 h-4 w-4" />
-                                        Import {previewData.total_rows} Projects
+                                        {previewData.total_rows != null
+                                            ? `Import ${previewData.total_rows} Projects`
+                                            : 'Import All Projects'}
                                     </Button>
                                 )}
 
@@ -228,8 +230,8 @@ const GoogleSheetsImporter = () => {
                             <CardContent className="space-y-4">
                                 <div className="grid grid-cols-3 gap-4 p-4 bg-gray-50 rounded-lg">
                                     <div className="text-center">
-                                        <div className="text-2xl font-bold text-blue-600">{previewData.total_rows}</div>
-                                        <div className="text-sm text-gray-600">Projects Found</div>
+                                        <div className="text-2xl font-bold text-blue-600">{previewData.total_rows ?? 'All'}</div>
+                                        <div className="text-sm text-gray-600">{previewData.total_rows != null ? 'Projects Found' : 'Rows To Import'}</div>
                                     </div>
                                     <div className="text-center">
                                         <div className="text-2xl font-bold text-green-600">{previewData.sample_projects.length}</div>
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Price Alert Linking Test
+Checks that project items pasted with raw vendor URLs (www., trailing slash,
+utm_/tracking parameters) are linked to the canonical catalog product, so
+price-change alerts fire for them. Items are held in memory; no database needed.
+
+Usage:
+    python price_alert_link_test.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+from bson import ObjectId
+from furniture_prices import canonical_item_url, backfill_item_canonical_urls, _linked_items
+
+PRODUCT_URL = 'https://fourhands.com/product/248067-003'
+
+URL_CASES = [
+    ('https://www.fourhands.com/product/248067-003/?utm_source=newsletter&utm_medium=email', PRODUCT_URL),
+    ('http://WWW.FourHands.com/product/248067-003#details', PRODUCT_URL),
+    ('www.fourhands.com/product/248067-003?gclid=abc', PRODUCT_URL),
+    ('https://fourhands.com/product/248067-003?color=natural&utm_campaign=x', PRODUCT_URL + '?color=natural'),
+    ('https://www.wayfair.com/furniture/pdp/248067-003', None),
+    ('', None),
+]
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length=None):
+        return self.documents
+
+class FakeItems:
+    """Just enough of a Motor collection for the backfill and the $or/$in lookup"""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    @staticmethod
+    def _matches(document, query):
+        for key, condition in query.items():
+            if key == '$or':
+                if not any(FakeItems._matches(document, option) for option in condition):
+                    return False
+            elif '$in' in condition and document.get(key) not in condition['$in']:
+                return False
+            elif '$nin' in condition and document.get(key) in condition['$nin']:
+                return False
+            elif '$exists' in condition and (key in document) != condition['$exists']:
+                return False
+        return True
+
+    def find(self, query, projection=None):
+        return FakeCursor([document for document in self.documents if self._matches(document, query)])
+
+    async def bulk_write(self, operations, ordered=True):
+        by_id = {document['_id']: document for document in self.documents}
+        for operation in operations:
+            by_id[operation._filter['_id']].update(operation._doc['$set'])
+
+class FakeDatabase:
+    def __init__(self, items):
+        self.items = FakeItems(items)
+
+async def linked_item_names():
+    product = {'_id': ObjectId(), 'url': PRODUCT_URL, 'vendor': 'Four Hands', 'sku': '248067-003'}
+    db = FakeDatabase([
+        # Written before canonical_url existed; picked up by the backfill
+        {'_id': ObjectId(), 'name': 'Sofa (pasted link)', 'project_id': 'p1',
+         'url': 'https://www.fourhands.com/product/248067-003/?utm_source=newsletter'},
+        {'_id': ObjectId(), 'name': 'Sofa (SKU only)', 'project_id': 'p2', 'vendor': 'Four Hands', 'sku': '248067-003'},
+        {'_id': ObjectId(), 'name': 'Other sofa', 'project_id': 'p3',
+         'url': 'https://www.fourhands.com/product/100000-001/'},
+    ])
+    backfilled = await backfill_item_canonical_urls(db)
+    linked = await _linked_items(db, [product])
+    return backfilled, sorted(item['name'] for item in linked.get(product['_id'], []))
+
+if __name__ == "__main__":
+    print("🧪 PRICE ALERT LINKING TEST")
+    failures = 0
+    for url, expected in URL_CASES:
+        canonical = canonical_item_url(url)
+        if canonical == expected:
+            print(f"   ✅ {url!r} -> {canonical}")
+        else:
+            failures += 1
+            print(f"   ❌ {url!r} -> {canonical}, expected {expected}")
+
+    backfilled, names = asyncio.run(linked_item_names())
+    expected_names = ['Sofa (SKU only)', 'Sofa (pasted link)']
+    if names == expected_names:
+        print(f"   ✅ Backfilled {backfilled} items; linked items: {', '.join(names)}")
+    else:
+        failures += 1
+        print(f"   ❌ Linked items {names}, expected {expected_names}")
+
+    print(f"\n📊 {'All checks passed' if not failures else f'{failures} failures'}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Sheet Streaming Hash Test
+Checks that a questionnaire sheet streamed block by block (iter_sheet_frames,
+used by /execute-stream and import jobs) produces the same row content hashes
+as a full download (used by /execute), so neither sync path treats the other's
+rows as edited. The sheet is served from memory; no network access is needed.
+
+Usage:
+    python sheet_stream_hash_test.py
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+import google_sheets_importer
+from google_sheets_importer import GoogleSheetsImporter, read_sheet_csv
+
+# Small blocks so the sheet is split across several frames
+BLOCK_SIZE = 200
+CHUNK_SIZE = 64
+
+def build_sheet():
+    """Phone is numeric for the first rows and blank for the rest, so per-block inference differs"""
+    lines = ['Timestamp,Full Name,Email Address,Phone Number,ROOMS INVOLVED IN PROJECT']
+    for row in range(12):
+        phone = f'555123{row:04d}' if row < 6 else ''
+        lines.append(f'2024-01-{row + 1:02d} 10:00:00,Client {row},client{row}@example.com,{phone},"Kitchen, Living Room"')
+    return '\n'.join(lines) + '\n'
+
+class FakeContent:
+    def __init__(self, data):
+        self.data = data
+
+    async def iter_chunked(self, size):
+        # Network-sized chunks, smaller than a block, regardless of the requested size
+        for start in range(0, len(self.data), CHUNK_SIZE):
+            yield self.data[start:start + CHUNK_SIZE]
+
+class FakeResponse:
+    status = 200
+
+    def __init__(self, data):
+        self.content = FakeContent(data)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class FakeSession:
+    """Stands in for aiohttp.ClientSession, serving the sheet in 64-byte chunks"""
+    data = b''
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, url):
+        return FakeResponse(self.data)
+
+def content_hashes(importer, frames):
+    hashes = {}
+    for df in frames:
+        converted = importer.process_sheet_dataframe(df, start_row=0)
+        assert converted['success'], converted['message']
+        for project in converted['projects_data']:
+            hashes[project['import_row']] = (project['import_content_hash'], project['client_info'].get('phone'))
+    return hashes
+
+async def streamed_frames(importer, csv_text):
+    FakeSession.data = csv_text.encode()
+    original = google_sheets_importer.aiohttp.ClientSession
+    google_sheets_importer.aiohttp.ClientSession = FakeSession
+    try:
+        return [df async for df in importer.iter_sheet_frames('sheet', '0', BLOCK_SIZE)]
+    finally:
+        google_sheets_importer.aiohttp.ClientSession = original
+
+if __name__ == "__main__":
+    print("🧪 SHEET STREAMING HASH TEST")
+    importer = GoogleSheetsImporter()
+    csv_text = build_sheet()
+
+    frames = asyncio.run(streamed_frames(importer, csv_text))
+    print(f"   Streamed {sum(len(df) for df in frames)} rows in {len(frames)} blocks")
+    streamed = content_hashes(importer, frames)
+    full = content_hashes(importer, [read_sheet_csv(google_sheets_importer.io.StringIO(csv_text))])
+
+    failures = 0
+    if len(frames) < 2:
+        failures += 1
+        print("   ❌ Sheet was not split into several blocks")
+    if sorted(streamed) != sorted(full):
+        failures += 1
+        print(f"   ❌ Row numbers differ: streamed {sorted(streamed)}, full {sorted(full)}")
+    for row in sorted(set(streamed) & set(full)):
+        if streamed[row] == full[row]:
+            print(f"   ✅ Row {row}: phone {full[row][1]!r}, hash {full[row][0][:8]}")
+        else:
+            failures += 1
+            print(f"   ❌ Row {row}: streamed {streamed[row]} != full {full[row]}")
+
+    print(f"\n📊 {'All hashes match' if not failures else f'{failures} mismatches'}")
+    sys.exit(1 if failures else 0)
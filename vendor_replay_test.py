@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Vendor Profile Replay Test
+Runs the compiled vendor extraction profiles over recorded product pages in
+backend/fixtures/vendor_pages/ and reports per-vendor field accuracy and
+throughput, without touching live sites.
+
+Each fixture is <name>.html (the page snapshot) plus <name>.json:
+    {"vendor": ..., "url": ..., "recorded_at": ..., "profile_version": ...,
+     "expected": {"name": ..., "price": ..., ...}}
+Hand-built pages carry "synthetic": true instead of recorded_at; they check the
+rule chains but not that selectors still match a vendor's live markup.
+
+Usage:
+    python vendor_replay_test.py                      # replay every fixture
+    python vendor_replay_test.py --vendor "Four Hands"
+    python vendor_replay_test.py --strict             # also fail if a vendor has no recorded page
+    python vendor_replay_test.py --record "Four Hands" https://fourhands.com/product/248067-003
+Recorded expectations are the current extraction output; review them before committing.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+from vendor_profiles import get_vendor_profile, load_vendor_profiles, PRODUCT_FIELDS
+
+FIXTURES_DIR = os.path.join(BACKEND_DIR, 'fixtures', 'vendor_pages')
+THROUGHPUT_REPEATS = 20
+
+def vendor_slug(vendor):
+    return re.sub(r'[^a-z0-9]+', '-', vendor.lower()).strip('-')
+
+def load_fixtures(vendor=None):
+    fixtures = []
+    if not os.path.isdir(FIXTURES_DIR):
+        return fixtures
+    for root, _, files in os.walk(FIXTURES_DIR):
+        for filename in sorted(files):
+            if not filename.endswith('.json'):
+                continue
+            with open(os.path.join(root, filename), encoding='utf-8') as f:
+                meta = json.load(f)
+            if vendor and meta['vendor'] != vendor:
+                continue
+            with open(os.path.join(root, filename[:-5] + '.html'), encoding='utf-8') as f:
+                meta['html'] = f.read()
+            meta['fixture'] = os.path.relpath(os.path.join(root, filename[:-5]), FIXTURES_DIR)
+            fixtures.append(meta)
+    return fixtures
+
+def css_rule_count(profile):
+    return sum(1 for rules in profile.fields.values() for rule in rules if rule.kind == 'css')
+
+def replay(vendor=None, strict=False):
+    print("🔁 Replaying Vendor Extraction Profiles")
+    print("=" * 60)
+
+    fixtures = load_fixtures(vendor)
+    if not fixtures:
+        print(f"❌ No fixtures found in {FIXTURES_DIR}")
+        return False
+
+    stats = defaultdict(lambda: {'pages': 0, 'recorded': 0, 'fields': 0, 'correct': 0, 'seconds': 0.0,
+                                 'css_rules': set()})
+    all_passed = True
+
+    for fixture in fixtures:
+        profile = get_vendor_profile(fixture['vendor'])
+        values, sources = profile.extract(fixture['html'], fixture['url'])
+
+        started = time.perf_counter()
+        for _ in range(THROUGHPUT_REPEATS):
+            profile.extract(fixture['html'], fixture['url'])
+        elapsed = (time.perf_counter() - started) / THROUGHPUT_REPEATS
+
+        vendor_stats = stats[fixture['vendor']]
+        vendor_stats['pages'] += 1
+        vendor_stats['recorded'] += 0 if fixture.get('synthetic') else 1
+        vendor_stats['seconds'] += elapsed
+        vendor_stats['css_rules'].update(source for source in sources.values() if source.startswith('css:'))
+
+        kind = 'synthetic' if fixture.get('synthetic') else 'recorded'
+        print(f"\n--- {fixture['fixture']} ({fixture['vendor']}, profile v{profile.version}, {kind}) ---")
+        for field, expected in fixture['expected'].items():
+            actual = values.get(field)
+            vendor_stats['fields'] += 1
+            if actual == expected:
+                vendor_stats['correct'] += 1
+                print(f"   ✅ {field}: via {sources.get(field, '-')}")
+            else:
+                all_passed = False
+                print(f"   ❌ {field}: expected {expected!r}, got {actual!r}")
+
+    print("\n" + "=" * 60)
+    for vendor_name, vendor_stats in sorted(stats.items()):
+        accuracy = vendor_stats['correct'] / max(vendor_stats['fields'], 1)
+        pages_per_second = vendor_stats['pages'] / max(vendor_stats['seconds'], 1e-9)
+        css_total = css_rule_count(get_vendor_profile(vendor_name))
+        print(f"{vendor_name}: {vendor_stats['pages']} pages ({vendor_stats['recorded']} recorded), "
+              f"field accuracy {accuracy:.1%}, {len(vendor_stats['css_rules'])}/{css_total} CSS rules matched, "
+              f"{pages_per_second:.0f} pages/s")
+
+    # Coverage: every configured vendor should have a recorded page so its CSS rules meet real markup
+    vendors = [vendor] if vendor else sorted(load_vendor_profiles())
+    unrecorded = [name for name in vendors if not stats[name]['recorded']]
+    if unrecorded:
+        print(f"\n⚠️ No recorded page for: {', '.join(unrecorded)}")
+        print('   Record one with: python vendor_replay_test.py --record "<vendor>" <product url>')
+        if strict:
+            all_passed = False
+
+    return all_passed
+
+async def record(vendor, url):
+    """Save a live page snapshot and its current extraction as a new fixture"""
+    from playwright.async_api import async_playwright
+
+    profile = get_vendor_profile(vendor)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        await page.goto(url, wait_until='networkidle', timeout=30000)
+        html = await page.content()
+        await browser.close()
+
+    values, _ = profile.extract(html, url)
+    name = re.sub(r'[^a-z0-9]+', '-', url.split('://', 1)[-1].lower()).strip('-')[:80]
+    directory = os.path.join(FIXTURES_DIR, vendor_slug(vendor))
+    os.makedirs(directory, exist_ok=True)
+
+    with open(os.path.join(directory, name + '.html'), 'w', encoding='utf-8') as f:
+        f.write(html)
+    with open(os.path.join(directory, name + '.json'), 'w', encoding='utf-8') as f:
+        json.dump({
+            'vendor': vendor,
+            'url': url,
+            'recorded_at': datetime.now(timezone.utc).isoformat(),
+            'profile_version': profile.version,
+            'expected': {field: values[field] for field in PRODUCT_FIELDS if values[field]}
+        }, f, indent=2)
+        f.write('\n')
+
+    print(f"✅ Recorded {vendor} fixture {name} ({len(html)} bytes)")
+    print(f"   Review the expected values in {os.path.join(directory, name + '.json')}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vendor', help='Only replay fixtures for this vendor')
+    parser.add_argument('--strict', action='store_true', help='Fail when a configured vendor has no recorded page')
+    parser.add_argument('--record', nargs=2, metavar=('VENDOR', 'URL'), help='Record a new fixture from a live page')
+    args = parser.parse_args()
+
+    if args.record:
+        if args.record[0] not in load_vendor_profiles():
+            sys.exit(f"Unknown vendor '{args.record[0]}'")
+        asyncio.run(record(*args.record))
+    else:
+        sys.exit(0 if replay(args.vendor, args.strict) else 1)